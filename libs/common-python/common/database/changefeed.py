@@ -0,0 +1,116 @@
+"""
+Changefeed over the transactional outbox.
+
+Every write use case already stores an outbox row, carrying the entity id in
+`payload.payload.id`, in the same transaction as the entity change, and each
+outbox row records the id of that transaction (`txid`, Postgres `xid8`). A
+consumer that missed events, or starts empty, pages through
+`GET /api/v1/{resource}/changes?since=<cursor>` instead of re-reading every
+entity.
+
+Rows are read in `(txid, id)` order, and only those written by transactions
+older than the oldest one still running (`pg_snapshot_xmin`). A transaction
+that has not committed yet always has a txid at or above that horizon, so it
+can never land behind a cursor that was already handed out (ordering by
+`created_at` could: commit order differs from insert order).
+
+A page is compacted to one change per entity, in the order of its latest
+outbox row. The service resolves ids against the current table: entities that
+still exist become upserts carrying their current state, the others
+tombstones. Applying a page therefore converges to the state as of that page,
+whatever the consumer had before.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import BigInteger, Text, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..exceptions import ValidationError
+
+
+def encode_change_cursor(txid: int, row_id: uuid.UUID) -> str:
+    raw = json.dumps([txid, str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_change_cursor(cursor: str) -> Tuple[int, uuid.UUID]:
+    """
+    Raises:
+        ValidationError: If the cursor was not produced by `encode_change_cursor`.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        txid, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(txid, int):
+            raise TypeError("txid must be an integer")
+        return txid, uuid.UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValidationError("Invalid changefeed cursor", details={"since": cursor}) from e
+
+
+@dataclass
+class ChangeBatch:
+    # Distinct entity ids, in the order of their latest change within the page
+    entity_ids: List[uuid.UUID] = field(default_factory=list)
+    # Resume point for the next call; None only while the feed is still empty
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+
+    def resolve(self, entities: Iterable[Any]) -> Dict[str, Any]:
+        """
+        `ChangesResponse` content: upserts for the `entities` still present
+        (anything with an `id`), tombstones for the other ids.
+        """
+        by_id = {entity.id: entity for entity in entities}
+        changes = [
+            {"op": "upsert", "id": entity_id, "data": by_id[entity_id]}
+            if entity_id in by_id
+            else {"op": "delete", "id": entity_id}
+            for entity_id in self.entity_ids
+        ]
+        return {"changes": changes, "next_cursor": self.next_cursor, "has_more": self.has_more}
+
+
+async def read_changes(
+    session: AsyncSession, outbox_model: Any, since: Optional[str] = None, limit: int = 1000
+) -> ChangeBatch:
+    """
+    Next `limit` outbox rows after `since` that no running transaction can still
+    precede, reduced to the ids of the changed entities.
+    """
+    # Oldest transaction still in progress; everything below it has finished
+    horizon = select(
+        func.pg_snapshot_xmin(func.pg_current_snapshot()).cast(Text).cast(BigInteger)
+    ).scalar_subquery()
+    entity_id = outbox_model.payload["payload"]["id"].as_string()
+
+    stmt = select(outbox_model.txid, outbox_model.id, entity_id).where(outbox_model.txid < horizon)
+    if since:
+        txid, row_id = decode_change_cursor(since)
+        stmt = stmt.where(tuple_(outbox_model.txid, outbox_model.id) > tuple_(txid, row_id))
+    stmt = stmt.order_by(outbox_model.txid.asc(), outbox_model.id.asc()).limit(limit + 1)
+
+    rows = (await session.execute(stmt)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if not rows:
+        return ChangeBatch(next_cursor=since)
+
+    latest: Dict[uuid.UUID, int] = {}
+    for position, (_, _, raw_id) in enumerate(rows):
+        try:
+            latest[uuid.UUID(raw_id)] = position
+        except (TypeError, ValueError):
+            continue  # Event without an entity id
+    last_txid, last_id, _ = rows[-1]
+    return ChangeBatch(
+        entity_ids=sorted(latest, key=latest.__getitem__),
+        next_cursor=encode_change_cursor(last_txid, last_id),
+        has_more=has_more,
+    )
@@ -0,0 +1,115 @@
+"""
+Shared engine factory: pool sizing, PgBouncer compatibility and pool metrics.
+
+Every engine built here uses a metered QueuePool that reports to the
+process-wide `common.metrics` registry:
+
+- `db_pool_checkout_wait_seconds{pool}`: time spent waiting for a connection
+- `db_pool_checkout_timeouts_total{pool}`: checkouts that hit `pool_timeout`
+- `db_pool_checked_out{pool}` / `db_pool_saturation{pool}`: connections in use,
+  absolute and as a fraction of `pool_size + max_overflow`
+
+Behind PgBouncer in transaction pooling mode a server connection only belongs
+to the client for one transaction, so named server-side prepared statements
+and LISTEN cannot be used through it. `pgbouncer=True` turns statement caching
+off for asyncpg; LISTEN goes over its own direct connection (`listen_dsn`).
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from ..metrics import metrics
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    pgbouncer: bool = False
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "PoolConfig":
+        """Read the `DB_POOL_*` / `DB_PGBOUNCER_TRANSACTION_POOLING` settings."""
+        return cls(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            pgbouncer=settings.DB_PGBOUNCER_TRANSACTION_POOLING,
+        )
+
+    def engine_kwargs(self, label: str, poolclass: type = QueuePool) -> dict:
+        return {
+            "poolclass": metered_pool_class(poolclass, label),
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "pool_pre_ping": self.pool_pre_ping,
+        }
+
+
+class _MeteredPool:
+    """Mixin for QueuePool subclasses; `metrics_label` names the pool in metrics."""
+
+    metrics_label = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            metrics.increment("db_pool_checkout_timeouts_total", pool=self.metrics_label)
+            raise
+        finally:
+            metrics.observe("db_pool_checkout_wait_seconds", time.perf_counter() - start, pool=self.metrics_label)
+        self._report_usage()
+        return connection
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        self._report_usage()
+
+    def _report_usage(self) -> None:
+        checked_out = self.checkedout()
+        metrics.set_gauge("db_pool_checked_out", checked_out, pool=self.metrics_label)
+        if self._max_overflow >= 0:
+            capacity = self.size() + self._max_overflow
+            metrics.set_gauge("db_pool_saturation", checked_out / capacity, pool=self.metrics_label)
+
+
+def metered_pool_class(base: type, label: str) -> type:
+    """A `base` pool subclass reporting under `label` (kept when the pool is recreated)."""
+    return type(f"Metered{base.__name__}", (_MeteredPool, base), {"metrics_label": label})
+
+
+def create_db_engine(database_url: str, pool: Optional[PoolConfig] = None, label: str = "sync", **kwargs: Any) -> Engine:
+    """
+    Sync (psycopg2) engine for background work. psycopg2 does not prepare
+    statements server-side, so it needs no changes behind PgBouncer.
+    """
+    pool = pool or PoolConfig()
+    return create_engine(database_url, **{**pool.engine_kwargs(label), **kwargs})
+
+
+def async_engine_kwargs(pool: PoolConfig, label: str = "async") -> dict:
+    """Pool arguments for `create_async_engine`."""
+    return pool.engine_kwargs(label, poolclass=AsyncAdaptedQueuePool)
+
+
+def listen_dsn(database_url: str, listen_url: Optional[str] = None) -> str:
+    """
+    asyncpg DSN for the dedicated LISTEN connection. `listen_url` should point
+    straight at Postgres when `database_url` goes through PgBouncer.
+    """
+    url = make_url(listen_url or database_url)
+    return url.set(drivername="postgres").render_as_string(hide_password=False)
@@ -6,9 +6,9 @@ from enum import Enum
 from typing import Any
 
 import asyncpg
-from sqlalchemy import JSON, Column, DateTime, String
+from sqlalchemy import JSON, BigInteger, Column, DateTime, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import declarative_base, declared_attr
 
 from ..messaging import RabbitMQPublisher
 from ..schemas import Event
@@ -30,6 +30,12 @@ class OutboxMixin:
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     processed_at = Column(DateTime, nullable=True)
     error_message = Column(String, nullable=True)
+    # Writing transaction (xid8 as bigint); orders the changefeed, see .changefeed
+    txid = Column(BigInteger, nullable=False, server_default=text("(pg_current_xact_id()::text)::bigint"))
+
+    @declared_attr.directive
+    def __table_args__(cls):
+        return (Index(f"ix_{cls.__tablename__}_txid_id", "txid", "id"),)
 
 class OutboxListener:
     """
@@ -51,6 +57,9 @@ class OutboxListener:
     async def run(self):
         """Main loop for the listener."""
         while not self.stop_event.is_set():
+            # LISTEN needs a session-level connection of its own, outside the
+            # pools; behind PgBouncer `dsn` must reach Postgres directly
+            conn = None
             try:
                 conn = await asyncpg.connect(self.dsn)
                 await conn.add_listener('outbox_events', self._handle_notification)
@@ -68,7 +77,7 @@ class OutboxListener:
                 logger.error(f"Outbox listener error: {str(e)}. Retrying in 5s...")
                 await asyncio.sleep(5)
             finally:
-                if 'conn' in locals():
+                if conn is not None:
                     await conn.close()
 
     def _handle_notification(self, connection, pid, channel, payload):
@@ -0,0 +1,106 @@
+"""
+Keyset (cursor) pagination over `(created_at, id)`.
+
+Rows are always ordered by `created_at, id`. Pages after the first start strictly
+after the last row of the previous page (`WHERE (created_at, id) > (:ts, :id)`)
+instead of skipping rows, so a deep page costs the same as the first one as long
+as the table has an index on `(created_at, id)` (or `(<filter>, created_at, id)`
+for filtered listings).
+
+The cursor handed to clients is opaque: URL-safe base64 of the last row's key.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+
+from ..exceptions import ValidationError
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Raises:
+        ValidationError: If the cursor was not produced by `encode_cursor`.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValidationError("Invalid pagination cursor", details={"after": cursor}) from e
+
+
+def _keyset(query: Any, model: Any, limit: int, after: Optional[str], skip: int) -> Any:
+    # Works on both a legacy Query and a 2.0 Select
+    if after:
+        created_at, row_id = decode_cursor(after)
+        query = query.filter(tuple_(model.created_at, model.id) > tuple_(created_at, row_id))
+
+    query = query.order_by(model.created_at.asc(), model.id.asc())
+    if skip and not after:
+        query = query.offset(skip)
+    # One extra row tells whether a next page exists
+    return query.limit(limit + 1)
+
+
+def _page(rows: List[Any], limit: int) -> Page:
+    if len(rows) <= limit:
+        return Page(items=rows)
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return Page(items=rows, next_cursor=encode_cursor(last.created_at, last.id))
+
+
+def keyset_paginate(query: Query, model: Any, limit: int, after: Optional[str] = None, skip: int = 0) -> Page:
+    """
+    Apply keyset pagination to `query` over `model.created_at, model.id`.
+
+    `skip` is only honoured without a cursor, for clients still paging by
+    offset; they get a cursor back too and can switch to `after` from there.
+    `next_cursor` is None on the last page.
+    """
+    return _page(_keyset(query, model, limit, after, skip).all(), limit)
+
+
+async def keyset_paginate_async(
+    session: AsyncSession, stmt: Select, model: Any, limit: int, after: Optional[str] = None, skip: int = 0
+) -> Page:
+    """
+    `keyset_paginate` for a statement run on an `AsyncSession`.
+
+    `select(model)` pages model instances; a `select()` of some of the model's
+    columns (including `created_at` and `id`) pages `Row`s.
+    """
+    result = await session.execute(_keyset(stmt, model, limit, after, skip))
+    if _selects_entity(stmt, model):
+        result = result.scalars()
+    return _page(list(result.all()), limit)
+
+
+def _selects_entity(stmt: Select, model: Any) -> bool:
+    descriptions = stmt.column_descriptions
+    return len(descriptions) == 1 and descriptions[0]["expr"] is model
@@ -0,0 +1,142 @@
+"""
+Read replica routing for request sessions.
+
+Read-only endpoints take their session from `ReplicaRouter.read_session`,
+which hands out replica sessions round-robin over `DATABASE_REPLICA_URLS`.
+Writes, outbox drains and saga steps stay on the primary.
+
+Replicas apply the primary's WAL asynchronously, so a client reading right
+after its own write may not see it there. To keep read-your-writes, a write
+session tracked with `track_commits` sets a cookie holding the primary's WAL
+position (LSN) after the commit. A read carrying that cookie first asks the
+chosen replica how far it has replayed and goes to the primary instead while
+the replica is behind. Reads without the cookie go straight to a replica. Either
+way, a replica that cannot be reached sends the read to the primary.
+
+Routing decisions are counted in `db_read_routing_total{target, reason}`.
+"""
+
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Mapping, Optional, Sequence
+
+from fastapi import Response
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..metrics import metrics
+from .engine import PoolConfig
+from .session import create_async_session_factory
+from .unit_of_work import add_commit_hook
+
+logger = logging.getLogger(__name__)
+
+# Seconds the commit LSN cookie outlives the write; replicas normally catch up in far less
+LSN_COOKIE_MAX_AGE = 60
+
+
+def parse_lsn(value: Optional[str]) -> Optional[int]:
+    """`"16/B374D848"` -> 0x16B374D848; None for a missing or malformed value."""
+    if not value:
+        return None
+    high, sep, low = value.partition("/")
+    if not sep:
+        return None
+    try:
+        return (int(high, 16) << 32) | int(low, 16)
+    except ValueError:
+        return None
+
+
+def format_lsn(lsn: int) -> str:
+    """Inverse of `parse_lsn`, in Postgres' `pg_lsn` text form."""
+    return f"{lsn >> 32:X}/{lsn & 0xFFFFFFFF:X}"
+
+
+async def _current_lsn(session: AsyncSession) -> Optional[int]:
+    result = await session.execute(text("SELECT pg_current_wal_lsn()::text"))
+    return parse_lsn(result.scalar())
+
+
+async def _replayed_lsn(session: AsyncSession) -> Optional[int]:
+    # NULL when the node is not a standby
+    result = await session.execute(text("SELECT pg_last_wal_replay_lsn()::text"))
+    return parse_lsn(result.scalar())
+
+
+class ReplicaRouter:
+    """
+    Session routing between the primary and its read replicas.
+
+    The primary factory is passed per call, so tests can swap the module-level
+    `AsyncSessionLocal` without rebuilding the router.
+    """
+
+    def __init__(self, replicas: Sequence[async_sessionmaker] = (), cookie_name: str = "commit-lsn"):
+        self.replicas = list(replicas)
+        self.cookie_name = cookie_name
+        self._next = itertools.cycle(self.replicas)
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "ReplicaRouter":
+        """One pool per `DATABASE_REPLICA_URLS` entry, sized like the primary's."""
+        pool = PoolConfig.from_settings(settings)
+        replicas = [
+            create_async_session_factory(url, settings.DB_PREPARED_STATEMENT_CACHE_SIZE, pool=pool, label=f"replica{i}")
+            for i, url in enumerate(settings.DATABASE_REPLICA_URLS)
+        ]
+        return cls(replicas, cookie_name=f"{settings.SERVICE_NAME}-commit-lsn")
+
+    def track_commits(self, session: AsyncSession, response: Response) -> None:
+        """
+        Set the commit LSN cookie on `response` after each `UnitOfWork` commit.
+        A no-op without replicas, where reads always see the latest commit.
+        """
+        if not self.replicas:
+            return
+
+        async def _set_cookie(committed: AsyncSession) -> None:
+            lsn = await _current_lsn(committed)
+            if lsn is not None:
+                response.set_cookie(self.cookie_name, format_lsn(lsn), max_age=LSN_COOKIE_MAX_AGE, httponly=True)
+
+        add_commit_hook(session, _set_cookie)
+
+    @asynccontextmanager
+    async def read_session(
+        self, primary: async_sessionmaker, cookies: Mapping[str, str]
+    ) -> AsyncIterator[AsyncSession]:
+        """A replica session, or a primary one when the replica may miss the client's writes."""
+        target, reason = await self._route(cookies)
+        metrics.increment("db_read_routing_total", target="primary" if target is None else "replica", reason=reason)
+        if target is not None:
+            try:
+                yield target
+            finally:
+                await target.close()
+            return
+        async with primary() as session:
+            yield session
+
+    async def _route(self, cookies: Mapping[str, str]):
+        if not self.replicas:
+            return None, "no_replicas"
+        session = next(self._next)()
+        min_lsn = parse_lsn(cookies.get(self.cookie_name))
+        try:
+            if min_lsn is None:
+                # Check out (and pre-ping) the connection now, so a dead replica
+                # falls back here instead of failing the request later
+                await session.connection()
+                return session, "no_cookie"
+            replayed = await _replayed_lsn(session)
+        except Exception as e:
+            logger.warning(f"Replica unavailable, reading from primary: {e}")
+            await session.close()
+            return None, "unavailable"
+        if replayed is None or replayed < min_lsn:
+            await session.close()
+            return None, "stale"
+        return session, "caught_up"
+
@@ -0,0 +1,106 @@
+"""
+Async SQLAlchemy sessions on the asyncpg driver.
+
+Services keep their `DATABASE_URL` in the usual `postgresql://` form; the driver
+is swapped here. asyncpg prepares every statement it runs and keeps the most
+recent ones per connection (`prepared_statement_cache_size`), so hot queries
+skip parsing and planning after their first execution on a connection.
+
+Behind PgBouncer in transaction pooling mode (`PoolConfig.pgbouncer`) the
+statement cache is turned off and statements get unique names, since a
+statement prepared in one transaction may be gone, or belong to another
+client, in the next.
+
+Column types stay `TIMESTAMP WITHOUT TIME ZONE` while the domain hands out
+timezone-aware UTC datetimes. psycopg2 stores those as their UTC wall time;
+asyncpg rejects them, so the `timestamp` codec is replaced to keep the
+psycopg2 behaviour.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from .engine import PoolConfig, async_engine_kwargs
+
+_PG_EPOCH = datetime(2000, 1, 1)
+_PG_INFINITY = 2**63 - 1
+_PG_NEG_INFINITY = -(2**63)
+
+
+def asyncpg_url(database_url: str, prepared_statement_cache_size: int = 500) -> URL:
+    """`postgresql[+driver]://...` -> `postgresql+asyncpg://...`"""
+    url = make_url(database_url)
+    return url.set(drivername="postgresql+asyncpg").update_query_dict(
+        {"prepared_statement_cache_size": str(prepared_statement_cache_size)}
+    )
+
+
+def _encode_timestamp(value: datetime) -> Tuple[int]:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - _PG_EPOCH
+    return ((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds,)
+
+
+def _decode_timestamp(value: Tuple[int]) -> datetime:
+    if value[0] == _PG_INFINITY:
+        return datetime.max
+    if value[0] == _PG_NEG_INFINITY:
+        return datetime.min
+    return _PG_EPOCH + timedelta(microseconds=value[0])
+
+
+async def _register_codecs(connection: Any) -> None:
+    await connection.set_type_codec(
+        "timestamp",
+        schema="pg_catalog",
+        encoder=_encode_timestamp,
+        decoder=_decode_timestamp,
+        format="tuple",
+    )
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def pgbouncer_connect_args() -> dict:
+    """asyncpg arguments for PgBouncer transaction pooling: no statement cache, unique names."""
+    return {"statement_cache_size": 0, "prepared_statement_name_func": _unique_statement_name}
+
+
+def create_async_session_factory(
+    database_url: str,
+    prepared_statement_cache_size: int = 500,
+    pool: Optional[PoolConfig] = None,
+    label: str = "async",
+    **engine_kwargs: Any,
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Build an asyncpg engine and a session factory bound to it.
+
+    `pool` sizes the (metered) connection pool, reported under `label`; tests may pass their own
+    `poolclass` through `engine_kwargs` instead.
+
+    Sessions do not expire objects on commit: attributes of a committed entity
+    are still readable (e.g. by the response serializer) without the implicit
+    refresh query that async sessions cannot issue.
+    """
+    pool = pool or PoolConfig()
+    if "poolclass" not in engine_kwargs:
+        engine_kwargs = {**async_engine_kwargs(pool, label), **engine_kwargs}
+    if pool.pgbouncer:
+        prepared_statement_cache_size = 0
+        engine_kwargs["connect_args"] = {**pgbouncer_connect_args(), **engine_kwargs.get("connect_args", {})}
+    engine = create_async_engine(asyncpg_url(database_url, prepared_statement_cache_size), **engine_kwargs)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.run_async(_register_codecs)
+
+    return async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
@@ -0,0 +1,66 @@
+"""
+Unit of work: one transaction, and one commit, per use case.
+
+Repositories only stage changes on the session (`add`, `delete`, attribute
+changes, `flush` when a generated value is needed). The service wraps a write
+use case in the unit of work, which commits the entity together with its
+outbox rows on success and rolls everything back on error.
+"""
+
+from types import TracebackType
+from typing import Awaitable, Callable, List, Optional, Type
+from weakref import WeakKeyDictionary
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+CommitHook = Callable[[AsyncSession], Awaitable[None]]
+
+_commit_hooks: "WeakKeyDictionary[AsyncSession, List[CommitHook]]" = WeakKeyDictionary()
+
+
+def add_commit_hook(session: AsyncSession, hook: CommitHook) -> None:
+    """Run `hook(session)` after every `UnitOfWork` commit on `session`."""
+    _commit_hooks.setdefault(session, []).append(hook)
+
+
+class ReturningDefaults:
+    """
+    Declarative base mixin (`declarative_base(cls=ReturningDefaults)`).
+
+    Server-generated column values are read back with RETURNING in the INSERT or
+    UPDATE itself instead of a follow-up SELECT (`refresh()`).
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
+
+
+class UnitOfWork:
+    """
+    Async context manager around a request session:
+
+        async with self.uow:
+            self.repository.create(entity)
+            self._add_to_outbox(topic, event)
+
+    Pending changes are flushed and committed once when the block exits normally,
+    then the hooks registered with `add_commit_hook` run on the session.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            await self.session.commit()
+            for hook in _commit_hooks.get(self.session, ()):
+                await hook(self.session)
+        else:
+            await self.session.rollback()
@@ -0,0 +1,169 @@
+"""
+Request Deadline Propagation.
+
+The API Gateway advertises how long it is still willing to wait for an answer
+in the `X-Request-Deadline-Ms` header (a relative budget in milliseconds, so
+clocks do not need to agree). `DeadlineMiddleware` turns that budget into an
+asyncio timeout around the request and stores the absolute deadline in a
+context variable. Outgoing httpx calls made while handling the request pick up
+the remaining budget via the `propagate_deadline` event hook, so downstream
+services stop working on requests nobody is waiting for any more.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+import httpx
+
+from .schemas import ErrorDetail, ErrorResponse
+
+logger = logging.getLogger(__name__)
+
+DEADLINE_HEADER = "X-Request-Deadline-Ms"
+
+# Absolute deadline (time.monotonic()) of the request being handled, if any
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when work is attempted after the request deadline has passed."""
+
+
+def remaining_budget() -> Optional[float]:
+    """
+    Seconds left before the current request's deadline.
+
+    Returns:
+        Remaining seconds (may be negative), or None outside a request with a deadline.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_headers(budget: Optional[float] = None) -> Dict[str, str]:
+    """
+    Headers advertising a budget to a downstream service.
+
+    Args:
+        budget: Seconds to advertise; defaults to the current remaining budget.
+
+    Returns:
+        `{DEADLINE_HEADER: <ms>}`, or an empty dict when there is no deadline.
+    """
+    if budget is None:
+        budget = remaining_budget()
+    if budget is None:
+        return {}
+    return {DEADLINE_HEADER: str(max(0, int(budget * 1000)))}
+
+
+async def propagate_deadline(request: httpx.Request) -> None:
+    """
+    httpx request event hook forwarding the remaining budget downstream.
+
+    Adds the deadline header and caps every httpx timeout at the remaining budget.
+    Usage: `httpx.AsyncClient(event_hooks={"request": [propagate_deadline]})`.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed.
+    """
+    remaining = remaining_budget()
+    if remaining is None:
+        return
+    if remaining <= 0:
+        raise DeadlineExceeded(f"Deadline exceeded before calling {request.url}")
+
+    request.headers.update(deadline_headers(remaining))
+    timeout = dict(request.extensions.get("timeout", {}))
+    for key in ("connect", "read", "write", "pool"):
+        current = timeout.get(key)
+        timeout[key] = remaining if current is None else min(current, remaining)
+    request.extensions["timeout"] = timeout
+
+
+def _parse_budget(raw: Optional[bytes]) -> Optional[float]:
+    if raw is None:
+        return None
+    try:
+        return int(raw) / 1000.0
+    except ValueError:
+        logger.warning(f"Ignoring malformed {DEADLINE_HEADER} header: {raw!r}")
+        return None
+
+
+class DeadlineMiddleware:
+    """
+    Pure ASGI middleware enforcing the propagated request deadline.
+
+    Requests without the header run unbounded unless `default_timeout` is set.
+    When the budget runs out before the response has started, the handler is
+    cancelled and a `504 DEADLINE_EXCEEDED` error is returned.
+    """
+
+    def __init__(self, app, default_timeout: Optional[float] = None):
+        self.app = app
+        self.default_timeout = default_timeout
+        self._header = DEADLINE_HEADER.lower().encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = _parse_budget(dict(scope.get("headers", [])).get(self._header))
+        if budget is None:
+            budget = self.default_timeout
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        token = _deadline.set(time.monotonic() + budget)
+        try:
+            if budget <= 0:
+                raise DeadlineExceeded("Deadline already exceeded on arrival")
+            async with asyncio.timeout(budget):
+                await self.app(scope, receive, send_wrapper)
+        except TimeoutError as e:
+            if not isinstance(e, DeadlineExceeded) and (remaining_budget() or 0) > 0:
+                raise
+            logger.warning(f"Deadline exceeded for {scope.get('method')} {scope.get('path')}")
+            if not response_started:
+                await self._send_timeout(send)
+        finally:
+            _deadline.reset(token)
+
+    @staticmethod
+    async def _send_timeout(send):
+        body = json.dumps(
+            ErrorResponse(
+                error=ErrorDetail(
+                    code="DEADLINE_EXCEEDED",
+                    message="Request deadline exceeded before a response was produced.",
+                )
+            ).model_dump()
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 504,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
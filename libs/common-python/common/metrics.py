@@ -0,0 +1,90 @@
+"""
+Lightweight In-Process Metrics Registry.
+
+Keeps counters, gauges and timing summaries in memory so services can report
+operational numbers (retries, hedges, pool waits, ...) without a metrics backend.
+A service exposes the registry as JSON (e.g. `GET /metrics`) via `snapshot()`.
+"""
+
+import threading
+from typing import Any, Dict, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _format_key(name: str, labels: LabelKey) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f'{k}="{v}"' for k, v in labels)
+    return f"{name}{{{rendered}}}"
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of named metrics, keyed by metric name plus labels.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._gauges: Dict[Tuple[str, LabelKey], float] = {}
+        self._timings: Dict[Tuple[str, LabelKey], Dict[str, float]] = {}
+
+    def increment(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """Add `value` to a monotonically increasing counter."""
+        key = (name, self._labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        """Set a gauge to its current value."""
+        key = (name, self._labels(labels))
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record one sample (e.g. a duration in seconds) into a count/sum/max summary."""
+        key = (name, self._labels(labels))
+        with self._lock:
+            summary = self._timings.setdefault(key, {"count": 0, "sum": 0.0, "max": 0.0})
+            summary["count"] += 1
+            summary["sum"] += value
+            summary["max"] = max(summary["max"], value)
+
+    def get(self, name: str, **labels: Any) -> float:
+        """Current value of a counter or gauge (0 when never recorded)."""
+        key = (name, self._labels(labels))
+        with self._lock:
+            if key in self._counters:
+                return self._counters[key]
+            return self._gauges.get(key, 0.0)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Render all metrics as plain dicts.
+
+        Returns:
+            Dictionary with `counters`, `gauges` and `timings` sections.
+        """
+        with self._lock:
+            return {
+                "counters": {_format_key(n, lbl): v for (n, lbl), v in self._counters.items()},
+                "gauges": {_format_key(n, lbl): v for (n, lbl), v in self._gauges.items()},
+                "timings": {
+                    _format_key(n, lbl): dict(summary) for (n, lbl), summary in self._timings.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timings.clear()
+
+    @staticmethod
+    def _labels(labels: Dict[str, Any]) -> LabelKey:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+# Process-wide default registry
+metrics = MetricsRegistry()
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -15,6 +15,31 @@ class ErrorResponse(BaseModel):
     error: ErrorDetail
 
 
+T = TypeVar("T")
+
+
+class BatchGetRequest(BaseModel):
+    """Body of the `POST /api/v1/{resource}/batch-get` lookup endpoints."""
+    ids: List[uuid.UUID] = Field(..., max_length=1000)
+
+class BatchGetResponse(BaseModel, Generic[T]):
+    items: List[T]
+    missing: List[uuid.UUID]
+
+
+class Change(BaseModel, Generic[T]):
+    """One changefeed entry: the entity's current state, or a tombstone."""
+    op: Literal["upsert", "delete"]
+    id: uuid.UUID
+    data: Optional[T] = None
+
+class ChangesResponse(BaseModel, Generic[T]):
+    """Page of the `GET /api/v1/{resource}/changes` changefeeds."""
+    changes: List[Change[T]]
+    next_cursor: Optional[str] = None
+    has_more: bool
+
+
 class Event(BaseModel):
     """Base schema for all domain events."""
     event_id: uuid.UUID = Field(default_factory=uuid.uuid4)
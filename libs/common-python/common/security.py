@@ -1,5 +1,10 @@
+import base64
+import hashlib
+import hmac
+import json
 import logging
-from typing import List
+import time
+from typing import List, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -9,16 +14,82 @@ from pydantic import BaseModel
 logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
+# Set by the API Gateway after it verified the bearer token at the edge
+INTERNAL_IDENTITY_HEADER = "X-Internal-Identity"
+
 class UserContext(BaseModel):
     user_id: str
     username: str
     role: str
 
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+def _token_hash(token: str) -> str:
+    return _b64encode(hashlib.sha256(token.encode()).digest()[:12])
+
+def sign_internal_identity(user: UserContext, secret: str, token: str, ttl: float = 60.0) -> str:
+    """
+    Build the compact, HMAC-signed identity header the gateway forwards downstream.
+
+    Args:
+        user: Identity established by verifying the bearer token.
+        secret: Shared secret between the gateway and the services.
+        token: The bearer token the identity was derived from (bound into the header).
+        ttl: Seconds the header stays valid.
+
+    Returns:
+        `<base64url payload>.<base64url HMAC-SHA256>`.
+    """
+    payload = _b64encode(
+        json.dumps(
+            {
+                "sub": user.user_id,
+                "usr": user.username,
+                "rol": user.role,
+                "exp": int(time.time() + ttl),
+                "tkh": _token_hash(token),
+            },
+            separators=(",", ":"),
+        ).encode()
+    )
+    signature = hmac.new(secret.encode(), payload.encode(), hashlib.sha256).digest()
+    return f"{payload}.{_b64encode(signature)}"
+
+def verify_internal_identity(value: str, secret: str, token: str) -> Optional[UserContext]:
+    """
+    Check an internal identity header; a cheap alternative to RSA token verification.
+
+    Returns:
+        The UserContext if the signature, expiry and token binding are valid, else None.
+    """
+    try:
+        payload, signature = value.split(".", 1)
+        expected = hmac.new(secret.encode(), payload.encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64decode(signature)):
+            return None
+        claims = json.loads(_b64decode(payload))
+    except (ValueError, TypeError):
+        return None
+
+    if not isinstance(claims, dict):
+        return None
+    if claims.get("exp", 0) < time.time() or claims.get("tkh") != _token_hash(token):
+        return None
+    if not all(claims.get(key) for key in ("sub", "usr", "rol")):
+        return None
+    return UserContext(user_id=claims["sub"], username=claims["usr"], role=claims["rol"])
+
 def get_current_user(
     token: HTTPAuthorizationCredentials = Depends(security),
     # In a real microservice, you'd pass the public key via env or fetch it once
     public_key: str = None,
-    algorithm: str = "RS256"
+    algorithm: str = "RS256",
+    internal_identity: Optional[str] = None,
+    identity_secret: Optional[str] = None,
 ) -> UserContext:
     """
     FastAPI dependency to validate JWT token and return user context.
@@ -27,10 +98,19 @@ def get_current_user(
         token: The bearer token from the request.
         public_key: The RSA public key for verification.
         algorithm: The signing algorithm.
+        internal_identity: Value of the `X-Internal-Identity` header, if any.
+        identity_secret: Shared secret for the internal identity header; when set
+            and the header verifies, RSA verification of the token is skipped.
 
     Returns:
         UserContext object with user details.
     """
+    if internal_identity and identity_secret:
+        user = verify_internal_identity(internal_identity, identity_secret, token.credentials)
+        if user is not None:
+            return user
+        logger.warning("Ignoring invalid internal identity header")
+
     if not public_key:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
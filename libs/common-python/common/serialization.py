@@ -0,0 +1,69 @@
+"""
+Pre-rendered JSON for list endpoints.
+
+A listing selects only the columns of its response schema and hands the rows
+to `JSONRowsResponse`, which encodes them straight to JSON bytes. That skips
+ORM hydration plus the per-row pydantic validation and re-serialization that
+`response_model` would do; the route keeps `response_model` for the OpenAPI
+contract. The output matches pydantic's JSON mode for the column types used
+here: UUIDs as strings, datetimes in ISO 8601 (UTC as `Z`), enums by value
+and Decimals as strings.
+
+Encoding uses orjson when the optional `orjson` package is installed and the
+stdlib `json` module otherwise.
+"""
+
+import json
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _isoformat(value: date) -> str:
+    text = value.isoformat()
+    if isinstance(value, datetime) and value.utcoffset() == timedelta(0):
+        text = text[: -len("+00:00")] + "Z"
+    return text
+
+
+def _default(value: Any) -> Any:
+    # Types neither encoder handles natively (orjson covers UUID, datetime and Enum)
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, date):
+        return _isoformat(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Compact JSON bytes for `content`."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+    return json.dumps(content, default=_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def render_rows(rows: Iterable[Any]) -> bytes:
+    """JSON array of objects for SQLAlchemy `Row`s, keyed by column name."""
+    return dumps([row._asdict() for row in rows])
+
+
+class JSONRowsResponse(Response):
+    """`application/json` response rendered from result rows with `render_rows`."""
+
+    media_type = "application/json"
+
+    def render(self, content: Iterable[Any]) -> bytes:
+        return render_rows(content)
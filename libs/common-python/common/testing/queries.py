@@ -0,0 +1,49 @@
+"""
+Query counting for round-trip regression tests.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Iterator, List
+
+from sqlalchemy import event
+
+
+class QueryLog:
+    """Statements sent through an engine, with commits recorded as "COMMIT"."""
+
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+
+    @property
+    def counts(self) -> Counter:
+        """Statements counted by their leading keyword, e.g. {"SELECT": 1, "COMMIT": 1}."""
+        return Counter(statement.split(None, 1)[0].upper() for statement in self.statements)
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries(engine: Any) -> Iterator[QueryLog]:
+    """
+    Record every statement executed on `engine` (sync or async) inside the block.
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    log = QueryLog()
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        log.statements.append(statement)
+
+    def _on_commit(conn):
+        log.statements.append("COMMIT")
+
+    event.listen(sync_engine, "before_cursor_execute", _on_execute)
+    event.listen(sync_engine, "commit", _on_commit)
+    try:
+        yield log
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _on_execute)
+        event.remove(sync_engine, "commit", _on_commit)
@@ -0,0 +1,81 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from common.database.changefeed import (
+    ChangeBatch,
+    decode_change_cursor,
+    encode_change_cursor,
+    read_changes,
+)
+from common.database.outbox import OutboxMixin
+from common.exceptions import ValidationError
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+
+class Outbox(Base, OutboxMixin):
+    __tablename__ = "outbox"
+
+
+def _session(rows):
+    session = AsyncMock()
+    result = MagicMock()
+    result.all.return_value = rows
+    session.execute.return_value = result
+    return session
+
+
+def test_cursor_round_trip():
+    row_id = uuid.uuid4()
+    assert decode_change_cursor(encode_change_cursor(2**40 + 7, row_id)) == (2**40 + 7, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["garbage", encode_change_cursor(1, uuid.uuid4())[:-4], ""])
+def test_invalid_cursor_is_a_validation_error(cursor):
+    with pytest.raises(ValidationError):
+        decode_change_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_page_is_compacted_to_the_latest_change_per_entity():
+    a, b, c = (uuid.uuid4() for _ in range(3))
+    rows = [(10, uuid.uuid4(), str(a)), (11, uuid.uuid4(), str(b)), (12, uuid.uuid4(), str(a)), (13, uuid.uuid4(), None)]
+    session = _session(rows + [(14, uuid.uuid4(), str(c))])
+
+    batch = await read_changes(session, Outbox, limit=4)
+
+    assert batch.entity_ids == [b, a]
+    assert batch.has_more is True
+    assert decode_change_cursor(batch.next_cursor) == (13, rows[3][1])
+
+
+@pytest.mark.asyncio
+async def test_reads_only_below_the_running_transaction_horizon_after_the_cursor():
+    since = encode_change_cursor(5, uuid.uuid4())
+    session = _session([])
+
+    batch = await read_changes(session, Outbox, since=since, limit=10)
+
+    # Nothing new: the caller keeps its position
+    assert batch == ChangeBatch(next_cursor=since)
+    sql = str(session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "outbox.txid < (SELECT CAST(CAST(pg_snapshot_xmin(pg_current_snapshot())" in sql
+    assert "(outbox.txid, outbox.id) >" in sql
+    assert "ORDER BY outbox.txid ASC, outbox.id ASC" in sql
+
+
+def test_resolve_turns_missing_entities_into_tombstones():
+    kept, gone = uuid.uuid4(), uuid.uuid4()
+    entity = SimpleNamespace(id=kept)
+
+    content = ChangeBatch(entity_ids=[gone, kept], next_cursor="c").resolve([entity])
+
+    assert content == {
+        "changes": [{"op": "delete", "id": gone}, {"op": "upsert", "id": kept, "data": entity}],
+        "next_cursor": "c",
+        "has_more": False,
+    }
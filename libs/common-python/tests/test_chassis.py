@@ -79,3 +79,24 @@ def test_user_context():
     user = UserContext(user_id="123", username="test", role="ADMIN")
     assert user.user_id == "123"
     assert user.role == "ADMIN"
+
+def test_metrics_registry():
+    from common.metrics import MetricsRegistry
+
+    registry = MetricsRegistry()
+    registry.increment("requests_total", service="store")
+    registry.increment("requests_total", 2, service="store")
+    registry.set_gauge("pool_size", 5)
+    registry.observe("wait_seconds", 0.5)
+    registry.observe("wait_seconds", 1.5)
+
+    assert registry.get("requests_total", service="store") == 3
+    assert registry.get("requests_total", service="pricing") == 0
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"] == {'requests_total{service="store"}': 3}
+    assert snapshot["gauges"] == {"pool_size": 5}
+    assert snapshot["timings"]["wait_seconds"] == {"count": 2, "sum": 2.0, "max": 1.5}
+
+    registry.reset()
+    assert registry.snapshot()["counters"] == {}
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from common.deadline import (
+    DEADLINE_HEADER,
+    DeadlineExceeded,
+    DeadlineMiddleware,
+    propagate_deadline,
+    remaining_budget,
+)
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.get("/budget")
+    async def budget():
+        return {"remaining": remaining_budget()}
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(1)
+        return {"done": True}
+
+    return app
+
+
+def test_no_deadline_without_header():
+    client = TestClient(make_app())
+    assert client.get("/budget").json()["remaining"] is None
+
+
+def test_deadline_header_sets_remaining_budget():
+    client = TestClient(make_app())
+    remaining = client.get("/budget", headers={DEADLINE_HEADER: "2000"}).json()["remaining"]
+    assert 0 < remaining <= 2.0
+
+
+def test_handler_cancelled_when_deadline_expires():
+    client = TestClient(make_app())
+    response = client.get("/slow", headers={DEADLINE_HEADER: "50"})
+    assert response.status_code == 504
+    assert response.json()["error"]["code"] == "DEADLINE_EXCEEDED"
+
+
+def test_malformed_header_is_ignored():
+    client = TestClient(make_app())
+    assert client.get("/budget", headers={DEADLINE_HEADER: "soon"}).json()["remaining"] is None
+
+
+@pytest.mark.asyncio
+async def test_propagate_deadline_caps_outgoing_timeout():
+    from common.deadline import _deadline
+
+    request = httpx.Request(
+        "GET", "http://downstream/api", extensions={"timeout": {"connect": 5.0, "read": 5.0}}
+    )
+
+    await propagate_deadline(request)
+    assert DEADLINE_HEADER not in request.headers
+
+    token = _deadline.set(time.monotonic() + 1.0)
+    try:
+        await propagate_deadline(request)
+        assert 0 < int(request.headers[DEADLINE_HEADER]) <= 1000
+        assert request.extensions["timeout"]["read"] <= 1.0
+        assert request.extensions["timeout"]["pool"] <= 1.0
+    finally:
+        _deadline.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_propagate_deadline_rejects_expired_budget():
+    from common.deadline import _deadline
+
+    token = _deadline.set(time.monotonic() - 1)
+    try:
+        with pytest.raises(DeadlineExceeded):
+            await propagate_deadline(httpx.Request("GET", "http://downstream/api"))
+    finally:
+        _deadline.reset(token)
@@ -0,0 +1,62 @@
+import pytest
+from common.config import BaseServiceSettings
+from common.database.engine import PoolConfig, create_db_engine, listen_dsn
+from common.database.session import create_async_session_factory, pgbouncer_connect_args
+from common.metrics import metrics
+from sqlalchemy import exc
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_pool_config_from_settings():
+    settings = BaseServiceSettings(SERVICE_NAME="test", DB_POOL_SIZE=20, DB_MAX_OVERFLOW=0, DB_PGBOUNCER_TRANSACTION_POOLING=True)
+
+    pool = PoolConfig.from_settings(settings)
+
+    assert (pool.pool_size, pool.max_overflow, pool.pgbouncer) == (20, 0, True)
+
+
+def test_engine_reports_checkout_wait_saturation_and_timeouts():
+    engine = create_db_engine("sqlite://", PoolConfig(pool_size=2, max_overflow=0, pool_timeout=0.05), label="test")
+
+    first = engine.connect()
+    assert metrics.get("db_pool_checked_out", pool="test") == 1
+    assert metrics.get("db_pool_saturation", pool="test") == 0.5
+
+    second = engine.connect()
+    assert metrics.get("db_pool_saturation", pool="test") == 1.0
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    assert metrics.get("db_pool_checkout_timeouts_total", pool="test") == 1
+
+    first.close()
+    second.close()
+    assert metrics.get("db_pool_checked_out", pool="test") == 0
+    waits = metrics.snapshot()["timings"]['db_pool_checkout_wait_seconds{pool="test"}']
+    assert waits["count"] == 3
+    assert waits["max"] >= 0.05
+
+
+def test_pgbouncer_mode_disables_server_side_statement_caching():
+    factory = create_async_session_factory(
+        "postgresql://user:pw@localhost/catalog", pool=PoolConfig(pgbouncer=True)
+    )
+    assert factory.kw["bind"].url.query["prepared_statement_cache_size"] == "0"
+
+    connect_args = pgbouncer_connect_args()
+    assert connect_args["statement_cache_size"] == 0
+    name = connect_args["prepared_statement_name_func"]
+    assert name() != name()
+
+
+def test_listen_dsn_prefers_direct_url():
+    assert listen_dsn("postgresql://u:pw@pgbouncer:6432/catalog") == "postgres://u:pw@pgbouncer:6432/catalog"
+    assert (
+        listen_dsn("postgresql://u:pw@pgbouncer:6432/catalog", "postgresql+psycopg2://u:pw@db:5432/catalog")
+        == "postgres://u:pw@db:5432/catalog"
+    )
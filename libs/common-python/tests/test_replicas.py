@@ -0,0 +1,131 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from common.database.replicas import ReplicaRouter, format_lsn, parse_lsn
+from common.database.unit_of_work import UnitOfWork
+from common.metrics import metrics
+from fastapi import Response
+from starlette.requests import cookie_parser
+
+
+def _factory(lsn=None, error=None):
+    """Session factory whose sessions report `lsn` for any LSN query."""
+    session = AsyncMock()
+    session.__aenter__.return_value = session
+    result = MagicMock()
+    result.scalar.return_value = lsn
+    session.execute.side_effect = error
+    session.connection.side_effect = error
+    session.execute.return_value = result
+    return MagicMock(return_value=session), session
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_lsn_round_trip_and_ordering():
+    assert parse_lsn("16/B374D848") == 0x16B374D848
+    assert format_lsn(parse_lsn("16/B374D848")) == "16/B374D848"
+    assert parse_lsn("0/FFFFFFFF") < parse_lsn("1/0")
+    assert parse_lsn(None) is None
+    assert parse_lsn("garbage") is None
+    assert parse_lsn("1/xyz") is None
+
+
+@pytest.mark.asyncio
+async def test_reads_use_the_primary_without_replicas():
+    primary, primary_session = _factory()
+    router = ReplicaRouter()
+
+    async with router.read_session(primary, {}) as session:
+        assert session is primary_session
+    assert metrics.get("db_read_routing_total", target="primary", reason="no_replicas") == 1
+
+
+@pytest.mark.asyncio
+async def test_reads_without_cookie_round_robin_over_replicas():
+    (first, first_session), (second, second_session) = _factory(), _factory()
+    primary, _ = _factory()
+    router = ReplicaRouter([first, second])
+
+    used = []
+    for _ in range(3):
+        async with router.read_session(primary, {}) as session:
+            used.append(session)
+
+    assert used == [first_session, second_session, first_session]
+    first_session.execute.assert_not_awaited()
+    first_session.close.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replica_without_cookie_falls_back_to_primary():
+    replica, replica_session = _factory(error=OSError("refused"))
+    primary, primary_session = _factory()
+    router = ReplicaRouter([replica])
+
+    async with router.read_session(primary, {}) as session:
+        assert session is primary_session
+    replica_session.close.assert_awaited()
+    assert metrics.get("db_read_routing_total", target="primary", reason="unavailable") == 1
+
+
+@pytest.mark.asyncio
+async def test_caught_up_replica_serves_read_your_writes():
+    replica, replica_session = _factory(lsn="0/3000100")
+    primary, _ = _factory()
+    router = ReplicaRouter([replica], cookie_name="lsn")
+
+    async with router.read_session(primary, {"lsn": "0/3000000"}) as session:
+        assert session is replica_session
+    primary.assert_not_called()
+    assert metrics.get("db_read_routing_total", target="replica", reason="caught_up") == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "replayed, error, reason",
+    [("0/2FFFFFF", None, "stale"), (None, None, "stale"), (None, OSError("refused"), "unavailable")],
+)
+async def test_lagging_or_unreachable_replica_falls_back_to_primary(replayed, error, reason):
+    replica, replica_session = _factory(lsn=replayed, error=error)
+    primary, primary_session = _factory()
+    router = ReplicaRouter([replica], cookie_name="lsn")
+
+    async with router.read_session(primary, {"lsn": "0/3000000"}) as session:
+        assert session is primary_session
+    replica_session.close.assert_awaited()
+    assert metrics.get("db_read_routing_total", target="primary", reason=reason) == 1
+
+
+@pytest.mark.asyncio
+async def test_commit_sets_lsn_cookie():
+    replica, _ = _factory()
+    _, session = _factory(lsn="0/3000060")
+    router = ReplicaRouter([replica], cookie_name="lsn")
+    response = Response()
+
+    router.track_commits(session, response)
+    async with UnitOfWork(session):
+        pass
+
+    session.commit.assert_awaited_once()
+    # Read back the way `request.cookies` parses it on the next request
+    assert cookie_parser(response.headers["set-cookie"])["lsn"] == "0/3000060"
+
+
+@pytest.mark.asyncio
+async def test_commit_tracking_is_off_without_replicas():
+    _, session = _factory(lsn="0/3000060")
+    response = Response()
+
+    ReplicaRouter().track_commits(session, response)
+    async with UnitOfWork(session):
+        pass
+
+    session.execute.assert_not_awaited()
+    assert "set-cookie" not in response.headers
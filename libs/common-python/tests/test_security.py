@@ -0,0 +1,60 @@
+import time
+
+import pytest
+from common.security import (
+    UserContext,
+    get_current_user,
+    sign_internal_identity,
+    verify_internal_identity,
+)
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+SECRET = "gateway-secret"
+TOKEN = "header.payload.signature"
+USER = UserContext(user_id="u-1", username="alice", role="ADMIN")
+
+
+def test_internal_identity_round_trip():
+    value = sign_internal_identity(USER, SECRET, TOKEN)
+    assert verify_internal_identity(value, SECRET, TOKEN) == USER
+
+
+def test_internal_identity_rejects_tampering_and_wrong_secret():
+    value = sign_internal_identity(USER, SECRET, TOKEN)
+    payload, signature = value.split(".")
+
+    assert verify_internal_identity(value, "other-secret", TOKEN) is None
+    assert verify_internal_identity(f"{payload}x.{signature}", SECRET, TOKEN) is None
+    assert verify_internal_identity("garbage", SECRET, TOKEN) is None
+
+
+def test_internal_identity_is_bound_to_token_and_expires(monkeypatch):
+    value = sign_internal_identity(USER, SECRET, TOKEN, ttl=60)
+    assert verify_internal_identity(value, SECRET, "another.token.value") is None
+
+    monkeypatch.setattr(time, "time", lambda: 10**10)
+    assert verify_internal_identity(value, SECRET, TOKEN) is None
+
+
+def test_get_current_user_accepts_internal_identity_without_public_key():
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=TOKEN)
+    header = sign_internal_identity(USER, SECRET, TOKEN)
+
+    user = get_current_user(
+        token=credentials, public_key=None, internal_identity=header, identity_secret=SECRET
+    )
+    assert user == USER
+
+
+def test_get_current_user_falls_back_to_jwt_for_invalid_identity():
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=TOKEN)
+
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(
+            token=credentials,
+            public_key="not-a-key",
+            internal_identity="forged.header",
+            identity_secret=SECRET,
+        )
+    assert exc.value.status_code == 401
@@ -0,0 +1,79 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional
+
+import pytest
+from common import serialization
+from common.serialization import JSONRowsResponse, render_rows
+from pydantic import BaseModel
+from sqlalchemy import create_engine, literal, select
+
+
+class Unit(str, Enum):
+    GB = "GB"
+
+
+class ItemRead(BaseModel):
+    id: uuid.UUID
+    name: str
+    price: Decimal
+    unit: Unit
+    tags: List[uuid.UUID]
+    created_at: datetime
+    published_at: Optional[datetime] = None
+
+
+ITEM = {
+    "id": uuid.uuid4(),
+    "name": "Fibre 1G – café",
+    "price": Decimal("19.90"),
+    "unit": Unit.GB,
+    "tags": [uuid.uuid4(), uuid.uuid4()],
+    "created_at": datetime(2026, 1, 2, 3, 4, 5, 123456),
+    "published_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+}
+
+
+class _Row:
+    """Stands in for a SQLAlchemy `Row` (only `_asdict` is used)."""
+
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+    def _asdict(self):
+        return dict(self._mapping)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_rows_render_like_the_pydantic_response_model(encoder):
+    rows = [_Row(ITEM), _Row({**ITEM, "published_at": None})]
+
+    rendered = json.loads(render_rows(rows))
+
+    assert rendered == [ItemRead.model_validate(row._asdict()).model_dump(mode="json") for row in rows]
+
+
+def test_sqlalchemy_rows_are_keyed_by_column_name():
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        rows = conn.execute(select(literal(1).label("id"), literal("x").label("name"))).all()
+
+    assert json.loads(render_rows(rows)) == [{"id": 1, "name": "x"}]
+
+
+def test_response_is_json_bytes():
+    response = JSONRowsResponse([_Row({"id": ITEM["id"]})])
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [{"id": str(ITEM["id"])}]
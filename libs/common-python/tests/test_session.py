@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta, timezone
+
+from common.database.session import (
+    _decode_timestamp,
+    _encode_timestamp,
+    asyncpg_url,
+    create_async_session_factory,
+)
+
+
+def test_asyncpg_url_swaps_driver_and_sets_statement_cache():
+    url = asyncpg_url("postgresql://user:pw@db:5432/catalog", prepared_statement_cache_size=250)
+    assert url.drivername == "postgresql+asyncpg"
+    assert url.database == "catalog"
+    assert url.query["prepared_statement_cache_size"] == "250"
+
+    assert asyncpg_url("postgresql+psycopg2://user:pw@db/catalog").drivername == "postgresql+asyncpg"
+
+
+def test_timestamp_codec_round_trip():
+    value = datetime(2026, 10, 19, 14, 5, 32, 118407)
+    assert _decode_timestamp(_encode_timestamp(value)) == value
+
+
+def test_aware_timestamps_are_stored_as_utc_wall_time():
+    aware = datetime(2026, 10, 19, 16, 0, tzinfo=timezone(timedelta(hours=2)))
+    assert _decode_timestamp(_encode_timestamp(aware)) == datetime(2026, 10, 19, 14, 0)
+
+
+def test_infinite_timestamps_decode_to_bounds():
+    assert _decode_timestamp((2**63 - 1,)) == datetime.max
+    assert _decode_timestamp((-(2**63),)) == datetime.min
+
+
+def test_session_factory_keeps_objects_loaded_after_commit():
+    factory = create_async_session_factory("postgresql://user:pw@localhost/catalog")
+    assert factory.kw["expire_on_commit"] is False
+    assert factory.kw["bind"].url.drivername == "postgresql+asyncpg"
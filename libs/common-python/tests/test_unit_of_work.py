@@ -0,0 +1,55 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from common.database.unit_of_work import ReturningDefaults, UnitOfWork
+from common.testing.queries import count_queries
+from sqlalchemy import Column, Integer, String, create_engine, text
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+Base = declarative_base(cls=ReturningDefaults)
+
+
+class Row(Base):
+    __tablename__ = "rows"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), server_default=text("'unnamed'"))
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_once_on_success():
+    session = AsyncMock()
+
+    async with UnitOfWork(session):
+        pass
+
+    session.commit.assert_awaited_once()
+    session.rollback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error():
+    session = AsyncMock()
+
+    with pytest.raises(ValueError):
+        async with UnitOfWork(session):
+            raise ValueError("boom")
+
+    session.commit.assert_not_awaited()
+    session.rollback.assert_awaited_once()
+
+
+def test_server_defaults_come_back_with_the_insert():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+
+    with count_queries(engine) as queries:
+        row = Row()
+        session.add(row)
+        session.commit()
+        assert row.name == "unnamed"
+
+    # INSERT ... RETURNING, no refresh SELECT
+    assert queries.counts == {"INSERT": 1, "COMMIT": 1}
+    assert "RETURNING" in queries.statements[0]
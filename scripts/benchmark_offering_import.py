@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""
+Benchmark bulk offering import against one-by-one creation.
+
+1. Login with admin credentials (through the API Gateway)
+2. Pick an existing specification and price to reference
+3. Stream N offerings as NDJSON to the Offering Service's /api/v1/offerings/import
+4. Create a small sample one POST at a time and extrapolate to N
+
+The import is sent straight to the Offering Service: a 100k-line import runs far
+longer than the gateway's per-request upstream deadline.
+
+Usage:
+    python scripts/benchmark_offering_import.py --count 100000 --baseline 500
+"""
+
+import argparse
+import json
+import time
+import uuid
+from typing import Dict, Iterator, Tuple
+
+import httpx
+
+
+def login(gateway_url: str, username: str, password: str) -> str:
+    resp = httpx.post(
+        f"{gateway_url}/api/v1/auth/login",
+        data={"username": username, "password": password},
+        timeout=10.0,
+    )
+    resp.raise_for_status()
+    return resp.json()["access_token"]
+
+
+def pick_references(gateway_url: str, headers: Dict[str, str]) -> Tuple[str, str]:
+    specs = httpx.get(f"{gateway_url}/api/v1/specifications?limit=1", headers=headers, timeout=10.0).json()
+    prices = httpx.get(f"{gateway_url}/api/v1/prices?limit=1", headers=headers, timeout=10.0).json()
+    if not specs or not prices:
+        raise SystemExit("❌ Need at least one specification and one price (run `make seed-data` first)")
+    return specs[0]["id"], prices[0]["id"]
+
+
+def offering(i: int, run_id: str, spec_id: str, price_id: str) -> Dict:
+    return {
+        "name": f"Bench {run_id} #{i}",
+        "description": "Benchmark offering",
+        "specification_ids": [spec_id],
+        "pricing_ids": [price_id],
+        "sales_channels": ["WEB"],
+    }
+
+
+def ndjson(count: int, run_id: str, spec_id: str, price_id: str) -> Iterator[bytes]:
+    batch = []
+    for i in range(count):
+        batch.append(json.dumps(offering(i, run_id, spec_id, price_id)))
+        if len(batch) == 1000:
+            yield ("\n".join(batch) + "\n").encode()
+            batch = []
+    if batch:
+        yield ("\n".join(batch) + "\n").encode()
+
+
+def run_import(offering_url: str, headers: Dict[str, str], count: int, spec_id: str, price_id: str) -> None:
+    run_id = uuid.uuid4().hex[:8]
+    print(f"\n🚚 Importing {count} offerings as NDJSON...")
+    start = time.perf_counter()
+    first_result = None
+    summary = None
+    with httpx.stream(
+        "POST",
+        f"{offering_url}/api/v1/offerings/import",
+        content=ndjson(count, run_id, spec_id, price_id),
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+        timeout=None,
+    ) as resp:
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            if first_result is None:
+                first_result = time.perf_counter() - start
+            result = json.loads(line)
+            if "summary" in result:
+                summary = result["summary"]
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ {summary}")
+    print(f"   total {elapsed:.1f}s, {count / elapsed:,.0f} offerings/s, first result after {first_result:.2f}s")
+
+
+def run_baseline(offering_url: str, headers: Dict[str, str], sample: int, count: int, spec_id: str, price_id: str) -> None:
+    run_id = uuid.uuid4().hex[:8]
+    print(f"\n🐢 Creating {sample} offerings one POST at a time...")
+    with httpx.Client(base_url=offering_url, headers=headers, timeout=10.0) as client:
+        start = time.perf_counter()
+        for i in range(sample):
+            client.post("/api/v1/offerings", json=offering(i, run_id, spec_id, price_id)).raise_for_status()
+        elapsed = time.perf_counter() - start
+
+    rate = sample / elapsed
+    print(f"   {rate:,.0f} offerings/s, ~{count / rate / 60:.1f} min extrapolated to {count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--gateway-url", default="http://localhost:8000")
+    parser.add_argument("--offering-url", default="http://localhost:8005")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--count", type=int, default=100_000, help="Offerings to import")
+    parser.add_argument("--baseline", type=int, default=500, help="One-by-one sample size (0 to skip)")
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {login(args.gateway_url, args.username, args.password)}"}
+    spec_id, price_id = pick_references(args.gateway_url, headers)
+
+    run_import(args.offering_url, headers, args.count, spec_id, price_id)
+    if args.baseline:
+        run_baseline(args.offering_url, headers, args.baseline, args.count, spec_id, price_id)
+
+
+if __name__ == "__main__":
+    main()
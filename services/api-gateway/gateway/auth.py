@@ -0,0 +1,69 @@
+"""
+Edge authentication for the API Gateway.
+
+When enabled, the gateway verifies each bearer token once (RS256, with the
+public key cached from the Identity Service) and forwards an HMAC-signed
+`X-Internal-Identity` header. Services accept that header through
+`common.security.get_current_user` instead of re-verifying the RSA signature.
+Verified tokens are kept in an LRU until they expire, so a client's repeated
+requests do not pay for RSA verification either.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from common.security import UserContext
+from jose import JWTError, jwt
+
+logger = logging.getLogger(__name__)
+
+class EdgeAuthenticator:
+    def __init__(self, algorithm: str, cache_size: int):
+        self.algorithm = algorithm
+        self.cache_size = cache_size
+        self.public_key: Optional[str] = None
+        self._cache: "OrderedDict[str, Tuple[UserContext, float]]" = OrderedDict()
+
+    def set_public_key(self, public_key: Optional[str]) -> None:
+        self.public_key = public_key.replace("\\n", "\n") if public_key else None
+        self._cache.clear()
+
+    def verify(self, token: str) -> Optional[UserContext]:
+        """
+        Verify a bearer token, using the cache of previously verified tokens.
+
+        Returns:
+            The token's UserContext, or None if it cannot be verified here (the
+            request is then forwarded untouched and the service decides).
+        """
+        cached = self._cache.get(token)
+        if cached is not None:
+            user, expires_at = cached
+            if expires_at > time.time():
+                self._cache.move_to_end(token)
+                return user
+            del self._cache[token]
+
+        if not self.public_key:
+            return None
+        try:
+            payload = jwt.decode(token, self.public_key, algorithms=[self.algorithm])
+        except JWTError as e:
+            logger.info(f"Edge JWT verification failed: {e!s}")
+            return None
+
+        if not all(payload.get(key) for key in ("sub", "username", "role")):
+            return None
+        user = UserContext(
+            user_id=payload["sub"], username=payload["username"], role=payload["role"]
+        )
+
+        self._cache[token] = (user, float(payload.get("exp", time.time() + 60)))
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return user
+
+    def clear(self) -> None:
+        self._cache.clear()
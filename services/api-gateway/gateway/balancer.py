@@ -0,0 +1,120 @@
+"""
+Client-side load balancing across the replicas of a downstream service.
+
+Each replica is an `Endpoint` with its own circuit breaker and outstanding
+request count. `UpstreamPool.choose()` uses power-of-two-choices on outstanding
+requests, skipping replicas that were ejected either passively (their breaker
+opened after consecutive failures) or actively (their `/health` probe failed).
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, Collection, Dict, List, Optional
+
+import httpx
+
+from .resilience import AsyncCircuitBreaker, BreakerStore
+
+logger = logging.getLogger(__name__)
+
+class Endpoint:
+    def __init__(self, url: str, breaker: AsyncCircuitBreaker):
+        self.url = url.rstrip("/")
+        self.breaker = breaker
+        self.outstanding = 0
+        self.healthy = True
+
+    @property
+    def available(self) -> bool:
+        return self.healthy and self.breaker.is_available
+
+    async def call(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        self.outstanding += 1
+        try:
+            return await self.breaker.call(func)
+        finally:
+            self.outstanding -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "circuit_breaker": self.breaker.current_state,
+            "outstanding": self.outstanding,
+        }
+
+class UpstreamPool:
+    """
+    The set of replicas serving one downstream service.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        urls: List[str],
+        fail_max: int,
+        reset_timeout: float,
+        store_factory: Optional[Callable[[str], Optional[BreakerStore]]] = None,
+    ):
+        self.name = name
+        self.endpoints = [
+            Endpoint(
+                url,
+                AsyncCircuitBreaker(
+                    fail_max=fail_max,
+                    reset_timeout=reset_timeout,
+                    name=f"{name}[{url}]",
+                    store=store_factory(f"{name}[{url}]") if store_factory else None,
+                ),
+            )
+            for url in urls
+        ]
+
+    def choose(self, exclude: Optional[Collection[Endpoint]] = None) -> Endpoint:
+        """
+        Pick a replica for the next attempt.
+
+        Args:
+            exclude: Replicas already tried by this request (avoided when possible).
+
+        Returns:
+            The less loaded of two random available replicas. When every replica is
+            ejected, all of them are considered so the breaker decides the outcome.
+        """
+        available = [e for e in self.endpoints if e.available]
+        candidates = [e for e in available if not exclude or e not in exclude]
+        candidates = candidates or available or self.endpoints
+        if len(candidates) == 1:
+            return candidates[0]
+        first, second = random.sample(candidates, 2)
+        return first if first.outstanding <= second.outstanding else second
+
+    async def probe(self, client: httpx.AsyncClient) -> Dict[str, str]:
+        """
+        Actively check every replica's `/health` endpoint and eject or readmit it.
+
+        Returns:
+            Mapping of replica URL to `healthy`, `unhealthy` or `unreachable`.
+        """
+
+        async def check(endpoint: Endpoint) -> str:
+            try:
+                resp = await client.get(f"{endpoint.url}/health")
+                result = "healthy" if resp.status_code == 200 else "unhealthy"
+            except Exception:
+                result = "unreachable"
+            healthy = result == "healthy"
+            if healthy != endpoint.healthy:
+                logger.warning(
+                    f"Endpoint {endpoint.url} of {self.name} is now "
+                    f"{'in rotation' if healthy else 'ejected'} ({result})"
+                )
+            endpoint.healthy = healthy
+            return result
+
+        results = await asyncio.gather(*(check(e) for e in self.endpoints))
+        return {e.url: result for e, result in zip(self.endpoints, results)}
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [e.snapshot() for e in self.endpoints]
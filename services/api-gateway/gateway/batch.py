@@ -0,0 +1,117 @@
+"""
+Request batching for the web UI.
+
+`POST /api/v1/batch` carries several sub-requests in one browser round-trip.
+Each sub-request is turned into a synthetic Starlette `Request` that shares the
+caller's headers (auth, correlation id) and is routed to its service with the
+same prefix table as the individual proxy routes.
+"""
+
+import json
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from urllib.parse import urlsplit
+
+import anyio
+from fastapi import Request
+from pydantic import BaseModel, Field
+
+# Public path prefix -> downstream service (mirrors the proxy routes in main.py)
+ROUTES: List[Tuple[str, str]] = [
+    ("/api/v1/auth/", "identity"),
+    ("/api/v1/characteristics", "characteristic"),
+    ("/api/v1/specifications", "specification"),
+    ("/api/v1/prices", "pricing"),
+    ("/api/v1/offerings", "offering"),
+    ("/api/v1/store", "store"),
+]
+
+# Headers describing the outer request body; never copied to sub-requests
+_BODY_HEADERS = {b"content-length", b"content-type", b"transfer-encoding"}
+
+
+class BatchItem(BaseModel):
+    id: Optional[str] = Field(None, description="Client reference echoed in the result")
+    method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"] = "GET"
+    path: str = Field(..., description="Gateway path, e.g. /api/v1/prices?limit=10")
+    headers: Dict[str, str] = {}
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem]
+
+
+class BatchItemResult(BaseModel):
+    id: Optional[str] = None
+    status: int
+    headers: Dict[str, str] = {}
+    body: Optional[Any] = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchItemResult]
+
+
+def resolve_route(path: str) -> Optional[Tuple[str, str]]:
+    """
+    Map a public gateway path to its downstream service.
+
+    Returns:
+        `(service_name, upstream_path)`, or None when no service owns the path.
+    """
+    for prefix, service_name in ROUTES:
+        if path.startswith(prefix) and (
+            prefix.endswith("/") or len(path) == len(prefix) or path[len(prefix)] in "/?"
+        ):
+            return service_name, path.lstrip("/")
+    return None
+
+
+def build_subrequest(parent: Request, item: BatchItem) -> Request:
+    """
+    Build a synthetic request for one batch item, inheriting the caller's headers.
+    """
+    parts = urlsplit(item.path)
+    content = b"" if item.body is None else json.dumps(item.body).encode()
+
+    headers = {
+        key: value for key, value in parent.scope["headers"] if key.lower() not in _BODY_HEADERS
+    }
+    for key, value in item.headers.items():
+        headers[key.lower().encode("latin-1")] = value.encode("latin-1")
+    if content:
+        headers[b"content-type"] = b"application/json"
+        headers[b"content-length"] = str(len(content)).encode()
+
+    scope = {
+        **parent.scope,
+        "method": item.method,
+        "path": parts.path,
+        "raw_path": parts.path.encode(),
+        "query_string": parts.query.encode(),
+        "headers": list(headers.items()),
+        "state": {"correlation_id": parent.state.correlation_id},
+    }
+
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": content, "more_body": False}
+        # Disconnects are observed on the outer batch request instead
+        await anyio.sleep_forever()
+
+    return Request(scope, receive)
+
+
+def render_body(content: bytes, content_type: str) -> Any:
+    if not content:
+        return None
+    if "json" in content_type:
+        try:
+            return json.loads(content)
+        except ValueError:
+            pass
+    return content.decode("utf-8", errors="replace")
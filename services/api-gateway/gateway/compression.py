@@ -0,0 +1,201 @@
+"""
+Negotiated response compression for the API Gateway.
+
+Compresses buffered JSON/text responses with brotli (when the optional `brotli`
+package is installed) or gzip. Compression runs on a dedicated thread pool so
+large catalog payloads never block the event loop, and compressed bodies are
+kept in a small LRU keyed by a digest of the uncompressed body, so a payload
+served repeatedly (e.g. the same store listing) is compressed only once.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml")
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the best supported encoding from an `Accept-Encoding` header.
+
+    Returns:
+        `br`, `gzip` or None when the client accepts neither.
+    """
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    if brotli is not None and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+class ResponseCompressor:
+    """
+    Compresses bodies off the event loop and caches the results.
+    """
+
+    def __init__(
+        self,
+        min_size: int,
+        gzip_level: int,
+        brotli_quality: int,
+        workers: int,
+        cache_size: int,
+    ):
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_size = cache_size
+        self.workers = workers
+        self.hits = 0
+        self.misses = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cache: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def compress(self, body: bytes, encoding: str) -> bytes:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="compress"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._compress_cached, body, encoding)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _compress_cached(self, body: bytes, encoding: str) -> bytes:
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        if encoding == "br":
+            compressed = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=self.gzip_level)
+
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[key] = compressed
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return compressed
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware applying `ResponseCompressor` to eligible responses.
+
+    The response is buffered, then compressed if the client accepts a supported
+    encoding, the content type is textual, the upstream did not already encode
+    it and the body is at least `min_size` bytes.
+    """
+
+    def __init__(self, app, compressor: ResponseCompressor):
+        self.app = app
+        self.compressor = compressor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = dict(scope.get("headers", []))
+        encoding = negotiate_encoding(request_headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        chunks: List[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                if not self._eligible(message):
+                    passthrough = True
+                    await send(message)
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            if len(body) < self.compressor.min_size:
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            compressed = await self.compressor.compress(body, encoding)
+            headers = [
+                (key, value)
+                for key, value in start_message["headers"]
+                if key.lower() not in (b"content-length", b"vary")
+            ]
+            vary = [value for key, value in start_message["headers"] if key.lower() == b"vary"]
+            headers += [
+                (b"content-encoding", encoding.encode()),
+                (b"content-length", str(len(compressed)).encode()),
+                (b"vary", b", ".join(vary + [b"Accept-Encoding"])),
+            ]
+            await send({**start_message, "headers": headers})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _eligible(start_message) -> bool:
+        if start_message["status"] in (204, 304) or start_message["status"] < 200:
+            return False
+        headers = {key.lower(): value for key, value in start_message.get("headers", [])}
+        if b"content-encoding" in headers:
+            return False
+        content_type = headers.get(b"content-type", b"").decode("latin-1")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
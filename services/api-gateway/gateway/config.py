@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from common.config import BaseServiceSettings
 
@@ -19,21 +19,88 @@ class GatewaySettings(BaseServiceSettings):
     OFFERING_SERVICE_URL: str = "http://localhost:8005"
     STORE_SERVICE_URL: str = "http://localhost:8006"
 
+    # Downstream Replicas (JSON lists; when empty the single URL above is used)
+    IDENTITY_SERVICE_URLS: List[str] = []
+    CHARACTERISTIC_SERVICE_URLS: List[str] = []
+    SPECIFICATION_SERVICE_URLS: List[str] = []
+    PRICING_SERVICE_URLS: List[str] = []
+    OFFERING_SERVICE_URLS: List[str] = []
+    STORE_SERVICE_URLS: List[str] = []
+
+    # Background Health Probing of replicas (feeds ejection and circuit breakers)
+    HEALTH_PROBE_ENABLED: bool = True
+    HEALTH_PROBE_INTERVAL: float = 10.0
+    HEALTH_PROBE_TIMEOUT: float = 2.0
+
     # Resilience Settings
     CONNECTION_TIMEOUT: float = 2.0
     READ_TIMEOUT: float = 4.0
+    UPSTREAM_DEADLINE: float = 4.0  # Overall budget advertised to upstreams via X-Request-Deadline-Ms
     CB_FAILURE_THRESHOLD: int = 3
     CB_RESET_TIMEOUT: float = 20.0
 
+    # Adaptive Concurrency Limits (per upstream bulkhead)
+    CL_INITIAL_LIMIT: int = 20
+    CL_MIN_LIMIT: int = 2
+    CL_MAX_LIMIT: int = 200
+    CL_MAX_QUEUE: int = 50
+    CL_QUEUE_TIMEOUT: float = 1.0
+    CL_LATENCY_TARGET: float = 1.0
+
+    # Hedging & Retry Budgets (idempotent GETs only)
+    HEDGE_ENABLED: bool = False
+    HEDGE_PERCENTILE: float = 0.95  # Hedge once a request is slower than this route percentile
+    HEDGE_MIN_DELAY: float = 0.05  # Never hedge earlier than this (seconds)
+    HEDGE_MIN_SAMPLES: int = 20  # Samples needed before a route's percentile is trusted
+    RETRY_BUDGET_RATIO: float = 0.1  # Extra attempts allowed per original request
+    RETRY_BUDGET_MAX_TOKENS: float = 10.0
+
+    # Rate Limiting (token buckets per client and route prefix; longest prefix wins)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMITS: Dict[str, Tuple[float, int]] = {  # prefix -> (tokens per second, burst)
+        "/api/v1": (50.0, 100),
+        "/api/v1/store/search": (5.0, 10),
+    }
+    RATE_LIMIT_SHARDS: int = 16
+    RATE_LIMIT_IDLE_TTL: float = 300.0  # Seconds before an idle client's bucket is dropped
+
+    # Shared State (breakers and rate-limit buckets shared by all workers on one host)
+    SHARED_STATE_PATH: Optional[str] = None  # e.g. /dev/shm/gateway-state; unset = per-process
+    SHARED_STATE_BREAKER_SLOTS: int = 256
+    SHARED_STATE_BUCKET_SLOTS: int = 65536
+
+    # Request Batching (POST /api/v1/batch)
+    BATCH_MAX_REQUESTS: int = 50
+    BATCH_CONCURRENCY: int = 10  # Sub-requests in flight at once per batch
+
+    # Response Compression (gzip, or brotli when the `brotli` package is installed)
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # Bytes; smaller bodies are sent as-is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_WORKERS: int = 2  # Dedicated threads so compression never blocks the event loop
+    COMPRESSION_CACHE_SIZE: int = 256  # Compressed bodies kept for repeated payloads
+
     # CORS Settings
     ALLOWED_ORIGINS: List[str] = ["*"]
 
     # JWT Settings (Gateway trusts downstream validation but can also validate if needed)
     JWT_PUBLIC_KEY: Optional[str] = None
 
+    # Edge Authentication (verify JWTs once here and forward a signed X-Internal-Identity;
+    # requires INTERNAL_IDENTITY_SECRET shared with the services)
+    EDGE_AUTH_ENABLED: bool = False
+    EDGE_AUTH_CACHE_SIZE: int = 10000  # Verified tokens remembered until they expire
+    INTERNAL_IDENTITY_TTL: float = 60.0
+
     # Observability Settings
     ZIPKIN_ENDPOINT: str = "http://localhost:9411/api/v2/spans"
     TRACING_ENABLED: bool = True
 
+    def service_urls(self, service_name: str) -> List[str]:
+        """Replica URLs for a downstream service, falling back to its single URL."""
+        prefix = service_name.upper()
+        return getattr(self, f"{prefix}_SERVICE_URLS") or [getattr(self, f"{prefix}_SERVICE_URL")]
+
 
 settings = GatewaySettings()
@@ -0,0 +1,122 @@
+"""
+Background health prober for the API Gateway.
+
+Probes every replica of every upstream concurrently on a fixed interval, using
+one shared client, and caches the outcome so `/health/dependencies` answers
+instantly. Services with no healthy replica get their circuit breaker forced
+open, so user requests fail fast instead of discovering the outage themselves;
+breakers the prober opened are closed again once the service recovers.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Set
+
+import httpx
+
+from .balancer import UpstreamPool
+from .resilience import AsyncCircuitBreaker, CircuitState
+
+logger = logging.getLogger(__name__)
+
+class HealthProber:
+    def __init__(
+        self,
+        pools: Dict[str, UpstreamPool],
+        breakers: Dict[str, AsyncCircuitBreaker],
+        interval: float,
+        timeout: float,
+    ):
+        self.pools = pools
+        self.breakers = breakers
+        self.interval = interval
+        self.timeout = timeout
+        self.results: Dict[str, Dict[str, str]] = {}
+        self.checked_at: Optional[float] = None
+        self._forced_open: Set[str] = set()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def probe_once(self) -> Dict[str, Dict[str, str]]:
+        """
+        Probe all replicas concurrently, update cached status and breakers.
+
+        Returns:
+            Probe result per service and replica URL.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        names = list(self.pools)
+        outcomes = await asyncio.gather(*(self.pools[name].probe(self._client) for name in names))
+        self.results = dict(zip(names, outcomes))
+        self.checked_at = time.time()
+
+        for name, replicas in self.results.items():
+            self._apply(name, service_status(replicas))
+        return self.results
+
+    def summary(self) -> Dict[str, str]:
+        return {name: service_status(replicas) for name, replicas in self.results.items()}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "checked_at": self.checked_at,
+            "age": None if self.checked_at is None else time.time() - self.checked_at,
+            "replicas": self.results,
+        }
+
+    def clear(self) -> None:
+        self.results = {}
+        self.checked_at = None
+        self._forced_open.clear()
+
+    def _apply(self, name: str, status: str) -> None:
+        breaker = self.breakers.get(name)
+        if breaker is None:
+            return
+        if status == "healthy":
+            if name in self._forced_open:
+                self._forced_open.discard(name)
+                if breaker.state == CircuitState.OPEN:
+                    breaker.reset()
+        else:
+            # Re-forced on every failed probe so the breaker does not half-open meanwhile
+            breaker.force_open(f"health probe reports {name} {status}")
+            self._forced_open.add(name)
+
+    async def _run(self):
+        while True:
+            try:
+                await self.probe_once()
+            except Exception as e:
+                logger.error(f"Upstream health probe failed: {e!s}")
+            await asyncio.sleep(self.interval)
+
+
+def service_status(replicas: Dict[str, str]) -> str:
+    """A service is healthy while any replica is; otherwise report the best failure."""
+    if "healthy" in replicas.values():
+        return "healthy"
+    if "unhealthy" in replicas.values():
+        return "unhealthy"
+    return "unreachable"
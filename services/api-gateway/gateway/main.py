@@ -3,19 +3,44 @@ API Gateway - Unified Entry Point for TMF Product Catalog Microservices.
 
 Features:
 - Reverse proxy to all microservices
+- Load balancing across service replicas with passive and active ejection
 - Circuit breaker pattern for resilience
+- Adaptive per-upstream concurrency limits with load shedding
+- Hedged requests and budgeted retries for idempotent GETs
+- Deadline propagation and cancellation of upstream calls on client disconnect
+- Batch endpoint multiplexing many sub-requests into one round-trip
+- Negotiated gzip/brotli response compression
+- Token-bucket rate limiting per client and route
+- Optional edge JWT verification with a signed internal identity header
 - Correlation ID propagation
 - OpenTelemetry distributed tracing with B3 propagation
 - CORS support
 """
 
+import asyncio
+import math
+import re
 import time
 import uuid
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from urllib.parse import urlsplit
 
 import httpx
+from common.deadline import (
+    DEADLINE_HEADER,
+    DeadlineMiddleware,
+    deadline_headers,
+    remaining_budget,
+)
 from common.logging import setup_logging
+from common.metrics import metrics
 from common.schemas import ErrorDetail, ErrorResponse
+from common.security import (
+    INTERNAL_IDENTITY_HEADER,
+    UserContext,
+    sign_internal_identity,
+)
 from common.tracing import (
     get_current_trace_context,
     instrument_fastapi,
@@ -27,8 +52,31 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from opentelemetry.propagate import inject
 
+from .auth import EdgeAuthenticator
+from .balancer import Endpoint, UpstreamPool
+from .batch import (
+    BatchItem,
+    BatchItemResult,
+    BatchRequest,
+    BatchResponse,
+    build_subrequest,
+    render_body,
+    resolve_route,
+)
+from .compression import CompressionMiddleware, ResponseCompressor
 from .config import settings
-from .resilience import AsyncCircuitBreaker, CircuitBreakerError
+from .health import HealthProber
+from .ratelimit import ShardedRateLimiter, match_route_limit
+from .resilience import (
+    AdaptiveConcurrencyLimiter,
+    AsyncCircuitBreaker,
+    BreakerStore,
+    CircuitBreakerError,
+    ConcurrencyLimitExceeded,
+    LatencyTracker,
+    RetryBudget,
+)
+from .shared_state import SharedRateLimiter, SharedStateRegion
 
 # Setup logging first
 logger = setup_logging(settings.SERVICE_NAME, settings.LOG_LEVEL)
@@ -43,49 +91,205 @@ setup_tracing(
 # Instrument HTTPX for outgoing requests
 instrument_httpx()
 
+# Shared State (host-wide breaker and rate-limit state when workers share a mapping)
+shared_state = (
+    SharedStateRegion(
+        settings.SHARED_STATE_PATH,
+        breaker_slots=settings.SHARED_STATE_BREAKER_SLOTS,
+        bucket_slots=settings.SHARED_STATE_BUCKET_SLOTS,
+    )
+    if settings.SHARED_STATE_PATH
+    else None
+)
+
+
+def breaker_store(name: str) -> Optional[BreakerStore]:
+    return shared_state.breaker_store(name) if shared_state else None
+
+
 # Circuit Breakers Registry
 breakers: Dict[str, AsyncCircuitBreaker] = {
     "identity": AsyncCircuitBreaker(
         fail_max=settings.CB_FAILURE_THRESHOLD,
         reset_timeout=settings.CB_RESET_TIMEOUT,
         name="identity",
+        store=breaker_store("identity"),
     ),
     "characteristic": AsyncCircuitBreaker(
         fail_max=settings.CB_FAILURE_THRESHOLD,
         reset_timeout=settings.CB_RESET_TIMEOUT,
         name="characteristic",
+        store=breaker_store("characteristic"),
     ),
     "specification": AsyncCircuitBreaker(
         fail_max=settings.CB_FAILURE_THRESHOLD,
         reset_timeout=settings.CB_RESET_TIMEOUT,
         name="specification",
+        store=breaker_store("specification"),
     ),
     "pricing": AsyncCircuitBreaker(
         fail_max=settings.CB_FAILURE_THRESHOLD,
         reset_timeout=settings.CB_RESET_TIMEOUT,
         name="pricing",
+        store=breaker_store("pricing"),
     ),
     "offering": AsyncCircuitBreaker(
         fail_max=settings.CB_FAILURE_THRESHOLD,
         reset_timeout=settings.CB_RESET_TIMEOUT,
         name="offering",
+        store=breaker_store("offering"),
     ),
     "store": AsyncCircuitBreaker(
         fail_max=settings.CB_FAILURE_THRESHOLD,
         reset_timeout=settings.CB_RESET_TIMEOUT,
         name="store",
+        store=breaker_store("store"),
     ),
 }
 
+# Concurrency Limiters Registry (one bulkhead per upstream, keyed like `breakers`)
+limiters: Dict[str, AdaptiveConcurrencyLimiter] = {
+    name: AdaptiveConcurrencyLimiter(
+        name=name,
+        initial_limit=settings.CL_INITIAL_LIMIT,
+        min_limit=settings.CL_MIN_LIMIT,
+        max_limit=settings.CL_MAX_LIMIT,
+        max_queue=settings.CL_MAX_QUEUE,
+        queue_timeout=settings.CL_QUEUE_TIMEOUT,
+        latency_target=settings.CL_LATENCY_TARGET,
+    )
+    for name in breakers
+}
+
+# Upstream Pools Registry (replicas per service, each with its own endpoint breaker)
+pools: Dict[str, UpstreamPool] = {
+    name: UpstreamPool(
+        name=name,
+        urls=settings.service_urls(name),
+        fail_max=settings.CB_FAILURE_THRESHOLD,
+        reset_timeout=settings.CB_RESET_TIMEOUT,
+        store_factory=breaker_store,
+    )
+    for name in breakers
+}
+
+# Retry Budgets Registry (shared by hedges and retries of the same upstream)
+retry_budgets: Dict[str, RetryBudget] = {
+    name: RetryBudget(
+        ratio=settings.RETRY_BUDGET_RATIO,
+        max_tokens=settings.RETRY_BUDGET_MAX_TOKENS,
+    )
+    for name in breakers
+}
+
+# Rate Limiter (token buckets keyed by client and route prefix)
+rate_limiter = (
+    SharedRateLimiter(shared_state)
+    if shared_state
+    else ShardedRateLimiter(
+        shards=settings.RATE_LIMIT_SHARDS, idle_ttl=settings.RATE_LIMIT_IDLE_TTL
+    )
+)
+
+# Edge Authenticator (verifies bearer tokens once, at the gateway)
+edge_auth = EdgeAuthenticator(
+    algorithm=settings.JWT_ALGORITHM, cache_size=settings.EDGE_AUTH_CACHE_SIZE
+)
+edge_auth.set_public_key(settings.JWT_PUBLIC_KEY)
+
+# Per-route latency samples used to pick the hedging delay
+latency_tracker = LatencyTracker(min_samples=settings.HEDGE_MIN_SAMPLES)
+
+# Non-standard status (nginx convention) logged when the client went away first
+CLIENT_CLOSED_REQUEST = 499
+
+# Upstream headers that no longer describe the (decoded, re-framed) proxied body
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+# Upstream statuses worth a second attempt on an idempotent request
+RETRYABLE_STATUS_CODES = {502, 503}
+
+_ID_SEGMENT = re.compile(
+    r"/(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+)(?=/|$)"
+)
+
+# Background Health Prober (cached upstream status, pre-opens breakers of down services)
+prober = HealthProber(
+    pools=pools,
+    breakers=breakers,
+    interval=settings.HEALTH_PROBE_INTERVAL,
+    timeout=settings.HEALTH_PROBE_TIMEOUT,
+)
+
+# Response compressor (own thread pool and LRU of compressed bodies)
+compressor = ResponseCompressor(
+    min_size=settings.COMPRESSION_MIN_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    workers=settings.COMPRESSION_WORKERS,
+    cache_size=settings.COMPRESSION_CACHE_SIZE,
+)
+
+
+async def _fetch_public_key():
+    """Fetch the JWT public key from the Identity Service, retrying until it succeeds."""
+    attempt = 0
+    while edge_auth.public_key is None:
+        attempt += 1
+        try:
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                response = await client.get(
+                    f"{settings.service_urls('identity')[0]}/api/v1/auth/public-key"
+                )
+            if response.status_code == 200:
+                edge_auth.set_public_key(response.json()["public_key"])
+                logger.info("JWT public key fetched successfully from Identity Service")
+                return
+            logger.error(f"Failed to fetch JWT public key: HTTP {response.status_code}")
+        except Exception as e:
+            logger.error(f"Error fetching JWT public key (attempt {attempt}): {e}")
+        await asyncio.sleep(min(2 * attempt, 30))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.HEALTH_PROBE_ENABLED:
+        logger.info("Starting background upstream health prober")
+        prober.start()
+
+    key_task = None
+    if settings.EDGE_AUTH_ENABLED:
+        if not settings.INTERNAL_IDENTITY_SECRET:
+            logger.warning("EDGE_AUTH_ENABLED without INTERNAL_IDENTITY_SECRET: identities not forwarded")
+        if edge_auth.public_key is None:
+            # Until the key arrives, tokens are forwarded unverified (services still verify)
+            key_task = asyncio.create_task(_fetch_public_key())
+
+    yield
+
+    await prober.stop()
+    if key_task:
+        key_task.cancel()
+    compressor.shutdown()
+
+
 app = FastAPI(
     title="API Gateway",
     description="Unified Entry Point for TMF Product Catalog Microservices",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Instrument FastAPI for tracing (excludes health endpoints)
 instrument_fastapi(app, excluded_urls="health")
 
+# Honour a deadline sent by the client (caps the budget advertised to upstreams)
+app.add_middleware(DeadlineMiddleware)
+
+# Response Compression
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, compressor=compressor)
+
 # CORS Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -93,6 +297,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Keyset-paginated list endpoints return the next page's cursor here
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -143,42 +349,103 @@ def inject_trace_headers(headers: Dict[str, Any]) -> Dict[str, Any]:
     return carrier
 
 
-async def proxy_request(
-    service_name: str, base_url: str, path: str, request: Request
-) -> Response:
+async def proxy_request(service_name: str, path: str, request: Request) -> Response:
     """
-    Generic reverse proxy with Circuit Breaker, Timeouts, and Trace Propagation.
+    Generic reverse proxy with Load Balancing, Circuit Breakers, Concurrency Limits,
+    Timeouts, and Trace Propagation.
     """
     breaker = breakers.get(service_name)
-    if not breaker:
+    limiter = limiters.get(service_name)
+    pool = pools.get(service_name)
+    if not breaker or not limiter or not pool:
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"error": f"No circuit breaker configured for service: {service_name}"},
         )
 
+    user = authenticate_at_edge(request)
+
+    rejection = check_rate_limit(request)
+    if rejection is not None:
+        return rejection
+
     method = request.method
     headers = dict(request.headers)
     headers["X-Correlation-ID"] = request.state.correlation_id
     headers.pop("host", None)
+    headers.pop(DEADLINE_HEADER.lower(), None)
+
+    # Only the gateway may assert an identity; never pass a client-supplied one through
+    headers.pop(INTERNAL_IDENTITY_HEADER.lower(), None)
+    if user is not None and settings.INTERNAL_IDENTITY_SECRET:
+        headers[INTERNAL_IDENTITY_HEADER] = sign_internal_identity(
+            user,
+            settings.INTERNAL_IDENTITY_SECRET,
+            _bearer_token(request),
+            ttl=settings.INTERNAL_IDENTITY_TTL,
+        )
 
     # Inject B3 trace context into headers for downstream services
     headers = inject_trace_headers(headers)
 
     content = await request.body()
     params = dict(request.query_params)
-    url = f"{base_url}/{path}"
+    tried: Set[Endpoint] = set()
 
-    async def do_request():
-        async with httpx.AsyncClient(
-            timeout=httpx.Timeout(settings.READ_TIMEOUT, connect=settings.CONNECTION_TIMEOUT)
-        ) as client:
+    # Upstreams get whatever is left of the gateway's (or the client's) budget
+    budget = settings.UPSTREAM_DEADLINE
+    client_budget = remaining_budget()
+    if client_budget is not None:
+        budget = min(budget, client_budget)
+    deadline = time.monotonic() + budget
+
+    route_key = f"{service_name}:{_ID_SEGMENT.sub('/:id', path)}"
+
+    async def send(client: httpx.AsyncClient) -> httpx.Response:
+        endpoint = pool.choose(exclude=tried)
+        tried.add(endpoint)
+
+        async def call() -> httpx.Response:
             resp = await client.request(
                 method=method,
-                url=url,
-                headers=headers,
+                url=f"{endpoint.url}/{path}",
+                headers={**headers, **deadline_headers(deadline - time.monotonic())},
                 content=content,
                 params=params,
             )
+            if resp.status_code >= 500:
+                # Counted against the endpoint breaker (passive ejection)
+                raise httpx.HTTPStatusError(
+                    message=f"Server error: {resp.status_code}",
+                    request=resp.request,
+                    response=resp,
+                )
+            return resp
+
+        started = time.monotonic()
+        try:
+            resp = await endpoint.call(call)
+        except httpx.HTTPStatusError as e:
+            resp = e.response
+        except httpx.TransportError:
+            limiter.record(time.monotonic() - started, dropped=True)
+            raise
+        elapsed = time.monotonic() - started
+        limiter.record(elapsed)
+        if resp.status_code < 500:
+            latency_tracker.record(route_key, elapsed)
+        return resp
+
+    async def do_request():
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.READ_TIMEOUT, connect=settings.CONNECTION_TIMEOUT)
+        ) as client:
+            if method == "GET":
+                resp = await _idempotent_request(
+                    service_name, route_key, lambda: send(client)
+                )
+            else:
+                resp = await send(client)
 
             if 500 <= resp.status_code < 600:
                 raise httpx.HTTPStatusError(
@@ -188,12 +455,235 @@ async def proxy_request(
                 )
             return resp
 
+    try:
+        await limiter.acquire()
+    except ConcurrencyLimitExceeded:
+        logger.warning(f"Shedding load for service {service_name}: concurrency limit reached")
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=ErrorResponse(
+                error=ErrorDetail(
+                    code="SERVICE_OVERLOADED",
+                    message=f"Service '{service_name}' is overloaded, please retry later.",
+                )
+            ).model_dump(),
+            headers={"Retry-After": "1"},
+        )
+
+    try:
+        return await _cancel_on_disconnect(
+            request, _forward(service_name, breaker, do_request)
+        )
+    finally:
+        limiter.release()
+
+
+def _bearer_token(request: Request) -> Optional[str]:
+    auth = request.headers.get("authorization", "")
+    if auth.lower().startswith("bearer "):
+        return auth[7:]
+    return None
+
+
+def authenticate_at_edge(request: Request) -> Optional[UserContext]:
+    """
+    Verify the bearer token at the gateway when edge authentication is enabled.
+
+    The verified identity is stored in `request.state.user`. Requests whose token
+    cannot be verified here are still forwarded; the services reject them.
+    """
+    request.state.user = None
+    token = _bearer_token(request)
+    if settings.EDGE_AUTH_ENABLED and token:
+        request.state.user = edge_auth.verify(token)
+    return request.state.user
+
+
+def client_identity(request: Request) -> str:
+    """
+    Identify the caller for rate limiting: verified JWT subject, else client IP.
+
+    Only a subject verified by edge authentication is trusted. An unverified
+    token's `sub` is ignored: a client could otherwise mint a fresh subject per
+    request to dodge its limit, or forge someone else's to drain their bucket.
+    """
+    user = getattr(request.state, "user", None)
+    if user is not None:
+        return f"sub:{user.user_id}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def check_rate_limit(request: Request) -> Optional[Response]:
+    """
+    Take a token for this client and route; returns a 429 response when none is left.
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return None
+    route = match_route_limit(request.url.path, settings.RATE_LIMITS)
+    if route is None:
+        return None
+
+    prefix, rate, burst = route
+    allowed, retry_after = rate_limiter.try_acquire(
+        f"{client_identity(request)}|{prefix}", rate, burst
+    )
+    if allowed:
+        return None
+
+    metrics.increment("gateway_rate_limited_total", route=prefix)
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content=ErrorResponse(
+            error=ErrorDetail(
+                code="RATE_LIMITED",
+                message="Too many requests, please retry later.",
+            )
+        ).model_dump(),
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+async def _cancel_on_disconnect(request: Request, work: Awaitable[Response]) -> Response:
+    """
+    Await the upstream call, cancelling it as soon as the client disconnects.
+
+    The request body has already been consumed, so the next ASGI message is
+    `http.disconnect`, which arrives once the client goes away.
+    """
+    work_task = asyncio.ensure_future(work)
+    disconnect_task = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        done, _ = await asyncio.wait(
+            {work_task, disconnect_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        disconnect_task.cancel()
+        if not work_task.done():
+            work_task.cancel()
+
+    if work_task in done:
+        return work_task.result()
+
+    logger.warning(f"Client disconnected, cancelled upstream call for {request.url.path}")
+    metrics.increment("gateway_client_disconnects_total")
+    return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def _idempotent_request(
+    service_name: str,
+    route_key: str,
+    attempt: Callable[[], Awaitable[httpx.Response]],
+) -> httpx.Response:
+    """
+    Run an idempotent request with optional hedging and one budgeted retry.
+
+    Args:
+        service_name: Upstream name (selects the retry budget and metric labels).
+        route_key: Normalized route used for latency percentiles.
+        attempt: Factory issuing one upstream call.
+
+    Returns:
+        The first usable upstream response.
+    """
+    budget = retry_budgets[service_name]
+    budget.deposit()
+
+    try:
+        resp = await _hedged_attempt(service_name, route_key, attempt, budget)
+    except (httpx.ConnectError, httpx.ConnectTimeout):
+        # The request never reached the upstream, so retrying cannot duplicate work
+        if not _spend_retry(service_name, budget):
+            raise
+    else:
+        if resp.status_code not in RETRYABLE_STATUS_CODES:
+            return resp
+        if not _spend_retry(service_name, budget):
+            return resp
+
+    logger.warning(f"Retrying GET {route_key} on service {service_name}")
+    return await attempt()
+
+
+def _spend_retry(service_name: str, budget: RetryBudget) -> bool:
+    if budget.try_spend():
+        metrics.increment("gateway_retries_total", service=service_name)
+        return True
+    metrics.increment("gateway_retry_budget_exhausted_total", service=service_name)
+    return False
+
+
+async def _hedged_attempt(
+    service_name: str,
+    route_key: str,
+    attempt: Callable[[], Awaitable[httpx.Response]],
+    budget: RetryBudget,
+) -> httpx.Response:
+    """
+    Issue a request and, if it outlives the route's latency percentile, race a second one.
+    """
+    delay = None
+    if settings.HEDGE_ENABLED:
+        threshold = latency_tracker.percentile(route_key, settings.HEDGE_PERCENTILE)
+        if threshold is not None:
+            delay = max(threshold, settings.HEDGE_MIN_DELAY)
+    if delay is None:
+        return await attempt()
+
+    primary = asyncio.ensure_future(attempt())
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done:
+        return primary.result()
+
+    if not budget.try_spend():
+        metrics.increment("gateway_retry_budget_exhausted_total", service=service_name)
+        return await primary
+
+    metrics.increment("gateway_hedged_requests_total", service=service_name)
+    hedge = asyncio.ensure_future(attempt())
+    winner, resp = await _first_usable(primary, hedge)
+    if winner is hedge:
+        metrics.increment("gateway_hedge_wins_total", service=service_name)
+    return resp
+
+
+async def _first_usable(*tasks: "asyncio.Future[httpx.Response]"):
+    """
+    Wait for the first attempt that returns a non-5xx response and cancel the rest.
+
+    Falls back to the last attempt's outcome when none of them is usable.
+    """
+    pending = set(tasks)
+    try:
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None and task.result().status_code < 500:
+                    return task, task.result()
+            if not pending:
+                task = done.pop()
+                return task, task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _forward(service_name: str, breaker: AsyncCircuitBreaker, do_request) -> Response:
+    """
+    Run the upstream call through its circuit breaker and map failures to gateway errors.
+    """
     try:
         resp = await breaker.call(do_request)
         return Response(
             content=resp.content,
             status_code=resp.status_code,
-            headers=dict(resp.headers),
+            headers=_response_headers(resp),
         )
     except CircuitBreakerError:
         logger.error(f"Circuit open for service {service_name}")
@@ -210,7 +700,7 @@ async def proxy_request(
         return Response(
             content=e.response.content,
             status_code=e.response.status_code,
-            headers=dict(e.response.headers),
+            headers=_response_headers(e.response),
         )
     except httpx.TimeoutException:
         logger.error(f"Timeout calling service {service_name}")
@@ -236,6 +726,11 @@ async def proxy_request(
         )
 
 
+def _response_headers(resp: httpx.Response) -> Dict[str, str]:
+    # httpx has already decoded the body, so framing/encoding headers are recomputed
+    return {k: v for k, v in resp.headers.items() if k.lower() not in _HOP_HEADERS}
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "service": settings.SERVICE_NAME}
@@ -243,38 +738,92 @@ async def health_check():
 
 @app.get("/health/dependencies")
 async def health_dependencies():
-    results = {}
-    services = {
-        "identity": settings.IDENTITY_SERVICE_URL,
-        "characteristic": settings.CHARACTERISTIC_SERVICE_URL,
-        "specification": settings.SPECIFICATION_SERVICE_URL,
-        "pricing": settings.PRICING_SERVICE_URL,
-        "offering": settings.OFFERING_SERVICE_URL,
-        "store": settings.STORE_SERVICE_URL,
-    }
-
-    async with httpx.AsyncClient(timeout=2.0) as client:
-        for name, url in services.items():
-            try:
-                resp = await client.get(f"{url}/health")
-                results[name] = "healthy" if resp.status_code == 200 else "unhealthy"
-            except Exception:
-                results[name] = "unreachable"
+    # Served from the background prober's cache; probe on demand only when it is not running
+    if not prober.running or prober.checked_at is None:
+        await prober.probe_once()
+    results = prober.summary()
 
     return {
         "status": "healthy" if all(v == "healthy" for v in results.values()) else "degraded",
         "dependencies": results,
         "circuit_breakers": {name: b.current_state for name, b in breakers.items()},
+        "concurrency_limits": {name: lim.snapshot() for name, lim in limiters.items()},
+        "upstreams": {name: pool.snapshot() for name, pool in pools.items()},
+        "probe": prober.snapshot(),
     }
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Expose in-process gateway metrics (hedges, retries, budget exhaustion)."""
+    return metrics.snapshot()
+
+
+@app.post("/api/v1/batch", response_model=BatchResponse)
+async def batch(batch_in: BatchRequest, request: Request):
+    """
+    Fan out several sub-requests concurrently through the regular proxy path.
+
+    Every sub-request goes through the same breakers, bulkheads and retries as
+    an individual call; failures are reported per item, never for the whole batch.
+    """
+    if len(batch_in.requests) > settings.BATCH_MAX_REQUESTS:
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=ErrorResponse(
+                error=ErrorDetail(
+                    code="BATCH_TOO_LARGE",
+                    message=f"A batch may contain at most {settings.BATCH_MAX_REQUESTS} requests.",
+                )
+            ).model_dump(),
+        )
+
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+
+    async def run(item: BatchItem) -> BatchItemResult:
+        async with semaphore:
+            return await _run_batch_item(request, item)
+
+    async def run_all() -> Response:
+        results = await asyncio.gather(*(run(item) for item in batch_in.requests))
+        return JSONResponse(content=BatchResponse(responses=results).model_dump())
+
+    return await _cancel_on_disconnect(request, run_all())
+
+
+async def _run_batch_item(request: Request, item: BatchItem) -> BatchItemResult:
+    route = resolve_route(urlsplit(item.path).path)
+    if route is None:
+        return BatchItemResult(
+            id=item.id,
+            status=status.HTTP_404_NOT_FOUND,
+            body=ErrorResponse(
+                error=ErrorDetail(
+                    code="NOT_FOUND", message=f"No service routes path '{item.path}'."
+                )
+            ).model_dump(),
+        )
+
+    service_name, upstream_path = route
+    response = await proxy_request(service_name, upstream_path, build_subrequest(request, item))
+    headers = {
+        key: response.headers[key]
+        for key in ("content-type", "retry-after")
+        if key in response.headers
+    }
+    return BatchItemResult(
+        id=item.id,
+        status=response.status_code,
+        headers=headers,
+        body=render_body(response.body, headers.get("content-type", "")),
+    )
+
+
 @app.api_route(
     "/api/v1/auth/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
 )
 async def proxy_identity(path: str, request: Request):
-    return await proxy_request(
-        "identity", settings.IDENTITY_SERVICE_URL, f"api/v1/auth/{path}", request
-    )
+    return await proxy_request("identity", f"api/v1/auth/{path}", request)
 
 
 @app.api_route(
@@ -284,12 +833,7 @@ async def proxy_identity(path: str, request: Request):
 async def proxy_characteristic(path: str, request: Request):
     if path and not path.startswith("/"):
         path = f"/{path}"
-    return await proxy_request(
-        "characteristic",
-        settings.CHARACTERISTIC_SERVICE_URL,
-        f"api/v1/characteristics{path}",
-        request,
-    )
+    return await proxy_request("characteristic", f"api/v1/characteristics{path}", request)
 
 
 @app.api_route(
@@ -299,12 +843,7 @@ async def proxy_characteristic(path: str, request: Request):
 async def proxy_specification(path: str, request: Request):
     if path and not path.startswith("/"):
         path = f"/{path}"
-    return await proxy_request(
-        "specification",
-        settings.SPECIFICATION_SERVICE_URL,
-        f"api/v1/specifications{path}",
-        request,
-    )
+    return await proxy_request("specification", f"api/v1/specifications{path}", request)
 
 
 @app.api_route(
@@ -313,9 +852,7 @@ async def proxy_specification(path: str, request: Request):
 async def proxy_pricing(path: str, request: Request):
     if path and not path.startswith("/"):
         path = f"/{path}"
-    return await proxy_request(
-        "pricing", settings.PRICING_SERVICE_URL, f"api/v1/prices{path}", request
-    )
+    return await proxy_request("pricing", f"api/v1/prices{path}", request)
 
 
 @app.api_route(
@@ -324,9 +861,7 @@ async def proxy_pricing(path: str, request: Request):
 async def proxy_offering(path: str, request: Request):
     if path and not path.startswith("/"):
         path = f"/{path}"
-    return await proxy_request(
-        "offering", settings.OFFERING_SERVICE_URL, f"api/v1/offerings{path}", request
-    )
+    return await proxy_request("offering", f"api/v1/offerings{path}", request)
 
 
 @app.api_route(
@@ -335,9 +870,7 @@ async def proxy_offering(path: str, request: Request):
 async def proxy_store(path: str, request: Request):
     if path and not path.startswith("/"):
         path = f"/{path}"
-    return await proxy_request(
-        "store", settings.STORE_SERVICE_URL, f"api/v1/store{path}", request
-    )
+    return await proxy_request("store", f"api/v1/store{path}", request)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,90 @@
+"""
+Token-bucket admission control for the API Gateway.
+
+Buckets are keyed by client (JWT subject or IP) and route prefix, and live in a
+fixed number of shards. Tokens are refilled lazily when a bucket is touched, so
+idle clients cost nothing; each call also sweeps one shard for buckets that
+have been idle long enough to be full again and drops them.
+"""
+
+import math
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+
+class TokenBucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+
+class ShardedRateLimiter:
+    def __init__(self, shards: int = 16, idle_ttl: float = 300.0):
+        self.idle_ttl = idle_ttl
+        self._shards: List[Dict[str, TokenBucket]] = [{} for _ in range(shards)]
+        self._sweep_cursor = 0
+
+    def try_acquire(
+        self, key: str, rate: float, burst: int, now: Optional[float] = None
+    ) -> Tuple[bool, float]:
+        """
+        Take one token from the bucket identified by `key`.
+
+        Args:
+            key: Client and route identifier.
+            rate: Refill rate in tokens per second.
+            burst: Bucket capacity.
+            now: Monotonic timestamp (defaults to `time.monotonic()`).
+
+        Returns:
+            `(allowed, retry_after)` where `retry_after` is the number of seconds
+            until a token becomes available (0 when allowed).
+        """
+        now = time.monotonic() if now is None else now
+        self._sweep(now)
+
+        shard = self._shards[zlib.crc32(key.encode()) % len(self._shards)]
+        bucket = shard.get(key)
+        if bucket is None:
+            bucket = shard[key] = TokenBucket(float(burst), now)
+        else:
+            bucket.tokens = min(float(burst), bucket.tokens + (now - bucket.updated) * rate)
+            bucket.updated = now
+
+        if bucket.tokens >= 1.0:
+            bucket.tokens -= 1.0
+            return True, 0.0
+        return False, (1.0 - bucket.tokens) / rate if rate > 0 else math.inf
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def _sweep(self, now: float) -> None:
+        shard = self._shards[self._sweep_cursor]
+        self._sweep_cursor = (self._sweep_cursor + 1) % len(self._shards)
+        expired = [key for key, bucket in shard.items() if now - bucket.updated > self.idle_ttl]
+        for key in expired:
+            del shard[key]
+
+
+def match_route_limit(
+    path: str, limits: Dict[str, Tuple[float, int]]
+) -> Optional[Tuple[str, float, int]]:
+    """
+    Find the most specific configured limit for a request path.
+
+    Returns:
+        `(prefix, rate, burst)` of the longest matching prefix, or None.
+    """
+    best = None
+    for prefix, (rate, burst) in limits.items():
+        if path.startswith(prefix) and (best is None or len(prefix) > len(best[0])):
+            best = (prefix, rate, burst)
+    return best
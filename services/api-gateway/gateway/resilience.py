@@ -1,8 +1,10 @@
 import asyncio
 import logging
 import time
+from collections import deque
+from contextlib import contextmanager
 from enum import Enum
-from typing import Any, Callable, Optional
+from typing import Any, Callable, ContextManager, Deque, Dict, Iterator, Optional, Protocol
 
 logger = logging.getLogger(__name__)
 
@@ -11,20 +13,98 @@ class CircuitState(Enum):
     OPEN = "open"
     HALF_OPEN = "half-open"
 
+class BreakerState:
+    __slots__ = ("state", "fail_count", "last_failure_time")
+
+    def __init__(
+        self,
+        state: CircuitState = CircuitState.CLOSED,
+        fail_count: int = 0,
+        last_failure_time: Optional[float] = None,
+    ):
+        self.state = state
+        self.fail_count = fail_count
+        self.last_failure_time = last_failure_time
+
+class BreakerStore(Protocol):
+    """
+    Where a breaker keeps its state. `transaction()` yields a mutable state that
+    is written back atomically when the block exits.
+    """
+
+    def load(self) -> BreakerState: ...
+
+    def transaction(self) -> ContextManager[BreakerState]: ...
+
+class LocalBreakerStore:
+    """
+    Default in-process breaker state (see `gateway.shared_state` for a store shared
+    by all worker processes on a host).
+    """
+
+    def __init__(self):
+        self._state = BreakerState()
+
+    def load(self) -> BreakerState:
+        return self._state
+
+    @contextmanager
+    def transaction(self) -> Iterator[BreakerState]:
+        yield self._state
+
 class AsyncCircuitBreaker:
-    def __init__(self, fail_max: int, reset_timeout: float, name: str):
+    def __init__(
+        self,
+        fail_max: int,
+        reset_timeout: float,
+        name: str,
+        store: Optional[BreakerStore] = None,
+    ):
         self.fail_max = fail_max
         self.reset_timeout = reset_timeout
         self.name = name
-        self.state = CircuitState.CLOSED
-        self.fail_count = 0
-        self.last_failure_time: Optional[float] = None
+        self._store = store or LocalBreakerStore()
         self._lock = asyncio.Lock()
 
+    @property
+    def state(self) -> CircuitState:
+        return self._store.load().state
+
+    @state.setter
+    def state(self, value: CircuitState) -> None:
+        with self._store.transaction() as s:
+            s.state = value
+
+    @property
+    def fail_count(self) -> int:
+        return self._store.load().fail_count
+
+    @fail_count.setter
+    def fail_count(self, value: int) -> None:
+        with self._store.transaction() as s:
+            s.fail_count = value
+
+    @property
+    def last_failure_time(self) -> Optional[float]:
+        return self._store.load().last_failure_time
+
+    @last_failure_time.setter
+    def last_failure_time(self, value: Optional[float]) -> None:
+        with self._store.transaction() as s:
+            s.last_failure_time = value
+
     @property
     def current_state(self) -> str:
         return self.state.value
 
+    @property
+    def is_available(self) -> bool:
+        """True unless the circuit is open and still inside its reset timeout."""
+        s = self._store.load()
+        if s.state != CircuitState.OPEN:
+            return True
+        return time.time() - s.last_failure_time > self.reset_timeout
+
     async def call(self, func: Callable, *args, **kwargs) -> Any:
         async with self._lock:
             await self._before_call()
@@ -39,30 +119,218 @@ class AsyncCircuitBreaker:
                 await self._on_failure(e)
             raise e
 
+    def force_open(self, reason: str) -> None:
+        """Open the circuit without waiting for calls to fail (e.g. a failed health probe)."""
+        with self._store.transaction() as s:
+            if s.state != CircuitState.OPEN:
+                logger.error(f"Circuit {self.name} forced OPEN: {reason}")
+            s.state = CircuitState.OPEN
+            s.fail_count = max(s.fail_count, self.fail_max)
+            s.last_failure_time = time.time()
+
+    def reset(self) -> None:
+        with self._store.transaction() as s:
+            if s.state != CircuitState.CLOSED:
+                logger.info(f"Circuit {self.name} reset to CLOSED")
+            s.state = CircuitState.CLOSED
+            s.fail_count = 0
+
+    # State transitions run inside a store transaction, so with a shared store
+    # they are atomic across every process using the same breaker.
+
     async def _before_call(self):
-        if self.state == CircuitState.OPEN:
-            if time.time() - self.last_failure_time > self.reset_timeout:
-                logger.info(f"Circuit {self.name} transitioning to HALF-OPEN")
-                self.state = CircuitState.HALF_OPEN
-            else:
-                raise CircuitBreakerError(f"Circuit {self.name} is OPEN")
+        with self._store.transaction() as s:
+            if s.state == CircuitState.OPEN:
+                if time.time() - s.last_failure_time > self.reset_timeout:
+                    logger.info(f"Circuit {self.name} transitioning to HALF-OPEN")
+                    s.state = CircuitState.HALF_OPEN
+                else:
+                    raise CircuitBreakerError(f"Circuit {self.name} is OPEN")
 
     async def _on_success(self):
-        if self.state == CircuitState.HALF_OPEN:
-            logger.info(f"Circuit {self.name} transitioning to CLOSED")
-            self.state = CircuitState.CLOSED
-            self.fail_count = 0
-        elif self.state == CircuitState.CLOSED:
-            self.fail_count = 0
+        with self._store.transaction() as s:
+            if s.state == CircuitState.HALF_OPEN:
+                logger.info(f"Circuit {self.name} transitioning to CLOSED")
+                s.state = CircuitState.CLOSED
+                s.fail_count = 0
+            elif s.state == CircuitState.CLOSED:
+                s.fail_count = 0
 
     async def _on_failure(self, e: Exception):
-        self.fail_count += 1
-        self.last_failure_time = time.time()
+        with self._store.transaction() as s:
+            s.fail_count += 1
+            s.last_failure_time = time.time()
 
-        if self.state == CircuitState.HALF_OPEN or self.fail_count >= self.fail_max:
-            if self.state != CircuitState.OPEN:
-                logger.error(f"Circuit {self.name} transitioning to OPEN due to: {str(e)}")
-            self.state = CircuitState.OPEN
+            if s.state == CircuitState.HALF_OPEN or s.fail_count >= self.fail_max:
+                if s.state != CircuitState.OPEN:
+                    logger.error(f"Circuit {self.name} transitioning to OPEN due to: {str(e)}")
+                s.state = CircuitState.OPEN
 
 class CircuitBreakerError(Exception):
     pass
+
+class ConcurrencyLimitExceeded(Exception):
+    pass
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Per-upstream bulkhead whose limit adapts to observed latency (AIMD).
+
+    Every successful sample under `latency_target` grows the limit by one (only
+    while the current limit is actually being used); a slow or dropped sample
+    shrinks it multiplicatively by `backoff_ratio`. Callers beyond the limit wait
+    in a bounded FIFO queue; when the queue is full, or the wait exceeds
+    `queue_timeout`, `ConcurrencyLimitExceeded` is raised so the gateway can shed
+    load immediately instead of piling up sockets.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        max_queue: int,
+        queue_timeout: float,
+        latency_target: float,
+        backoff_ratio: float = 0.9,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.inflight = 0
+        self.rejected = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def current_limit(self) -> int:
+        return int(self.limit)
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def snapshot(self) -> Dict[str, int]:
+        return {
+            "limit": self.current_limit,
+            "inflight": self.inflight,
+            "queued": self.queued,
+            "rejected": self.rejected,
+        }
+
+    async def acquire(self) -> None:
+        if self.inflight < self.current_limit and not self._waiters:
+            self.inflight += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise ConcurrencyLimitExceeded(f"Concurrency limit reached for {self.name} (queue full)")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=self.queue_timeout)
+        except BaseException as e:
+            # Timed out or cancelled while queued (e.g. client went away). If the slot
+            # was already handed over, give it back so the next waiter can run.
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._discard(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                self.rejected += 1
+                raise ConcurrencyLimitExceeded(
+                    f"Concurrency limit reached for {self.name} (queue timeout)"
+                ) from None
+            raise
+
+    def release(self) -> None:
+        self.inflight = max(0, self.inflight - 1)
+        self._wake_waiters()
+
+    def record(self, latency: float, dropped: bool = False) -> None:
+        """
+        Feed one upstream round-trip into the AIMD controller.
+
+        Args:
+            latency: Observed round-trip time in seconds.
+            dropped: True when the call timed out or failed at transport level.
+        """
+        if dropped or latency > self.latency_target:
+            self.limit = max(float(self.min_limit), self.limit * self.backoff_ratio)
+        elif self.inflight * 2 >= self.current_limit:
+            self.limit = min(float(self.max_limit), self.limit + 1)
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.inflight < self.current_limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.inflight += 1
+            waiter.set_result(None)
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+class LatencyTracker:
+    """
+    Rolling window of recent successful round-trip times per route.
+
+    Used to derive the hedging delay from a latency percentile (e.g. p95): a
+    request still outstanding after that delay is in the slow tail.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, key: str, latency: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(latency)
+
+    def percentile(self, key: str, q: float) -> Optional[float]:
+        samples = self._samples.get(key)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(q * len(ordered)))
+        return ordered[index]
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+class RetryBudget:
+    """
+    Token bucket capping extra attempts (retries and hedges) to a fraction of traffic.
+
+    Each original request deposits `ratio` tokens (up to `max_tokens`); each extra
+    attempt spends one. During an outage the bucket drains quickly, so retries can
+    add at most `ratio` x load on top of the original traffic.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return True
+        return False
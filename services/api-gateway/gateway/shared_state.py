@@ -0,0 +1,217 @@
+"""
+Host-wide gateway state in a memory-mapped file.
+
+When the gateway runs several worker processes, each one would otherwise keep
+its own circuit breakers and rate-limit buckets, so every worker has to
+discover an outage (or a noisy client) on its own. `SharedStateRegion` maps a
+small file (ideally on tmpfs, e.g. `/dev/shm/gateway-state`) into every worker
+and keeps two fixed-size, open-addressed slot tables in it:
+
+- breaker slots: key hash, state, failure count, last failure time
+- bucket slots: key hash, tokens, last refill time
+
+Every read-modify-write happens under an exclusive `flock` on the file, so
+updates are atomic across processes and a breaker trip is seen by all workers
+at once. Bucket timestamps use `time.monotonic()`, which on Linux is a
+system-wide clock and therefore comparable between processes.
+"""
+
+import fcntl
+import hashlib
+import logging
+import math
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+
+from .resilience import BreakerState, CircuitState
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"GWSTATE1"
+HEADER = struct.Struct("<8sII")  # magic, breaker slots, bucket slots
+BREAKER_SLOT = struct.Struct("<QBxxxid")  # key hash, state, fail count, last failure (NaN = never)
+BUCKET_SLOT = struct.Struct("<Qdd")  # key hash, tokens, updated
+
+_STATES = list(CircuitState)
+
+
+def _key_hash(key: str) -> int:
+    # 0 marks an empty slot
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+
+class SharedStateRegion:
+    def __init__(self, path: str, breaker_slots: int = 256, bucket_slots: int = 65536):
+        self.path = path
+        self.breaker_slots = breaker_slots
+        self.bucket_slots = bucket_slots
+        self._breakers_offset = HEADER.size
+        self._buckets_offset = self._breakers_offset + breaker_slots * BREAKER_SLOT.size
+        size = self._buckets_offset + bucket_slots * BUCKET_SLOT.size
+
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            with self.locked():
+                self._attach(size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+        self.mm = mmap.mmap(self._fd, size)
+
+    def _attach(self, size: int) -> None:
+        """
+        Initialize a new (empty) file, or check that an existing one has this
+        layout. Other workers may have the file mapped, so it is never resized
+        or rewritten here: that could crash them (SIGBUS) or corrupt their state.
+        Caller must hold the lock.
+        """
+        expected = HEADER.pack(MAGIC, self.breaker_slots, self.bucket_slots)
+        current_size = os.fstat(self._fd).st_size
+        header = os.pread(self._fd, HEADER.size, 0)
+        if current_size == 0 or (current_size == size and header == bytes(HEADER.size)):
+            # First worker on this host (or one that died before writing the header)
+            logger.info(f"Initializing shared gateway state at {self.path}")
+            os.ftruncate(self._fd, size)
+            os.pwrite(self._fd, expected, 0)
+            return
+        if current_size != size or header != expected:
+            raise RuntimeError(
+                f"Shared state at {self.path} has a different layout ({current_size} bytes) than this "
+                f"worker's {self.breaker_slots} breaker / {self.bucket_slots} bucket slots ({size} bytes). "
+                "Start all workers with the same SHARED_STATE_* settings, or remove the file once no "
+                "gateway process is using it."
+            )
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def breaker_store(self, name: str) -> "SharedBreakerStore":
+        return SharedBreakerStore(self, name)
+
+    def close(self) -> None:
+        self.mm.close()
+        os.close(self._fd)
+
+    def _breaker_offset(self, key: str) -> int:
+        """Find (or claim) the breaker slot for `key`. Caller must hold the lock."""
+        key_hash = _key_hash(key)
+        start = key_hash % self.breaker_slots
+        for probe in range(self.breaker_slots):
+            offset = self._breakers_offset + ((start + probe) % self.breaker_slots) * BREAKER_SLOT.size
+            slot_hash = struct.unpack_from("<Q", self.mm, offset)[0]
+            if slot_hash == key_hash:
+                return offset
+            if slot_hash == 0:
+                BREAKER_SLOT.pack_into(self.mm, offset, key_hash, 0, 0, math.nan)
+                return offset
+        raise RuntimeError(f"Shared state at {self.path} has no free breaker slot for {key}")
+
+
+class SharedBreakerStore:
+    """
+    `BreakerStore` backed by a slot in a `SharedStateRegion`.
+    """
+
+    def __init__(self, region: SharedStateRegion, name: str):
+        self.region = region
+        self.name = name
+        with region.locked():
+            self._offset = region._breaker_offset(name)
+
+    def load(self) -> BreakerState:
+        # Under the writers' lock, so a half-written slot is never seen
+        with self.region.locked():
+            return self._read()
+
+    def _read(self) -> BreakerState:
+        _, state, fail_count, last_failure = BREAKER_SLOT.unpack_from(self.region.mm, self._offset)
+        return BreakerState(
+            state=_STATES[state],
+            fail_count=fail_count,
+            last_failure_time=None if math.isnan(last_failure) else last_failure,
+        )
+
+    @contextmanager
+    def transaction(self) -> Iterator[BreakerState]:
+        with self.region.locked():
+            key_hash = struct.unpack_from("<Q", self.region.mm, self._offset)[0]
+            state = self._read()
+            yield state
+            BREAKER_SLOT.pack_into(
+                self.region.mm,
+                self._offset,
+                key_hash,
+                _STATES.index(state.state),
+                state.fail_count,
+                math.nan if state.last_failure_time is None else state.last_failure_time,
+            )
+
+
+class SharedRateLimiter:
+    """
+    Token buckets in the region's hashed slot table; same interface as
+    `ShardedRateLimiter`. A key probes `probe` consecutive slots; when none
+    holds it, the empty or least recently used one is taken over.
+    """
+
+    def __init__(self, region: SharedStateRegion, probe: int = 8):
+        self.region = region
+        self.probe = probe
+
+    def try_acquire(
+        self, key: str, rate: float, burst: int, now: Optional[float] = None
+    ) -> Tuple[bool, float]:
+        now = time.monotonic() if now is None else now
+        key_hash = _key_hash(key)
+        region = self.region
+        start = key_hash % region.bucket_slots
+
+        with region.locked():
+            target, tokens, updated = None, float(burst), now
+            victim, victim_updated = None, math.inf
+            for probe in range(self.probe):
+                offset = region._buckets_offset + (
+                    (start + probe) % region.bucket_slots
+                ) * BUCKET_SLOT.size
+                slot_hash, slot_tokens, slot_updated = BUCKET_SLOT.unpack_from(region.mm, offset)
+                if slot_hash == key_hash:
+                    target = offset
+                    tokens = min(float(burst), slot_tokens + (now - slot_updated) * rate)
+                    break
+                slot_age = -math.inf if slot_hash == 0 else slot_updated
+                if slot_age < victim_updated:
+                    victim, victim_updated = offset, slot_age
+            if target is None:
+                target = victim
+
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= 1.0
+            BUCKET_SLOT.pack_into(region.mm, target, key_hash, tokens, updated)
+
+        if allowed:
+            return True, 0.0
+        return False, (1.0 - tokens) / rate if rate > 0 else math.inf
+
+    def clear(self) -> None:
+        region = self.region
+        with region.locked():
+            region.mm[region._buckets_offset:] = bytes(len(region.mm) - region._buckets_offset)
+
+    def __len__(self) -> int:
+        region = self.region
+        with region.locked():
+            return sum(
+                1
+                for index in range(region.bucket_slots)
+                if struct.unpack_from("<Q", region.mm, region._buckets_offset + index * BUCKET_SLOT.size)[0]
+            )
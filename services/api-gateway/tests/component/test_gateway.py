@@ -126,3 +126,410 @@ async def test_routing_to_correct_service(client: TestClient):
         response = client.get("/api/v1/auth/me")
         assert response.status_code == 200
         assert response.json()["user"] == "admin"
+
+@pytest.mark.asyncio
+async def test_load_shedding_when_upstream_saturated(client: TestClient):
+    from gateway.main import limiters
+    limiter = limiters["store"]
+    limiter.inflight = limiter.current_limit
+    limiter.max_queue = 0
+
+    try:
+        with respx.mock:
+            route = respx.get(f"{settings.STORE_SERVICE_URL}/api/v1/store/offerings").mock(
+                return_value=httpx.Response(200, json={"items": []})
+            )
+
+            response = client.get("/api/v1/store/offerings")
+            assert response.status_code == 503
+            assert response.json()["error"]["code"] == "SERVICE_OVERLOADED"
+            assert response.headers["Retry-After"] == "1"
+            assert route.call_count == 0
+
+            # Other upstreams keep their own bulkhead
+            respx.get(f"{settings.PRICING_SERVICE_URL}/api/v1/prices").mock(
+                return_value=httpx.Response(200, json=[])
+            )
+            assert client.get("/api/v1/prices").status_code == 200
+    finally:
+        limiter.max_queue = settings.CL_MAX_QUEUE
+
+@pytest.mark.asyncio
+async def test_get_retried_on_unavailable_upstream(client: TestClient):
+    from common.metrics import metrics
+
+    with respx.mock:
+        route = respx.get(f"{settings.SPECIFICATION_SERVICE_URL}/api/v1/specifications").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json=[])]
+        )
+
+        response = client.get("/api/v1/specifications")
+        assert response.status_code == 200
+        assert route.call_count == 2
+        assert metrics.get("gateway_retries_total", service="specification") == 1
+
+@pytest.mark.asyncio
+async def test_retries_stop_when_budget_exhausted(client: TestClient):
+    from common.metrics import metrics
+    from gateway.main import retry_budgets
+
+    retry_budgets["specification"].tokens = 0
+
+    with respx.mock:
+        route = respx.get(f"{settings.SPECIFICATION_SERVICE_URL}/api/v1/specifications").mock(
+            return_value=httpx.Response(503)
+        )
+
+        response = client.get("/api/v1/specifications")
+        assert response.status_code == 503
+        assert route.call_count == 1
+        assert metrics.get("gateway_retry_budget_exhausted_total", service="specification") == 1
+
+@pytest.mark.asyncio
+async def test_writes_are_not_retried(client: TestClient):
+    with respx.mock:
+        route = respx.post(f"{settings.SPECIFICATION_SERVICE_URL}/api/v1/specifications").mock(
+            return_value=httpx.Response(503)
+        )
+
+        response = client.post("/api/v1/specifications", json={})
+        assert response.status_code == 503
+        assert route.call_count == 1
+
+@pytest.mark.asyncio
+async def test_slow_get_is_hedged(client: TestClient, monkeypatch):
+    import asyncio
+
+    from common.metrics import metrics
+    from gateway.main import latency_tracker
+
+    monkeypatch.setattr(settings, "HEDGE_ENABLED", True)
+    for _ in range(settings.HEDGE_MIN_SAMPLES):
+        latency_tracker.record("pricing:api/v1/prices/:id", 0.01)
+
+    calls = []
+
+    async def slow_then_fast(request):
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(1.0)
+            return httpx.Response(200, json={"attempt": "primary"})
+        return httpx.Response(200, json={"attempt": "hedge"})
+
+    with respx.mock:
+        respx.get(f"{settings.PRICING_SERVICE_URL}/api/v1/prices/42").mock(
+            side_effect=slow_then_fast
+        )
+
+        response = client.get("/api/v1/prices/42")
+        assert response.status_code == 200
+        assert response.json()["attempt"] == "hedge"
+        assert metrics.get("gateway_hedged_requests_total", service="pricing") == 1
+        assert metrics.get("gateway_hedge_wins_total", service="pricing") == 1
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: TestClient):
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert set(response.json()) == {"counters", "gauges", "timings"}
+
+@pytest.mark.asyncio
+async def test_requests_balanced_across_replicas(client: TestClient, monkeypatch):
+    from gateway import main
+
+    pool = main.UpstreamPool(
+        name="offering",
+        urls=["http://offering-1:8005", "http://offering-2:8005"],
+        fail_max=settings.CB_FAILURE_THRESHOLD,
+        reset_timeout=settings.CB_RESET_TIMEOUT,
+    )
+    monkeypatch.setitem(main.pools, "offering", pool)
+    # Deterministic tie-break: the failing replica is tried first while available
+    monkeypatch.setattr("gateway.balancer.random.sample", lambda seq, k: list(seq)[:k])
+
+    with respx.mock:
+        failing = respx.get("http://offering-1:8005/api/v1/offerings").mock(
+            side_effect=httpx.ConnectError("refused")
+        )
+        healthy = respx.get("http://offering-2:8005/api/v1/offerings").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+
+        # Failed attempts are retried on the other replica, so every call succeeds
+        for _ in range(6):
+            assert client.get("/api/v1/offerings").status_code == 200
+
+        # The failing replica is ejected once its endpoint breaker opens
+        assert pool.endpoints[0].breaker.current_state == "open"
+        assert failing.call_count == settings.CB_FAILURE_THRESHOLD
+        assert healthy.call_count == 6
+
+@pytest.mark.asyncio
+async def test_deadline_header_forwarded_to_upstream(client: TestClient):
+    captured = {}
+
+    def capture(request):
+        captured["deadline"] = int(request.headers["X-Request-Deadline-Ms"])
+        return httpx.Response(200, json=[])
+
+    with respx.mock:
+        respx.get(f"{settings.PRICING_SERVICE_URL}/api/v1/prices").mock(side_effect=capture)
+
+        assert client.get("/api/v1/prices").status_code == 200
+        assert 0 < captured["deadline"] <= settings.UPSTREAM_DEADLINE * 1000
+
+        # A tighter client deadline caps the budget passed downstream
+        response = client.get("/api/v1/prices", headers={"X-Request-Deadline-Ms": "500"})
+        assert response.status_code == 200
+        assert 0 < captured["deadline"] <= 500
+
+@pytest.mark.asyncio
+async def test_upstream_call_cancelled_on_client_disconnect():
+    import asyncio
+
+    from common.metrics import metrics
+    from gateway.main import app, limiters
+
+    upstream = {"cancelled": False}
+
+    async def hang(request):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            upstream["cancelled"] = True
+            raise
+        return httpx.Response(200, json=[])
+
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.sleep(0.05)
+        return {"type": "http.disconnect"}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/store/offerings",
+        "raw_path": b"/api/v1/store/offerings",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"testserver")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+
+    with respx.mock:
+        respx.get(f"{settings.STORE_SERVICE_URL}/api/v1/store/offerings").mock(side_effect=hang)
+        await asyncio.wait_for(app(scope, receive, send), timeout=2)
+
+    assert upstream["cancelled"]
+    assert sent[0]["status"] == 499
+    assert limiters["store"].inflight == 0
+    assert metrics.get("gateway_client_disconnects_total") == 1
+
+@pytest.mark.asyncio
+async def test_batch_fans_out_sub_requests(client: TestClient):
+    captured = {}
+
+    def create_price(request):
+        captured["body"] = request.content
+        captured["auth"] = request.headers.get("authorization")
+        return httpx.Response(201, json={"id": "p-1"})
+
+    with respx.mock:
+        respx.get(f"{settings.CHARACTERISTIC_SERVICE_URL}/api/v1/characteristics").mock(
+            return_value=httpx.Response(200, json=[{"id": "c-1"}])
+        )
+        respx.get(f"{settings.OFFERING_SERVICE_URL}/api/v1/offerings/42").mock(
+            return_value=httpx.Response(404, json={"error": {"code": "NOT_FOUND"}})
+        )
+        respx.post(f"{settings.PRICING_SERVICE_URL}/api/v1/prices").mock(side_effect=create_price)
+
+        response = client.post(
+            "/api/v1/batch",
+            headers={"Authorization": "Bearer token"},
+            json={
+                "requests": [
+                    {"id": "chars", "path": "/api/v1/characteristics?limit=10"},
+                    {"id": "offering", "path": "/api/v1/offerings/42"},
+                    {"id": "price", "method": "POST", "path": "/api/v1/prices", "body": {"name": "P"}},
+                    {"id": "unknown", "path": "/api/v1/unknown"},
+                ]
+            },
+        )
+
+    assert response.status_code == 200
+    results = {item["id"]: item for item in response.json()["responses"]}
+    assert results["chars"]["status"] == 200
+    assert results["chars"]["body"] == [{"id": "c-1"}]
+    assert results["offering"]["status"] == 404
+    assert results["price"]["status"] == 201
+    assert results["unknown"]["status"] == 404
+    assert captured["body"] == b'{"name": "P"}'
+    assert captured["auth"] == "Bearer token"
+
+@pytest.mark.asyncio
+async def test_batch_rejects_too_many_requests(client: TestClient):
+    response = client.post(
+        "/api/v1/batch",
+        json={"requests": [{"path": "/api/v1/prices"}] * (settings.BATCH_MAX_REQUESTS + 1)},
+    )
+    assert response.status_code == 400
+    assert response.json()["error"]["code"] == "BATCH_TOO_LARGE"
+
+@pytest.mark.asyncio
+async def test_large_responses_are_gzip_compressed(client: TestClient):
+    from gateway.main import compressor
+
+    items = [{"id": str(i), "name": f"Offering {i}"} for i in range(200)]
+
+    with respx.mock:
+        respx.get(f"{settings.STORE_SERVICE_URL}/api/v1/store/offerings").mock(
+            return_value=httpx.Response(200, json={"items": items})
+        )
+
+        response = client.get("/api/v1/store/offerings", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert response.json()["items"] == items
+
+        # The same payload again is served from the compressed-body cache
+        client.get("/api/v1/store/offerings", headers={"Accept-Encoding": "gzip"})
+        assert compressor.hits == 1
+
+        plain = client.get("/api/v1/store/offerings", headers={"Accept-Encoding": "identity"})
+        assert "Content-Encoding" not in plain.headers
+        assert plain.json()["items"] == items
+
+@pytest.mark.asyncio
+async def test_small_responses_are_not_compressed(client: TestClient):
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+
+@pytest.mark.asyncio
+async def test_rate_limit_per_client_and_route(client: TestClient, monkeypatch, rsa_keys, make_token):
+    from gateway.main import edge_auth
+
+    monkeypatch.setattr(settings, "EDGE_AUTH_ENABLED", True)
+    monkeypatch.setattr(edge_auth, "public_key", rsa_keys[1])
+    monkeypatch.setattr(settings, "RATE_LIMITS", {"/api/v1/store/search": (0.001, 2)})
+    alice = {"Authorization": f"Bearer {make_token(sub='alice')}"}
+    bob = {"Authorization": f"Bearer {make_token(sub='bob')}"}
+
+    with respx.mock:
+        search = respx.get(f"{settings.STORE_SERVICE_URL}/api/v1/store/search").mock(
+            return_value=httpx.Response(200, json={"items": []})
+        )
+        respx.get(f"{settings.STORE_SERVICE_URL}/api/v1/store/offerings").mock(
+            return_value=httpx.Response(200, json={"items": []})
+        )
+
+        assert client.get("/api/v1/store/search", headers=alice).status_code == 200
+        assert client.get("/api/v1/store/search", headers=alice).status_code == 200
+
+        limited = client.get("/api/v1/store/search", headers=alice)
+        assert limited.status_code == 429
+        assert limited.json()["error"]["code"] == "RATE_LIMITED"
+        assert int(limited.headers["Retry-After"]) >= 1
+        assert search.call_count == 2
+
+        # Other verified clients and other routes keep their own budget
+        assert client.get("/api/v1/store/search", headers=bob).status_code == 200
+        assert client.get("/api/v1/store/offerings", headers=alice).status_code == 200
+
+@pytest.mark.asyncio
+async def test_rate_limit_ignores_unverified_subjects(client: TestClient, monkeypatch):
+    from jose import jwt
+
+    monkeypatch.setattr(settings, "RATE_LIMITS", {"/api/v1/store/search": (0.001, 2)})
+
+    with respx.mock:
+        respx.get(f"{settings.STORE_SERVICE_URL}/api/v1/store/search").mock(
+            return_value=httpx.Response(200, json={"items": []})
+        )
+
+        # A forged token with a fresh `sub` per request still draws from the one IP bucket
+        statuses = [
+            client.get(
+                "/api/v1/store/search",
+                headers={"Authorization": f"Bearer {jwt.encode({'sub': f'forged-{i}'}, 'k', algorithm='HS256')}"},
+            ).status_code
+            for i in range(3)
+        ]
+        assert statuses == [200, 200, 429]
+
+@pytest.mark.asyncio
+async def test_edge_auth_forwards_signed_identity(
+    client: TestClient, monkeypatch, rsa_keys, make_token
+):
+    from common.security import verify_internal_identity
+    from gateway.main import edge_auth
+
+    monkeypatch.setattr(settings, "EDGE_AUTH_ENABLED", True)
+    monkeypatch.setattr(settings, "INTERNAL_IDENTITY_SECRET", "shared-secret")
+    monkeypatch.setattr(edge_auth, "public_key", rsa_keys[1])
+    token = make_token()
+    captured = {}
+
+    def capture(request):
+        captured["identity"] = request.headers.get("X-Internal-Identity")
+        return httpx.Response(200, json=[])
+
+    with respx.mock:
+        respx.get(f"{settings.PRICING_SERVICE_URL}/api/v1/prices").mock(side_effect=capture)
+
+        response = client.get("/api/v1/prices", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        user = verify_internal_identity(captured["identity"], "shared-secret", token)
+        assert user.user_id == "u-1"
+
+        # A client-supplied identity is never passed through
+        client.get(
+            "/api/v1/prices",
+            headers={"Authorization": "Bearer invalid", "X-Internal-Identity": "forged.value"},
+        )
+        assert captured["identity"] is None
+
+@pytest.mark.asyncio
+async def test_health_dependencies_served_from_prober_cache(client: TestClient, monkeypatch):
+    from gateway.main import breakers, prober
+
+    monkeypatch.setattr(type(prober), "running", property(lambda self: True))
+
+    with respx.mock:
+        for name in breakers:
+            respx.get(f"{settings.service_urls(name)[0]}/health").mock(
+                return_value=httpx.Response(200)
+            )
+        down = respx.get(f"{settings.PRICING_SERVICE_URL}/health").mock(
+            side_effect=httpx.ConnectError("refused")
+        )
+
+        first = client.get("/health/dependencies").json()
+        assert first["dependencies"]["pricing"] == "unreachable"
+        assert first["status"] == "degraded"
+        assert first["circuit_breakers"]["pricing"] == "open"
+
+        # Cached: a second call does not probe again
+        second = client.get("/health/dependencies").json()
+        assert second["probe"]["checked_at"] == first["probe"]["checked_at"]
+        assert down.call_count == 1
+
+        # The pre-opened breaker rejects user traffic without calling the upstream
+        prices = respx.get(f"{settings.PRICING_SERVICE_URL}/api/v1/prices").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        assert client.get("/api/v1/prices").status_code == 503
+        assert prices.call_count == 0
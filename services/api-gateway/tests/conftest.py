@@ -1,15 +1,35 @@
 import os
 import sys
+import time
 
 import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi.testclient import TestClient
 
 # Add src to path
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
 sys.path.insert(0, BASE_DIR)
 
-from gateway.main import app, breakers  # noqa: E402
+# Background probes would eject the (mocked) upstreams between tests
+os.environ.setdefault("HEALTH_PROBE_ENABLED", "false")
+
+from common.metrics import metrics  # noqa: E402
+from gateway.config import settings  # noqa: E402
+from gateway.main import (  # noqa: E402
+    app,
+    breakers,
+    compressor,
+    edge_auth,
+    latency_tracker,
+    limiters,
+    pools,
+    prober,
+    rate_limiter,
+    retry_budgets,
+)
 from gateway.resilience import CircuitState  # noqa: E402
+from jose import jwt  # noqa: E402
 
 
 @pytest.fixture
@@ -19,8 +39,51 @@ def client():
 
 @pytest.fixture(autouse=True)
 def reset_breakers():
-    """Reset all circuit breakers between tests."""
+    """Reset breakers, upstream pools, concurrency limiters and retry state between tests."""
     for breaker in breakers.values():
         breaker.state = CircuitState.CLOSED
         breaker.fail_count = 0
+    for pool in pools.values():
+        for endpoint in pool.endpoints:
+            endpoint.breaker.state = CircuitState.CLOSED
+            endpoint.breaker.fail_count = 0
+            endpoint.healthy = True
+            endpoint.outstanding = 0
+    for limiter in limiters.values():
+        limiter.limit = float(settings.CL_INITIAL_LIMIT)
+        limiter.inflight = 0
+        limiter.rejected = 0
+    for budget in retry_budgets.values():
+        budget.tokens = budget.max_tokens
+    latency_tracker.clear()
+    metrics.reset()
+    compressor.clear()
+    rate_limiter.clear()
+    edge_auth.clear()
+    prober.clear()
     yield
+
+
+@pytest.fixture(scope="session")
+def rsa_keys():
+    """(private_pem, public_pem) pair for signing test JWTs."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    return private_pem, public_pem
+
+
+@pytest.fixture
+def make_token(rsa_keys):
+    def _make_token(**claims) -> str:
+        payload = {"sub": "u-1", "username": "alice", "role": "ADMIN", "exp": time.time() + 600}
+        payload.update(claims)
+        return jwt.encode(payload, rsa_keys[0], algorithm="RS256")
+
+    return _make_token
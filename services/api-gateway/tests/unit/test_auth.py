@@ -0,0 +1,42 @@
+import time
+
+from gateway.auth import EdgeAuthenticator
+
+
+def make_authenticator(public_key, cache_size: int = 10) -> EdgeAuthenticator:
+    auth = EdgeAuthenticator(algorithm="RS256", cache_size=cache_size)
+    auth.set_public_key(public_key)
+    return auth
+
+
+def test_verify_valid_token_and_cache_it(rsa_keys, make_token, monkeypatch):
+    auth = make_authenticator(rsa_keys[1])
+    token = make_token()
+
+    user = auth.verify(token)
+    assert user.user_id == "u-1" and user.role == "ADMIN"
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("token should be served from the cache")
+
+    monkeypatch.setattr("gateway.auth.jwt.decode", fail_decode)
+    assert auth.verify(token) == user
+
+
+def test_verify_rejects_bad_tokens(rsa_keys, make_token):
+    auth = make_authenticator(rsa_keys[1])
+
+    assert auth.verify("not-a-jwt") is None
+    assert auth.verify(make_token(exp=time.time() - 10)) is None
+    assert auth.verify(make_token(role=None)) is None
+
+
+def test_verify_without_public_key_defers_to_services(make_token):
+    assert make_authenticator(None).verify(make_token()) is None
+
+
+def test_cache_is_bounded(rsa_keys, make_token):
+    auth = make_authenticator(rsa_keys[1], cache_size=1)
+    auth.verify(make_token(sub="a"))
+    auth.verify(make_token(sub="b"))
+    assert len(auth._cache) == 1
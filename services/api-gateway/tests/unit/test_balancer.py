@@ -0,0 +1,86 @@
+import httpx
+import pytest
+import respx
+from gateway.balancer import UpstreamPool
+from gateway.resilience import CircuitState
+
+
+def make_pool(*urls: str) -> UpstreamPool:
+    return UpstreamPool(name="store", urls=list(urls), fail_max=2, reset_timeout=30.0)
+
+
+def test_single_endpoint_is_always_chosen():
+    pool = make_pool("http://store-1")
+    assert pool.choose().url == "http://store-1"
+
+
+def test_choose_prefers_fewer_outstanding_requests():
+    pool = make_pool("http://store-1", "http://store-2")
+    busy, idle = pool.endpoints
+    busy.outstanding = 5
+
+    for _ in range(20):
+        assert pool.choose() is idle
+
+
+def test_choose_skips_ejected_endpoints():
+    pool = make_pool("http://store-1", "http://store-2", "http://store-3")
+    first, second, third = pool.endpoints
+    first.healthy = False
+    second.breaker.state = CircuitState.OPEN
+    second.breaker.last_failure_time = 10**12
+
+    for _ in range(20):
+        assert pool.choose() is third
+
+
+def test_choose_avoids_already_tried_endpoint():
+    pool = make_pool("http://store-1", "http://store-2")
+    first, second = pool.endpoints
+
+    for _ in range(20):
+        assert pool.choose(exclude={first}) is second
+
+
+def test_choose_falls_back_when_all_ejected():
+    pool = make_pool("http://store-1", "http://store-2")
+    for endpoint in pool.endpoints:
+        endpoint.healthy = False
+
+    assert pool.choose() in pool.endpoints
+
+
+@pytest.mark.asyncio
+async def test_endpoint_breaker_opens_after_failures():
+    pool = make_pool("http://store-1")
+    endpoint = pool.endpoints[0]
+
+    async def failing():
+        raise httpx.ConnectError("refused")
+
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            await endpoint.call(failing)
+
+    assert endpoint.breaker.current_state == "open"
+    assert not endpoint.available
+    assert endpoint.outstanding == 0
+
+
+@pytest.mark.asyncio
+async def test_probe_ejects_and_readmits_endpoints():
+    pool = make_pool("http://store-1", "http://store-2")
+    first, second = pool.endpoints
+
+    with respx.mock:
+        respx.get("http://store-1/health").mock(return_value=httpx.Response(200))
+        down = respx.get("http://store-2/health").mock(side_effect=httpx.ConnectError("down"))
+
+        async with httpx.AsyncClient() as client:
+            results = await pool.probe(client)
+            assert results == {"http://store-1": "healthy", "http://store-2": "unreachable"}
+            assert first.healthy and not second.healthy
+
+            down.mock(return_value=httpx.Response(200))
+            await pool.probe(client)
+            assert second.healthy
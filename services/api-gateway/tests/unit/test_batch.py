@@ -0,0 +1,19 @@
+from gateway.batch import render_body, resolve_route
+
+
+def test_resolve_route_maps_prefix_to_service():
+    assert resolve_route("/api/v1/prices") == ("pricing", "api/v1/prices")
+    assert resolve_route("/api/v1/offerings/123") == ("offering", "api/v1/offerings/123")
+    assert resolve_route("/api/v1/auth/me") == ("identity", "api/v1/auth/me")
+
+
+def test_resolve_route_rejects_unknown_paths():
+    assert resolve_route("/api/v1/batch") is None
+    assert resolve_route("/api/v1/pricesx") is None
+    assert resolve_route("/health") is None
+
+
+def test_render_body_decodes_json_and_text():
+    assert render_body(b'{"a": 1}', "application/json") == {"a": 1}
+    assert render_body(b"plain", "text/plain") == "plain"
+    assert render_body(b"", "application/json") is None
@@ -0,0 +1,53 @@
+import gzip
+
+import pytest
+from gateway import compression
+from gateway.compression import ResponseCompressor, negotiate_encoding
+
+
+def make_compressor(**overrides) -> ResponseCompressor:
+    params = dict(min_size=10, gzip_level=6, brotli_quality=5, workers=1, cache_size=2)
+    params.update(overrides)
+    return ResponseCompressor(**params)
+
+
+def test_negotiate_encoding_prefers_supported_encodings(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    assert negotiate_encoding("gzip, deflate, br") == "gzip"
+    assert negotiate_encoding("deflate") is None
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("*") == "gzip"
+    assert negotiate_encoding("") is None
+
+
+def test_negotiate_encoding_uses_brotli_when_available(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", object())
+    assert negotiate_encoding("gzip, br") == "br"
+    assert negotiate_encoding("gzip, br;q=0") == "gzip"
+
+
+@pytest.mark.asyncio
+async def test_compressor_caches_compressed_bodies():
+    compressor = make_compressor()
+    body = b'{"items": []}' * 100
+
+    first = await compressor.compress(body, "gzip")
+    second = await compressor.compress(body, "gzip")
+
+    assert gzip.decompress(first) == body
+    assert second is first
+    assert (compressor.hits, compressor.misses) == (1, 1)
+    compressor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_compressor_cache_is_bounded():
+    compressor = make_compressor(cache_size=1)
+
+    await compressor.compress(b"a" * 100, "gzip")
+    await compressor.compress(b"b" * 100, "gzip")
+    await compressor.compress(b"a" * 100, "gzip")
+
+    assert compressor.hits == 0
+    assert compressor.misses == 3
+    compressor.shutdown()
@@ -0,0 +1,60 @@
+import httpx
+import pytest
+import respx
+from gateway.balancer import UpstreamPool
+from gateway.health import HealthProber, service_status
+from gateway.resilience import AsyncCircuitBreaker
+
+
+def make_prober():
+    pools = {
+        "pricing": UpstreamPool("pricing", ["http://pricing"], fail_max=3, reset_timeout=20),
+        "store": UpstreamPool("store", ["http://store-1", "http://store-2"], fail_max=3, reset_timeout=20),
+    }
+    breakers = {
+        name: AsyncCircuitBreaker(fail_max=3, reset_timeout=20, name=name) for name in pools
+    }
+    return HealthProber(pools, breakers, interval=10, timeout=1), breakers
+
+
+def test_service_status():
+    assert service_status({"a": "unreachable", "b": "healthy"}) == "healthy"
+    assert service_status({"a": "unreachable", "b": "unhealthy"}) == "unhealthy"
+    assert service_status({"a": "unreachable"}) == "unreachable"
+
+
+@pytest.mark.asyncio
+async def test_prober_caches_status_and_preopens_breakers():
+    prober, breakers = make_prober()
+
+    with respx.mock:
+        pricing = respx.get("http://pricing/health").mock(side_effect=httpx.ConnectError("down"))
+        respx.get("http://store-1/health").mock(return_value=httpx.Response(503))
+        respx.get("http://store-2/health").mock(return_value=httpx.Response(200))
+
+        await prober.probe_once()
+        assert prober.summary() == {"pricing": "unreachable", "store": "healthy"}
+        assert prober.checked_at is not None
+        assert breakers["pricing"].current_state == "open"
+        assert breakers["store"].current_state == "closed"
+
+        # Recovery closes the breaker the prober opened
+        pricing.mock(return_value=httpx.Response(200))
+        await prober.probe_once()
+        assert breakers["pricing"].current_state == "closed"
+
+    await prober.stop()
+
+
+@pytest.mark.asyncio
+async def test_prober_leaves_failure_opened_breakers_alone():
+    prober, breakers = make_prober()
+    breakers["pricing"].force_open("calls failing")
+
+    with respx.mock:
+        respx.get("http://pricing/health").mock(return_value=httpx.Response(200))
+        respx.get(url__startswith="http://store").mock(return_value=httpx.Response(200))
+        await prober.probe_once()
+
+    assert breakers["pricing"].current_state == "open"
+    await prober.stop()
@@ -0,0 +1,48 @@
+import pytest
+from gateway.ratelimit import ShardedRateLimiter, match_route_limit
+
+
+def test_bucket_allows_burst_then_rejects():
+    limiter = ShardedRateLimiter(shards=4)
+
+    for _ in range(3):
+        assert limiter.try_acquire("client", rate=1.0, burst=3, now=0.0) == (True, 0.0)
+
+    allowed, retry_after = limiter.try_acquire("client", rate=1.0, burst=3, now=0.0)
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+
+def test_bucket_refills_lazily():
+    limiter = ShardedRateLimiter(shards=4)
+    limiter.try_acquire("client", rate=2.0, burst=1, now=0.0)
+
+    assert not limiter.try_acquire("client", rate=2.0, burst=1, now=0.25)[0]
+    assert limiter.try_acquire("client", rate=2.0, burst=1, now=0.75)[0]
+
+
+def test_buckets_are_independent_per_key():
+    limiter = ShardedRateLimiter(shards=4)
+    assert limiter.try_acquire("a", rate=1.0, burst=1, now=0.0)[0]
+    assert limiter.try_acquire("b", rate=1.0, burst=1, now=0.0)[0]
+    assert not limiter.try_acquire("a", rate=1.0, burst=1, now=0.0)[0]
+
+
+def test_idle_buckets_are_evicted():
+    limiter = ShardedRateLimiter(shards=2, idle_ttl=10.0)
+    for key in ("a", "b", "c", "d"):
+        limiter.try_acquire(key, rate=1.0, burst=1, now=0.0)
+    assert len(limiter) == 4
+
+    # Each call sweeps one shard, so two calls cover both
+    limiter.try_acquire("e", rate=1.0, burst=1, now=100.0)
+    limiter.try_acquire("e", rate=1.0, burst=1, now=100.0)
+    assert len(limiter) == 1
+
+
+def test_longest_prefix_wins():
+    limits = {"/api/v1": (50.0, 100), "/api/v1/store/search": (5.0, 10)}
+
+    assert match_route_limit("/api/v1/store/search", limits) == ("/api/v1/store/search", 5.0, 10)
+    assert match_route_limit("/api/v1/prices", limits) == ("/api/v1", 50.0, 100)
+    assert match_route_limit("/health", limits) is None
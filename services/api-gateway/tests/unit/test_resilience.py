@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+from gateway.resilience import (
+    AdaptiveConcurrencyLimiter,
+    ConcurrencyLimitExceeded,
+    LatencyTracker,
+    RetryBudget,
+)
+
+
+def make_limiter(**overrides) -> AdaptiveConcurrencyLimiter:
+    params = dict(
+        name="test",
+        initial_limit=2,
+        min_limit=1,
+        max_limit=10,
+        max_queue=1,
+        queue_timeout=0.05,
+        latency_target=0.5,
+    )
+    params.update(overrides)
+    return AdaptiveConcurrencyLimiter(**params)
+
+
+@pytest.mark.asyncio
+async def test_limiter_admits_up_to_limit():
+    limiter = make_limiter()
+
+    await limiter.acquire()
+    await limiter.acquire()
+
+    assert limiter.inflight == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_sheds_when_queue_full():
+    limiter = make_limiter()
+    await limiter.acquire()
+    await limiter.acquire()
+
+    queued = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+
+    with pytest.raises(ConcurrencyLimitExceeded):
+        await limiter.acquire()
+    assert limiter.rejected == 1
+
+    limiter.release()
+    await queued
+    assert limiter.inflight == 2
+    assert limiter.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_queue_timeout():
+    limiter = make_limiter(initial_limit=1)
+    await limiter.acquire()
+
+    with pytest.raises(ConcurrencyLimitExceeded):
+        await limiter.acquire()
+    assert limiter.queued == 0
+    assert limiter.inflight == 1
+
+
+def test_limiter_additive_increase_and_multiplicative_decrease():
+    limiter = make_limiter(initial_limit=4)
+    limiter.inflight = 4
+
+    limiter.record(0.1)
+    assert limiter.current_limit == 5
+
+    limiter.record(2.0)
+    assert limiter.limit == pytest.approx(4.5)
+
+    limiter.record(0.1, dropped=True)
+    assert limiter.limit == pytest.approx(4.05)
+
+
+def test_limiter_does_not_grow_when_underused():
+    limiter = make_limiter(initial_limit=8)
+    limiter.inflight = 1
+
+    limiter.record(0.1)
+    assert limiter.current_limit == 8
+
+
+def test_limiter_respects_bounds():
+    limiter = make_limiter(initial_limit=1, min_limit=1, max_limit=2)
+    for _ in range(10):
+        limiter.record(5.0)
+    assert limiter.current_limit == 1
+
+    limiter.inflight = 2
+    for _ in range(10):
+        limiter.record(0.01)
+    assert limiter.current_limit == 2
+
+
+def test_latency_tracker_needs_min_samples():
+    tracker = LatencyTracker(window=10, min_samples=3)
+    tracker.record("store:/offerings", 0.1)
+    tracker.record("store:/offerings", 0.2)
+    assert tracker.percentile("store:/offerings", 0.95) is None
+
+    tracker.record("store:/offerings", 0.3)
+    assert tracker.percentile("store:/offerings", 0.95) == pytest.approx(0.3)
+    assert tracker.percentile("store:/other", 0.95) is None
+
+
+def test_latency_tracker_keeps_rolling_window():
+    tracker = LatencyTracker(window=5, min_samples=1)
+    for latency in [5.0] * 5 + [0.1] * 5:
+        tracker.record("key", latency)
+    assert tracker.percentile("key", 0.99) == pytest.approx(0.1)
+
+
+def test_retry_budget_caps_extra_attempts():
+    budget = RetryBudget(ratio=0.5, max_tokens=2.0)
+
+    assert budget.try_spend()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+    budget.deposit()
+    assert not budget.try_spend()
+    budget.deposit()
+    assert budget.try_spend()
+
+
+def test_retry_budget_deposits_are_capped():
+    budget = RetryBudget(ratio=1.0, max_tokens=2.0)
+    for _ in range(10):
+        budget.deposit()
+    assert budget.tokens == 2.0
@@ -0,0 +1,117 @@
+import multiprocessing
+
+import pytest
+from gateway.resilience import AsyncCircuitBreaker, CircuitBreakerError, CircuitState
+from gateway.shared_state import SharedRateLimiter, SharedStateRegion
+
+
+def make_region(tmp_path, **kwargs):
+    kwargs.setdefault("breaker_slots", 16)
+    kwargs.setdefault("bucket_slots", 64)
+    return SharedStateRegion(str(tmp_path / "gateway-state"), **kwargs)
+
+
+async def fail():
+    raise ValueError("upstream error")
+
+
+@pytest.mark.asyncio
+async def test_breaker_trip_is_visible_to_other_workers(tmp_path):
+    worker_a, worker_b = make_region(tmp_path), make_region(tmp_path)
+    breaker_a = AsyncCircuitBreaker(
+        fail_max=2, reset_timeout=30, name="pricing", store=worker_a.breaker_store("pricing")
+    )
+    breaker_b = AsyncCircuitBreaker(
+        fail_max=2, reset_timeout=30, name="pricing", store=worker_b.breaker_store("pricing")
+    )
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await breaker_a.call(fail)
+
+    assert breaker_b.state == CircuitState.OPEN
+    assert breaker_b.fail_count == 2
+    with pytest.raises(CircuitBreakerError):
+        await breaker_b.call(fail)
+
+    breaker_b.reset()
+    assert breaker_a.current_state == "closed"
+    assert breaker_a.fail_count == 0
+
+
+def test_breakers_get_separate_slots(tmp_path):
+    region = make_region(tmp_path)
+    pricing = AsyncCircuitBreaker(3, 30, "pricing", store=region.breaker_store("pricing"))
+    store = AsyncCircuitBreaker(3, 30, "store", store=region.breaker_store("store"))
+
+    pricing.force_open("probe failed")
+    assert pricing.state == CircuitState.OPEN
+    assert store.state == CircuitState.CLOSED
+
+
+def test_layout_mismatch_refuses_to_attach(tmp_path):
+    region = make_region(tmp_path)
+    AsyncCircuitBreaker(3, 30, "pricing", store=region.breaker_store("pricing")).force_open("x")
+
+    with pytest.raises(RuntimeError, match="different layout"):
+        make_region(tmp_path, breaker_slots=32)
+    # The running worker's mapping is left intact
+    assert region.breaker_store("pricing").load().state == CircuitState.OPEN
+
+
+def test_region_left_without_header_is_initialized(tmp_path):
+    region = make_region(tmp_path)
+    size = len(region.mm)
+    region.close()
+    with open(tmp_path / "gateway-state", "wb") as f:
+        f.truncate(size)
+
+    assert make_region(tmp_path).breaker_store("pricing").load().state == CircuitState.CLOSED
+
+
+def test_rate_limit_buckets_are_shared(tmp_path):
+    limiter_a = SharedRateLimiter(make_region(tmp_path))
+    limiter_b = SharedRateLimiter(make_region(tmp_path))
+
+    assert limiter_a.try_acquire("client", rate=1.0, burst=2, now=0.0) == (True, 0.0)
+    assert limiter_b.try_acquire("client", rate=1.0, burst=2, now=0.0) == (True, 0.0)
+    allowed, retry_after = limiter_a.try_acquire("client", rate=1.0, burst=2, now=0.0)
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+    assert limiter_b.try_acquire("client", rate=1.0, burst=2, now=1.0)[0]
+    assert len(limiter_a) == 1
+    limiter_b.clear()
+    assert len(limiter_a) == 0
+
+
+def test_full_probe_window_evicts_least_recently_used(tmp_path):
+    limiter = SharedRateLimiter(make_region(tmp_path, bucket_slots=2), probe=2)
+
+    limiter.try_acquire("a", rate=1.0, burst=1, now=0.0)
+    limiter.try_acquire("b", rate=1.0, burst=1, now=1.0)
+    limiter.try_acquire("c", rate=1.0, burst=1, now=2.0)
+
+    assert len(limiter) == 2
+    # "a" was evicted, so it starts again from a full bucket
+    assert limiter.try_acquire("a", rate=1.0, burst=1, now=2.0)[0]
+
+
+def _record_failures(path: str, count: int) -> None:
+    store = SharedStateRegion(path, breaker_slots=16, bucket_slots=64).breaker_store("offering")
+    for _ in range(count):
+        with store.transaction() as state:
+            state.fail_count += 1
+
+
+def test_updates_are_atomic_across_processes(tmp_path):
+    path = str(tmp_path / "gateway-state")
+    region = SharedStateRegion(path, breaker_slots=16, bucket_slots=64)
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_record_failures, args=(path, 200)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert region.breaker_store("offering").load().fail_count == 800
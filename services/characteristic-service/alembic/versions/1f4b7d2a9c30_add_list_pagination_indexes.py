@@ -0,0 +1,52 @@
+"""add_list_pagination_indexes
+
+Revision ID: 1f4b7d2a9c30
+Revises: 700000000000
+Create Date: 2026-10-19 14:05:32.118407
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '1f4b7d2a9c30'
+down_revision: Union[str, Sequence[str], None] = '700000000000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside the migration transaction, and keeps the
+    # table writable while existing rows are indexed
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_characteristics_created_at_id',
+            'characteristics',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_characteristics_unit_of_measure_created_at_id',
+            'characteristics',
+            ['unit_of_measure', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_characteristics_unit_of_measure_created_at_id',
+            table_name='characteristics',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_characteristics_created_at_id',
+            table_name='characteristics',
+            postgresql_concurrently=True,
+        )
@@ -1,9 +1,13 @@
 import uuid
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from common.database.changefeed import read_changes
+from common.database.pagination import Page
+from common.database.unit_of_work import UnitOfWork
 from common.exceptions import ConflictError, NotFoundError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..domain.models import UnitOfMeasure
 from ..infrastructure.models import CharacteristicORM, OutboxORM
 from ..infrastructure.repository import CharacteristicRepository
 from .events import CharacteristicCreated, CharacteristicDeleted, CharacteristicUpdated
@@ -11,9 +15,10 @@ from .schemas import CharacteristicCreate, CharacteristicUpdate
 
 
 class CharacteristicService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.repository = CharacteristicRepository(db)
+        self.uow = UnitOfWork(db)
 
     def _add_to_outbox(self, topic: str, event: CharacteristicCreated | CharacteristicUpdated | CharacteristicDeleted):
         outbox_entry = OutboxORM(
@@ -22,8 +27,8 @@ class CharacteristicService:
         )
         self.db.add(outbox_entry)
 
-    def create_characteristic(self, char_in: CharacteristicCreate) -> CharacteristicORM:
-        if self.repository.get_by_name(char_in.name):
+    async def create_characteristic(self, char_in: CharacteristicCreate) -> CharacteristicORM:
+        if await self.repository.get_by_name(char_in.name):
             raise ConflictError(f"Characteristic with name '{char_in.name}' already exists")
 
         char_orm = CharacteristicORM(
@@ -31,35 +36,62 @@ class CharacteristicService:
             value=char_in.value,
             unit_of_measure=char_in.unit_of_measure
         )
-        created = self.repository.create(char_orm)
-
-        # Add to outbox
-        event = CharacteristicCreated(payload={
-            "id": str(created.id),
-            "name": created.name,
-            "value": created.value,
-            "unit_of_measure": created.unit_of_measure
-        })
-        self._add_to_outbox("resource.characteristics.events", event)
-        self.db.commit() # Repository.create already does a commit, but we need another one for outbox or we should have done it in one transaction.
-        # Actually Repository.create commits. I should probably change Repository to not commit if I want atomicity here.
-
-        return created
-
-    def get_characteristic(self, char_id: uuid.UUID) -> CharacteristicORM:
-        char = self.repository.get_by_id(char_id)
+        async with self.uow:
+            self.repository.create(char_orm)
+            await self.db.flush()  # Get ID
+
+            # Add to outbox
+            event = CharacteristicCreated(payload={
+                "id": str(char_orm.id),
+                "name": char_orm.name,
+                "value": char_orm.value,
+                "unit_of_measure": char_orm.unit_of_measure
+            })
+            self._add_to_outbox("resource.characteristics.events", event)
+
+        return char_orm
+
+    async def get_characteristic(self, char_id: uuid.UUID) -> CharacteristicORM:
+        char = await self.repository.get_by_id(char_id)
         if not char:
             raise NotFoundError(f"Characteristic with id '{char_id}' not found")
         return char
 
-    def list_characteristics(self, skip: int = 0, limit: int = 100) -> List[CharacteristicORM]:
-        return self.repository.list(skip=skip, limit=limit)
+    async def batch_get_characteristics(self, ids: List[uuid.UUID]) -> Tuple[List[CharacteristicORM], List[uuid.UUID]]:
+        """
+        Fetch many characteristics with a single query.
+
+        Returns:
+            The characteristics found and the requested ids that do not exist.
+        """
+        ids = list(dict.fromkeys(ids))
+        found = await self.repository.get_many(ids) if ids else []
+        found_ids = {item.id for item in found}
+        return found, [item_id for item_id in ids if item_id not in found_ids]
+
+    async def list_characteristics(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        skip: int = 0,
+        unit_of_measure: Optional[UnitOfMeasure] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Page:
+        return await self.repository.list(
+            limit, after=after, skip=skip, unit_of_measure=unit_of_measure, fields=fields
+        )
+
+    async def list_changes(self, since: Optional[str] = None, limit: int = 1000) -> Dict[str, Any]:
+        """Changefeed page after `since`: upserts with current state, tombstones for deletions."""
+        batch = await read_changes(self.db, OutboxORM, since, limit)
+        entities = await self.repository.get_many(batch.entity_ids) if batch.entity_ids else []
+        return batch.resolve(entities)
 
-    def update_characteristic(self, char_id: uuid.UUID, char_in: CharacteristicUpdate) -> CharacteristicORM:
-        char_orm = self.get_characteristic(char_id)
+    async def update_characteristic(self, char_id: uuid.UUID, char_in: CharacteristicUpdate) -> CharacteristicORM:
+        char_orm = await self.get_characteristic(char_id)
 
         if char_in.name and char_in.name != char_orm.name:
-            if self.repository.get_by_name(char_in.name):
+            if await self.repository.get_by_name(char_in.name):
                 raise ConflictError(f"Characteristic with name '{char_in.name}' already exists")
             char_orm.name = char_in.name
 
@@ -69,32 +101,30 @@ class CharacteristicService:
         if char_in.unit_of_measure is not None:
             char_orm.unit_of_measure = char_in.unit_of_measure
 
-        updated = self.repository.update(char_orm)
-
-        # Add to outbox
-        event = CharacteristicUpdated(payload={
-            "id": str(updated.id),
-            "name": updated.name,
-            "value": updated.value,
-            "unit_of_measure": updated.unit_of_measure
-        })
-        self._add_to_outbox("resource.characteristics.events", event)
-        self.db.commit()
+        async with self.uow:
+            # Add to outbox
+            event = CharacteristicUpdated(payload={
+                "id": str(char_orm.id),
+                "name": char_orm.name,
+                "value": char_orm.value,
+                "unit_of_measure": char_orm.unit_of_measure
+            })
+            self._add_to_outbox("resource.characteristics.events", event)
 
-        return updated
+        return char_orm
 
-    def delete_characteristic(self, char_id: uuid.UUID) -> None:
-        char_orm = self.get_characteristic(char_id)
+    async def delete_characteristic(self, char_id: uuid.UUID) -> None:
+        char_orm = await self.get_characteristic(char_id)
         # TODO: Check if referenced by specifications before deleting
 
         # Save info for event before deleting
         char_id_str = str(char_orm.id)
 
-        self.repository.delete(char_orm)
+        async with self.uow:
+            await self.repository.delete(char_orm)
 
-        # Add to outbox
-        event = CharacteristicDeleted(payload={
-            "id": char_id_str
-        })
-        self._add_to_outbox("resource.characteristics.events", event)
-        self.db.commit()
+            # Add to outbox
+            event = CharacteristicDeleted(payload={
+                "id": char_id_str
+            })
+            self._add_to_outbox("resource.characteristics.events", event)
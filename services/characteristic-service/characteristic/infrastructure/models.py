@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, timezone
 
 from common.database.outbox import OutboxMixin
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, Index, String
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -12,6 +12,11 @@ from .database import Base
 
 class CharacteristicORM(Base):
     __tablename__ = "characteristics"
+    # Keyset pagination order, alone and behind the list filter
+    __table_args__ = (
+        Index("ix_characteristics_created_at_id", "created_at", "id"),
+        Index("ix_characteristics_unit_of_measure_created_at_id", "unit_of_measure", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(200), unique=True, nullable=False, index=True)
@@ -1,35 +1,52 @@
 import uuid
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-from sqlalchemy.orm import Session
+from common.database.pagination import Page, keyset_paginate_async
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..domain.models import UnitOfMeasure
 from .models import CharacteristicORM
 
 
 class CharacteristicRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     def create(self, char_orm: CharacteristicORM) -> CharacteristicORM:
+        # Staged only; the service's unit of work commits it with the outbox row
         self.db.add(char_orm)
-        self.db.commit()
-        self.db.refresh(char_orm)
         return char_orm
 
-    def get_by_id(self, char_id: uuid.UUID) -> Optional[CharacteristicORM]:
-        return self.db.query(CharacteristicORM).filter(CharacteristicORM.id == char_id).first()
-
-    def get_by_name(self, name: str) -> Optional[CharacteristicORM]:
-        return self.db.query(CharacteristicORM).filter(CharacteristicORM.name == name).first()
-
-    def list(self, skip: int = 0, limit: int = 100) -> List[CharacteristicORM]:
-        return self.db.query(CharacteristicORM).offset(skip).limit(limit).all()
-
-    def update(self, char_orm: CharacteristicORM) -> CharacteristicORM:
-        self.db.commit()
-        self.db.refresh(char_orm)
-        return char_orm
-
-    def delete(self, char_orm: CharacteristicORM) -> None:
-        self.db.delete(char_orm)
-        self.db.commit()
+    async def get_by_id(self, char_id: uuid.UUID) -> Optional[CharacteristicORM]:
+        return await self.db.get(CharacteristicORM, char_id)
+
+    async def get_many(self, ids: List[uuid.UUID]) -> List[CharacteristicORM]:
+        # One query for any number of ids: WHERE id = ANY(:ids::uuid[])
+        ids_param = bindparam("ids", ids, type_=ARRAY(UUID(as_uuid=True)))
+        result = await self.db.scalars(select(CharacteristicORM).where(CharacteristicORM.id == any_(ids_param)))
+        return list(result)
+
+    async def get_by_name(self, name: str) -> Optional[CharacteristicORM]:
+        return await self.db.scalar(select(CharacteristicORM).where(CharacteristicORM.name == name).limit(1))
+
+    async def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        skip: int = 0,
+        unit_of_measure: Optional[UnitOfMeasure] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Page:
+        """Page of `CharacteristicORM` instances, or of `Row`s holding just the `fields` columns."""
+        if fields is None:
+            stmt = select(CharacteristicORM)
+        else:
+            stmt = select(*(getattr(CharacteristicORM, name) for name in fields))
+        if unit_of_measure is not None:
+            stmt = stmt.where(CharacteristicORM.unit_of_measure == unit_of_measure)
+        return await keyset_paginate_async(self.db, stmt, CharacteristicORM, limit, after=after, skip=skip)
+
+    async def delete(self, char_orm: CharacteristicORM) -> None:
+        await self.db.delete(char_orm)
@@ -7,24 +7,41 @@ Provides CRUD operations for product characteristics with event sourcing via out
 import asyncio
 import uuid
 from contextlib import asynccontextmanager
-from typing import List
+from typing import List, Optional
 
 import httpx
+from common.database.engine import listen_dsn
 from common.database.outbox import OutboxListener
+from common.database.pagination import NEXT_CURSOR_HEADER
+from common.deadline import DeadlineMiddleware
 from common.exceptions import AppException
 from common.logging import setup_logging
 from common.messaging import RabbitMQPublisher
-from common.schemas import ErrorDetail, ErrorResponse
-from common.security import RoleChecker, get_current_user, security
+from common.metrics import metrics
+from common.schemas import (
+    BatchGetRequest,
+    BatchGetResponse,
+    ChangesResponse,
+    ErrorDetail,
+    ErrorResponse,
+)
+from common.security import (
+    INTERNAL_IDENTITY_HEADER,
+    RoleChecker,
+    get_current_user,
+    security,
+)
+from common.serialization import JSONRowsResponse
 from common.tracing import instrument_fastapi, setup_tracing
-from fastapi import Depends, FastAPI, Query, status
+from fastapi import Depends, FastAPI, Query, Request, status
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .application.schemas import CharacteristicCreate, CharacteristicRead, CharacteristicUpdate
 from .application.service import CharacteristicService
 from .config import settings
-from .infrastructure.database import SessionLocal, get_db
+from .domain.models import UnitOfMeasure
+from .infrastructure.database import SessionLocal, get_db, get_read_db
 from .infrastructure.models import OutboxORM
 
 # Setup logging first
@@ -68,12 +85,8 @@ async def lifespan(app: FastAPI):
     publisher = RabbitMQPublisher(settings.RABBITMQ_URL)
 
     # Initialize Outbox Listener
-    # DSN for asyncpg (needs to be postgres:// instead of postgresql://)
-    # Also handle postgresql+psycopg2:// which SQLAlchemy might use
-    dsn = None
-    if settings.DATABASE_URL:
-        dsn = settings.DATABASE_URL.replace("postgresql+psycopg2://", "postgres://")
-        dsn = dsn.replace("postgresql://", "postgres://")
+    # Dedicated LISTEN connection (direct to Postgres when DB_LISTEN_URL is set)
+    dsn = listen_dsn(settings.DATABASE_URL, settings.DB_LISTEN_URL) if settings.DATABASE_URL else None
 
     if dsn:
         listener = OutboxListener(
@@ -110,6 +123,9 @@ app = FastAPI(
 # Instrument FastAPI for tracing
 instrument_fastapi(app, excluded_urls="health")
 
+# Enforce the request deadline propagated by the API Gateway
+app.add_middleware(DeadlineMiddleware)
+
 
 # Exception handler for standardized error responses
 @app.exception_handler(AppException)
@@ -137,11 +153,18 @@ async def custom_app_exception_handler(request, exc: AppException):
 
 
 # Security dependency override to inject public key
-def get_current_user_with_key(token=Depends(security)):
+def get_current_user_with_key(request: Request, token=Depends(security)):
     public_key = (
         settings.JWT_PUBLIC_KEY.replace("\\n", "\n") if settings.JWT_PUBLIC_KEY else None
     )
-    return get_current_user(token=token, public_key=public_key, algorithm=settings.JWT_ALGORITHM)
+    return get_current_user(
+        token=token,
+        public_key=public_key,
+        algorithm=settings.JWT_ALGORITHM,
+        # Identity already verified by the API Gateway (skips RSA verification)
+        internal_identity=request.headers.get(INTERNAL_IDENTITY_HEADER),
+        identity_secret=settings.INTERNAL_IDENTITY_SECRET,
+    )
 
 
 app.dependency_overrides[get_current_user] = get_current_user_with_key
@@ -156,15 +179,51 @@ async def health_check():
     return {"status": "healthy", "service": settings.SERVICE_NAME}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Expose in-process metrics (database pool checkouts, waits and saturation)."""
+    return metrics.snapshot()
+
+
 @app.post(
     "/api/v1/characteristics",
     response_model=CharacteristicRead,
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(admin_required)],
 )
-def create_characteristic(char_in: CharacteristicCreate, db: Session = Depends(get_db)):
+async def create_characteristic(char_in: CharacteristicCreate, db: AsyncSession = Depends(get_db)):
+    service = CharacteristicService(db)
+    return await service.create_characteristic(char_in)
+
+
+@app.post(
+    "/api/v1/characteristics/batch-get",
+    response_model=BatchGetResponse[CharacteristicRead],
+    dependencies=[Depends(any_user_required)],
+)
+async def batch_get_characteristics(batch: BatchGetRequest, db: AsyncSession = Depends(get_db)):
+    service = CharacteristicService(db)
+    items, missing = await service.batch_get_characteristics(batch.ids)
+    return {"items": items, "missing": missing}
+
+
+@app.get(
+    "/api/v1/characteristics/changes",
+    response_model=ChangesResponse[CharacteristicRead],
+    dependencies=[Depends(any_user_required)],
+)
+async def list_characteristic_changes(
+    since: Optional[str] = Query(None, description="next_cursor of the previous page; omit to start from the beginning"),
+    limit: int = Query(1000, ge=1, le=5000),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Changefeed for catching up without replaying every event: ordered upserts
+    (current state) and tombstones. Keep calling with `next_cursor` while
+    `has_more` is true; later calls pick up new changes from there.
+    """
     service = CharacteristicService(db)
-    return service.create_characteristic(char_in)
+    return await service.list_changes(since=since, limit=limit)
 
 
 @app.get(
@@ -172,9 +231,9 @@ def create_characteristic(char_in: CharacteristicCreate, db: Session = Depends(g
     response_model=CharacteristicRead,
     dependencies=[Depends(any_user_required)],
 )
-def get_characteristic(char_id: uuid.UUID, db: Session = Depends(get_db)):
+async def get_characteristic(char_id: uuid.UUID, db: AsyncSession = Depends(get_read_db)):
     service = CharacteristicService(db)
-    return service.get_characteristic(char_id)
+    return await service.get_characteristic(char_id)
 
 
 @app.get(
@@ -182,13 +241,30 @@ def get_characteristic(char_id: uuid.UUID, db: Session = Depends(get_db)):
     response_model=List[CharacteristicRead],
     dependencies=[Depends(any_user_required)],
 )
-def list_characteristics(
-    skip: int = Query(0, ge=0),
+async def list_characteristics(
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    skip: int = Query(0, ge=0, description="Offset paging, ignored when `after` is given"),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db),
+    unit_of_measure: Optional[UnitOfMeasure] = None,
+    db: AsyncSession = Depends(get_read_db),
 ):
+    """
+    Keyset-paginated listing in creation order. When more rows follow, the
+    cursor of the next page is returned in the `X-Next-Cursor` header.
+    """
     service = CharacteristicService(db)
-    return service.list_characteristics(skip=skip, limit=limit)
+    # Only the response columns, rendered to JSON without per-row model validation
+    page = await service.list_characteristics(
+        limit=limit,
+        after=after,
+        skip=skip,
+        unit_of_measure=unit_of_measure,
+        fields=CharacteristicRead.model_fields,
+    )
+    response = JSONRowsResponse(page.items)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
 
 
 @app.put(
@@ -196,11 +272,11 @@ def list_characteristics(
     response_model=CharacteristicRead,
     dependencies=[Depends(admin_required)],
 )
-def update_characteristic(
-    char_id: uuid.UUID, char_in: CharacteristicUpdate, db: Session = Depends(get_db)
+async def update_characteristic(
+    char_id: uuid.UUID, char_in: CharacteristicUpdate, db: AsyncSession = Depends(get_db)
 ):
     service = CharacteristicService(db)
-    return service.update_characteristic(char_id, char_in)
+    return await service.update_characteristic(char_id, char_in)
 
 
 @app.delete(
@@ -208,9 +284,9 @@ def update_characteristic(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(admin_required)],
 )
-def delete_characteristic(char_id: uuid.UUID, db: Session = Depends(get_db)):
+async def delete_characteristic(char_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     service = CharacteristicService(db)
-    service.delete_characteristic(char_id)
+    await service.delete_characteristic(char_id)
     return None
 
 
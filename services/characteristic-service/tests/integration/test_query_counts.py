@@ -0,0 +1,46 @@
+"""
+Round-trip regression tests: each write endpoint commits the entity and its
+outbox row once, without refresh SELECTs.
+"""
+
+import characteristic.infrastructure.database as db_module
+from common.testing.queries import count_queries
+from fastapi import status
+
+
+def _request_queries():
+    return count_queries(db_module.AsyncSessionLocal.kw["bind"])
+
+
+def _create(client, name: str) -> str:
+    response = client.post("/api/v1/characteristics", json={"name": name, "value": "1", "unit_of_measure": "GB"})
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()["id"]
+
+
+def test_create_queries(client):
+    with _request_queries() as queries:
+        _create(client, "Counted Create")
+
+    # Name check, characteristic, outbox row
+    assert queries.counts == {"SELECT": 1, "INSERT": 2, "COMMIT": 1}
+
+
+def test_update_queries(client):
+    char_id = _create(client, "Counted Update")
+
+    with _request_queries() as queries:
+        response = client.put(f"/api/v1/characteristics/{char_id}", json={"value": "2"})
+    assert response.status_code == status.HTTP_200_OK
+
+    assert queries.counts == {"SELECT": 1, "UPDATE": 1, "INSERT": 1, "COMMIT": 1}
+
+
+def test_delete_queries(client):
+    char_id = _create(client, "Counted Delete")
+
+    with _request_queries() as queries:
+        response = client.delete(f"/api/v1/characteristics/{char_id}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    assert queries.counts == {"SELECT": 1, "DELETE": 1, "INSERT": 1, "COMMIT": 1}
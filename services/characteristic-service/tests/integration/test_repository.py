@@ -1,69 +1,119 @@
+import uuid
+
+import pytest
 from characteristic.domain.models import UnitOfMeasure
 from characteristic.infrastructure.models import CharacteristicORM
 from characteristic.infrastructure.repository import CharacteristicRepository
 
 
-def test_repo_create_and_get(db_session):
-    repo = CharacteristicRepository(db_session)
+@pytest.mark.asyncio
+async def test_repo_create_and_get(async_db_session):
+    repo = CharacteristicRepository(async_db_session)
     char_orm = CharacteristicORM(
         name="Latency",
         value="20",
         unit_of_measure=UnitOfMeasure.SECONDS # Assuming SECONDS exists in Enum
     )
 
-    # Create
+    # Create (staged by the repository, committed by the caller)
     created = repo.create(char_orm)
+    await async_db_session.commit()
     assert created.id is not None
     assert created.name == "Latency"
 
     # Get by ID
-    retrieved = repo.get_by_id(created.id)
+    retrieved = await repo.get_by_id(created.id)
     assert retrieved is not None
     assert retrieved.name == "Latency"
     assert retrieved.value == "20"
 
-def test_repo_get_by_name(db_session):
-    repo = CharacteristicRepository(db_session)
+@pytest.mark.asyncio
+async def test_repo_get_by_name(async_db_session):
+    repo = CharacteristicRepository(async_db_session)
     char_orm = CharacteristicORM(
         name="UniqueName",
         value="test",
         unit_of_measure=UnitOfMeasure.NONE
     )
     repo.create(char_orm)
+    await async_db_session.commit()
 
-    retrieved = repo.get_by_name("UniqueName")
+    retrieved = await repo.get_by_name("UniqueName")
     assert retrieved is not None
     assert retrieved.name == "UniqueName"
 
-def test_repo_list(db_session):
-    repo = CharacteristicRepository(db_session)
+@pytest.mark.asyncio
+async def test_repo_get_many(async_db_session):
+    repo = CharacteristicRepository(async_db_session)
+    created = [
+        repo.create(CharacteristicORM(name=f"Bulk {i}", value=str(i), unit_of_measure=UnitOfMeasure.NONE))
+        for i in range(3)
+    ]
+    await async_db_session.commit()
+
+    retrieved = await repo.get_many([created[0].id, created[2].id, uuid.uuid4()])
+    assert {c.id for c in retrieved} == {created[0].id, created[2].id}
+
+@pytest.mark.asyncio
+async def test_repo_list(async_db_session):
+    repo = CharacteristicRepository(async_db_session)
     for i in range(5):
         repo.create(CharacteristicORM(
             name=f"Char {i}",
             value=str(i),
             unit_of_measure=UnitOfMeasure.NONE
         ))
+    await async_db_session.commit()
+
+    page = await repo.list()
+    assert len(page.items) == 5
+    assert page.next_cursor is None
+
+@pytest.mark.asyncio
+async def test_repo_list_pages_with_cursor(async_db_session):
+    repo = CharacteristicRepository(async_db_session)
+    for i in range(5):
+        repo.create(CharacteristicORM(
+            name=f"Paged {i}",
+            value=str(i),
+            unit_of_measure=UnitOfMeasure.GB if i % 2 else UnitOfMeasure.NONE
+        ))
+    await async_db_session.commit()
+
+    first = await repo.list(limit=3)
+    second = await repo.list(limit=3, after=first.next_cursor)
+    assert len(first.items) == 3
+    assert len(second.items) == 2
+    assert second.next_cursor is None
+    assert {c.name for c in first.items + second.items} == {f"Paged {i}" for i in range(5)}
 
-    chars = repo.list()
-    assert len(chars) == 5
+    filtered = await repo.list(unit_of_measure=UnitOfMeasure.GB)
+    assert {c.name for c in filtered.items} == {"Paged 1", "Paged 3"}
 
-def test_repo_update(db_session):
-    repo = CharacteristicRepository(db_session)
+@pytest.mark.asyncio
+async def test_repo_update(async_db_session):
+    repo = CharacteristicRepository(async_db_session)
     char_orm = CharacteristicORM(name="Original", value="1", unit_of_measure=UnitOfMeasure.NONE)
     repo.create(char_orm)
+    await async_db_session.commit()
 
+    # Changes to loaded entities are tracked; no repository call needed
     char_orm.name = "Updated"
     char_orm.value = "2"
-    repo.update(char_orm)
+    await async_db_session.commit()
+    async_db_session.expunge(char_orm)
 
-    retrieved = repo.get_by_id(char_orm.id)
+    retrieved = await repo.get_by_id(char_orm.id)
     assert retrieved.name == "Updated"
     assert retrieved.value == "2"
 
-def test_repo_delete(db_session):
-    repo = CharacteristicRepository(db_session)
+@pytest.mark.asyncio
+async def test_repo_delete(async_db_session):
+    repo = CharacteristicRepository(async_db_session)
     char_orm = CharacteristicORM(name="ToDelete", value="0", unit_of_measure=UnitOfMeasure.NONE)
     repo.create(char_orm)
+    await async_db_session.commit()
 
-    repo.delete(char_orm)
-    assert repo.get_by_id(char_orm.id) is None
+    await repo.delete(char_orm)
+    await async_db_session.commit()
+    assert await repo.get_by_id(char_orm.id) is None
@@ -5,6 +5,7 @@ Provides JWT token issuance and public key distribution for other services.
 """
 
 
+from common.deadline import DeadlineMiddleware
 from common.logging import setup_logging
 from common.tracing import instrument_fastapi, setup_tracing
 from fastapi import Depends, FastAPI, HTTPException, status
@@ -36,6 +37,9 @@ app = FastAPI(
 # Instrument FastAPI for tracing
 instrument_fastapi(app, excluded_urls="health")
 
+# Enforce the request deadline propagated by the API Gateway
+app.add_middleware(DeadlineMiddleware)
+
 
 @app.on_event("startup")
 async def startup_event():
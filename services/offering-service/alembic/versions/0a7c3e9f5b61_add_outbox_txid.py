@@ -0,0 +1,47 @@
+"""add_outbox_txid
+
+Revision ID: 0a7c3e9f5b61
+Revises: f2a94c7d1b38
+Create Date: 2026-10-19 17:09:31.774105
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0a7c3e9f5b61'
+down_revision: Union[str, Sequence[str], None] = 'f2a94c7d1b38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows all get this migration's transaction id, which sorts them
+    # before any later write
+    op.add_column(
+        'outbox',
+        sa.Column(
+            'txid',
+            sa.BigInteger(),
+            server_default=sa.text('(pg_current_xact_id()::text)::bigint'),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_outbox_txid_id',
+            'outbox',
+            ['txid', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_outbox_txid_id', table_name='outbox', postgresql_concurrently=True)
+    op.drop_column('outbox', 'txid')
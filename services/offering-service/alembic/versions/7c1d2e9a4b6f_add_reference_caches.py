@@ -0,0 +1,39 @@
+"""add_reference_caches
+
+Revision ID: 7c1d2e9a4b6f
+Revises: 42f0338a44b8
+Create Date: 2026-10-19 10:12:03.518204
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1d2e9a4b6f'
+down_revision: Union[str, Sequence[str], None] = '42f0338a44b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cached_specifications',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=True),
+    sa.Column('last_updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('cached_prices',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=True),
+    sa.Column('last_updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cached_prices')
+    op.drop_table('cached_specifications')
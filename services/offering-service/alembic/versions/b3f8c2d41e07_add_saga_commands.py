@@ -0,0 +1,42 @@
+"""add_saga_commands
+
+Revision ID: b3f8c2d41e07
+Revises: 7c1d2e9a4b6f
+Create Date: 2026-10-19 11:02:47.114930
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f8c2d41e07'
+down_revision: Union[str, Sequence[str], None] = '7c1d2e9a4b6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('saga_commands',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('process_key', sa.String(length=255), nullable=False),
+    sa.Column('business_key', sa.String(length=255), nullable=True),
+    sa.Column('variables', sa.JSON(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(), nullable=False),
+    sa.Column('process_instance_id', sa.String(length=64), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('processed_at', sa.DateTime(), nullable=True),
+    sa.Column('error_message', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_saga_commands_status_next_attempt_at', 'saga_commands', ['status', 'next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_saga_commands_status_next_attempt_at', table_name='saga_commands')
+    op.drop_table('saga_commands')
@@ -0,0 +1,29 @@
+"""add_saga_command_batch_id
+
+Revision ID: d91a6e3f58c2
+Revises: b3f8c2d41e07
+Create Date: 2026-10-19 11:40:15.603218
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91a6e3f58c2'
+down_revision: Union[str, Sequence[str], None] = 'b3f8c2d41e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('saga_commands', sa.Column('batch_id', sa.UUID(), nullable=True))
+    op.create_index(op.f('ix_saga_commands_batch_id'), 'saga_commands', ['batch_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_saga_commands_batch_id'), table_name='saga_commands')
+    op.drop_column('saga_commands', 'batch_id')
@@ -0,0 +1,65 @@
+"""add_list_pagination_indexes
+
+Revision ID: e6b07a2c4d19
+Revises: d91a6e3f58c2
+Create Date: 2026-10-19 14:05:32.118407
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b07a2c4d19'
+down_revision: Union[str, Sequence[str], None] = 'd91a6e3f58c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside the migration transaction, and keeps the
+    # table writable while existing rows are indexed
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_product_offerings_created_at_id',
+            'product_offerings',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_product_offerings_lifecycle_status_created_at_id',
+            'product_offerings',
+            ['lifecycle_status', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_product_offerings_sales_channels',
+            'product_offerings',
+            ['sales_channels'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_product_offerings_sales_channels',
+            table_name='product_offerings',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_product_offerings_lifecycle_status_created_at_id',
+            table_name='product_offerings',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_product_offerings_created_at_id',
+            table_name='product_offerings',
+            postgresql_concurrently=True,
+        )
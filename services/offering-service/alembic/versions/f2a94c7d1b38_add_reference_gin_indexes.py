@@ -0,0 +1,52 @@
+"""add_reference_gin_indexes
+
+Revision ID: f2a94c7d1b38
+Revises: e6b07a2c4d19
+Create Date: 2026-10-19 16:42:08.530114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a94c7d1b38'
+down_revision: Union[str, Sequence[str], None] = 'e6b07a2c4d19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_product_offerings_specification_ids',
+            'product_offerings',
+            ['specification_ids'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_using='gin',
+        )
+        op.create_index(
+            'ix_product_offerings_pricing_ids',
+            'product_offerings',
+            ['pricing_ids'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_product_offerings_pricing_ids',
+            table_name='product_offerings',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_product_offerings_specification_ids',
+            table_name='product_offerings',
+            postgresql_concurrently=True,
+        )
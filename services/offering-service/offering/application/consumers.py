@@ -0,0 +1,105 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Type
+
+from common.messaging import RabbitMQConsumer
+from sqlalchemy.dialects.postgresql import insert
+
+from ..config import settings
+from ..infrastructure.models import CachedPriceORM, CachedSpecificationORM
+
+logger = logging.getLogger(__name__)
+
+
+class ReferenceCacheConsumer:
+    """
+    Consumer keeping a local cache of valid reference IDs in sync with the
+    events of the service that owns them.
+    """
+    def __init__(self, model: Type, entity: str, queue_name: str, routing_key: str):
+        self.model = model
+        self.entity = entity
+        self.consumer = RabbitMQConsumer(
+            amqp_url=settings.RABBITMQ_URL,
+            queue_name=queue_name,
+            exchange_name="catalog.events",
+            routing_key=routing_key,
+        )
+
+    async def run(self):
+        """Starts the consumer."""
+        await self.consumer.consume(self._handle_event)
+
+    async def _handle_event(self, body: Dict[str, Any], headers: Dict[str, Any]):
+        """Callback for handling incoming events."""
+        event_type = body.get("event_type")
+        payload = body.get("payload", {})
+
+        logger.info(f"Received event {event_type} for {self.entity} {payload.get('id')}")
+
+        # We use a synchronous session in a thread pool to avoid blocking the async consumer
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._process_event_sync, event_type, payload)
+
+    def _process_event_sync(self, event_type: str, payload: Dict[str, Any]):
+        from ..infrastructure.database import SessionLocal
+        if SessionLocal is None:
+            logger.error("SessionLocal is not initialized. Check DATABASE_URL.")
+            return
+        db = SessionLocal()
+        try:
+            ref_id = payload.get("id")
+            if not ref_id:
+                logger.error("Event payload missing 'id'")
+                return
+
+            if event_type in (f"{self.entity}Created", f"{self.entity}Updated"):
+                # Upsert in one statement, safe against redelivered events
+                values = {
+                    "id": ref_id,
+                    "name": payload.get("name"),
+                    "last_updated_at": datetime.now(timezone.utc),
+                }
+                db.execute(
+                    insert(self.model)
+                    .values(**values)
+                    .on_conflict_do_update(index_elements=["id"], set_=values)
+                )
+
+            elif event_type == f"{self.entity}Deleted":
+                db.query(self.model).filter(self.model.id == ref_id).delete()
+
+            else:
+                # e.g. PriceLocked / PriceUnlocked do not change which IDs exist
+                logger.debug(f"Ignoring event type: {event_type}")
+                return
+
+            db.commit()
+            logger.debug(f"Successfully processed {event_type} for {ref_id}")
+        except Exception as e:
+            logger.error(f"Error syncing {self.entity} cache: {str(e)}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def stop(self):
+        self.consumer.stop()
+
+
+def specification_consumer() -> ReferenceCacheConsumer:
+    return ReferenceCacheConsumer(
+        model=CachedSpecificationORM,
+        entity="Specification",
+        queue_name="offering-service.specification-sync.queue",
+        routing_key="resource.specifications.events",
+    )
+
+
+def price_consumer() -> ReferenceCacheConsumer:
+    return ReferenceCacheConsumer(
+        model=CachedPriceORM,
+        entity="Price",
+        queue_name="offering-service.pricing-sync.queue",
+        routing_key="commercial.pricing.events",
+    )
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -8,8 +8,9 @@ from ..domain.models import LifecycleStatus
 
 
 class OfferingBase(BaseModel):
-    name: str
-    description: Optional[str] = None
+    # Column sizes of product_offerings, so oversized values fail validation instead of the INSERT/COPY
+    name: str = Field(..., max_length=200)
+    description: Optional[str] = Field(None, max_length=500)
     specification_ids: List[uuid.UUID] = Field(default_factory=list)
     pricing_ids: List[uuid.UUID] = Field(default_factory=list)
     sales_channels: List[str] = Field(default_factory=list)
@@ -32,3 +33,28 @@ class OfferingRead(OfferingBase):
     updated_at: datetime
     published_at: Optional[datetime] = None
     retired_at: Optional[datetime] = None
+
+
+class PublishBatchRequest(BaseModel):
+    offering_ids: List[uuid.UUID] = Field(..., min_length=1, max_length=1000)
+
+
+class PublishBatchItemResult(BaseModel):
+    id: uuid.UUID
+    accepted: bool
+    lifecycle_status: Optional[LifecycleStatus] = None
+    error: Optional[str] = None
+
+
+class PublishBatchResponse(BaseModel):
+    batch_id: uuid.UUID
+    accepted: int
+    rejected: int
+    results: List[PublishBatchItemResult]
+
+
+class PublishBatchStatus(BaseModel):
+    batch_id: uuid.UUID
+    total: int
+    sagas: Dict[str, int]  # Saga start commands by status (PENDING, IN_FLIGHT, STARTED, FAILED)
+    offerings: Dict[str, int]  # Offerings of the batch by lifecycle status
@@ -1,14 +1,29 @@
+import asyncio
+import json
 import logging
 import uuid
-from typing import List
-
-import httpx
-from common.exceptions import AppException, NotFoundError
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from common.database.changefeed import read_changes
+from common.database.pagination import Page
+from common.database.unit_of_work import UnitOfWork
+from common.exceptions import AppException, NotFoundError, ServiceUnavailableError, ValidationError
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import cast, func, insert, select
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
 from ..domain.models import LifecycleStatus, ProductOffering
-from ..infrastructure.models import OutboxORM, ProductOfferingORM
+from ..infrastructure.models import (
+    CachedPriceORM,
+    CachedSpecificationORM,
+    OutboxORM,
+    ProductOfferingORM,
+    SagaCommandORM,
+)
+from ..infrastructure.reference_client import reference_client
 from ..infrastructure.repository import OfferingRepository
 from .events import (
     OfferingCreated,
@@ -22,37 +37,80 @@ from .schemas import OfferingCreate, OfferingUpdate
 logger = logging.getLogger(__name__)
 
 
+def _format_errors(error: PydanticValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" if err["loc"] else err["msg"]
+        for err in error.errors()
+    )
+
+
 class OfferingService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.repository = OfferingRepository(db)
+        self.uow = UnitOfWork(db)
 
     def _add_to_outbox(self, topic: str, event: OfferingCreated | OfferingUpdated | OfferingPublicationInitiated | OfferingPublished | OfferingRetired):
         outbox_entry = OutboxORM(topic=topic, payload=event.model_dump(mode="json"))
         self.db.add(outbox_entry)
 
+    def _add_saga_command(self, process_key: str, business_key: str, variables: Dict[str, Any]):
+        self.db.add(SagaCommandORM(process_key=process_key, business_key=business_key, variables=variables))
+
+    @staticmethod
+    def _publication_saga_variables(offering_orm: ProductOfferingORM) -> Dict[str, Any]:
+        # Camunda variables; arrays use the Json type
+        return {
+            "offeringId": {"value": str(offering_orm.id), "type": "String"},
+            "specificationIds": {"value": json.dumps([str(sid) for sid in offering_orm.specification_ids]), "type": "Json"},
+            "pricingIds": {"value": json.dumps([str(pid) for pid in offering_orm.pricing_ids]), "type": "Json"},
+        }
+
+    async def _uncached_ids(self, model: type[CachedSpecificationORM | CachedPriceORM], ids: List[uuid.UUID]) -> List[uuid.UUID]:
+        """
+        Returns the IDs that are not (yet) in the local reference cache.
+        """
+        if not ids or not settings.REFERENCE_CACHE_ENABLED:
+            return list(ids)
+        cached = set(await self.db.scalars(select(model.id).where(model.id.in_(ids))))
+        return [ref_id for ref_id in ids if ref_id not in cached]
+
+    async def _find_missing_references(
+        self, spec_ids: List[uuid.UUID], price_ids: List[uuid.UUID]
+    ) -> Tuple[List[uuid.UUID], List[uuid.UUID]]:
+        """
+        Cross-service validation: IDs are checked against the event-fed local caches
+        first; only IDs missing there (e.g. events still in flight) are looked up
+        in the Specification and Pricing services, concurrently.
+
+        Returns:
+            The unknown specification IDs and the unknown price IDs.
+        """
+        spec_ids = await self._uncached_ids(CachedSpecificationORM, spec_ids)
+        price_ids = await self._uncached_ids(CachedPriceORM, price_ids)
+        missing_specs, missing_prices = await asyncio.gather(
+            reference_client.find_missing(
+                "Specification", settings.SPECIFICATION_SERVICE_URL, "specifications", spec_ids
+            ),
+            reference_client.find_missing("Pricing", settings.PRICING_SERVICE_URL, "prices", price_ids),
+        )
+        return missing_specs, missing_prices
+
     async def _validate_external_ids(self, spec_ids: List[uuid.UUID], price_ids: List[uuid.UUID]):
         """
-        Cross-service validation: Synchronous HTTP calls to Specification and Pricing services.
+        Raises:
+            AppException: Listing every unknown specification and price ID.
         """
-        async with httpx.AsyncClient() as client:
-            # Validate Specification IDs
-            for spec_id in spec_ids:
-                try:
-                    resp = await client.get(f"{settings.SPECIFICATION_SERVICE_URL}/api/v1/specifications/{spec_id}", timeout=5.0)
-                    if resp.status_code != 200:
-                        raise AppException(f"Specification ID {spec_id} not found or invalid", code="BAD_REQUEST")
-                except httpx.RequestError as e:
-                    raise AppException(f"Could not connect to Specification Service: {str(e)}", code="SERVICE_UNAVAILABLE")
-
-            # Validate Pricing IDs
-            for price_id in price_ids:
-                try:
-                    resp = await client.get(f"{settings.PRICING_SERVICE_URL}/api/v1/prices/{price_id}", timeout=5.0)
-                    if resp.status_code != 200:
-                        raise AppException(f"Price ID {price_id} not found or invalid", code="BAD_REQUEST")
-                except httpx.RequestError as e:
-                    raise AppException(f"Could not connect to Pricing Service: {str(e)}", code="SERVICE_UNAVAILABLE")
+        missing_specs, missing_prices = await self._find_missing_references(spec_ids, price_ids)
+        if missing_specs or missing_prices:
+            raise AppException(
+                "Some specification or price IDs were not found",
+                code="BAD_REQUEST",
+                details={
+                    "missing_specification_ids": [str(i) for i in missing_specs],
+                    "missing_pricing_ids": [str(i) for i in missing_prices],
+                },
+            )
 
     async def create_offering(self, offering_in: OfferingCreate) -> ProductOfferingORM:
         # Validate IDs if provided
@@ -62,26 +120,187 @@ class OfferingService:
         offering_domain = ProductOffering(**offering_in.model_dump())
         offering_orm = ProductOfferingORM.from_domain(offering_domain)
 
-        self.repository.create(offering_orm)
-        self.db.flush()
+        # The ID and timestamps come from the domain object, so nothing needs flushing
+        # before the event is built; both rows go out with the commit
+        async with self.uow:
+            self.repository.create(offering_orm)
 
-        event = OfferingCreated(payload=offering_orm.to_domain().model_dump(mode="json"))
-        self._add_to_outbox("product.offering.events", event)
+            event = OfferingCreated(payload=offering_orm.to_domain().model_dump(mode="json"))
+            self._add_to_outbox("product.offering.events", event)
 
-        self.db.commit()
         return offering_orm
 
-    def get_offering(self, offering_id: uuid.UUID) -> ProductOfferingORM:
-        offering = self.repository.get_by_id(offering_id)
+    async def import_offerings(self, stream: AsyncIterator[bytes]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Bulk import from an NDJSON stream (one OfferingCreate object per line).
+
+        Lines are processed in chunks of IMPORT_CHUNK_SIZE: references of the whole
+        chunk are validated together, valid rows are loaded with COPY and their
+        OfferingCreated outbox events inserted in one statement. Each chunk commits
+        on its own, so results can be streamed back while the import runs.
+
+        Yields:
+            One result per input line, then a summary.
+        """
+        created = failed = 0
+        chunk: List[Tuple[int, str]] = []
+
+        async def flush():
+            nonlocal created, failed
+            results = await self._import_chunk(chunk)
+            created += sum(1 for result in results if result["status"] == "CREATED")
+            failed += sum(1 for result in results if result["status"] == "FAILED")
+            chunk.clear()
+            return results
+
+        line_no = 0
+        buffer = b""
+        async for data in stream:
+            buffer += data
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                line_no += 1
+                if line.strip():
+                    chunk.append((line_no, line.decode("utf-8", errors="replace")))
+                if len(chunk) >= settings.IMPORT_CHUNK_SIZE:
+                    for result in await flush():
+                        yield result
+        if buffer.strip():
+            chunk.append((line_no + 1, buffer.decode("utf-8", errors="replace")))
+        if chunk:
+            for result in await flush():
+                yield result
+
+        logger.info(f"Offering import finished: {created} created, {failed} failed")
+        yield {"summary": {"created": created, "failed": failed}}
+
+    async def _import_chunk(self, chunk: List[Tuple[int, str]]) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        parsed: List[Tuple[int, ProductOffering]] = []
+        for line_no, text in chunk:
+            try:
+                offering_in = OfferingCreate.model_validate_json(text)
+            except PydanticValidationError as e:
+                results.append({"line": line_no, "status": "FAILED", "error": _format_errors(e)})
+                continue
+            parsed.append((line_no, ProductOffering(**offering_in.model_dump())))
+
+        try:
+            missing_specs, missing_prices = await self._find_missing_references(
+                list({sid for _, offering in parsed for sid in offering.specification_ids}),
+                list({pid for _, offering in parsed for pid in offering.pricing_ids}),
+            )
+        except ServiceUnavailableError as e:
+            # Earlier chunks are committed already; fail this one's lines and keep streaming
+            logger.error(f"Offering import chunk references could not be checked: {e.message}")
+            results += [
+                {"line": line_no, "status": "FAILED", "error": f"Could not check references: {e.message}"}
+                for line_no, _ in parsed
+            ]
+            return sorted(results, key=lambda result: result["line"])
+        missing_specs, missing_prices = set(missing_specs), set(missing_prices)
+
+        valid: List[Tuple[int, ProductOffering]] = []
+        for line_no, offering in parsed:
+            unknown = [str(i) for i in offering.specification_ids if i in missing_specs]
+            unknown += [str(i) for i in offering.pricing_ids if i in missing_prices]
+            if unknown:
+                results.append({
+                    "line": line_no,
+                    "status": "FAILED",
+                    "error": f"Unknown specification or price IDs: {', '.join(unknown)}",
+                })
+            else:
+                valid.append((line_no, offering))
+
+        if valid:
+            try:
+                await self._store_offerings([offering for _, offering in valid])
+            except Exception as e:
+                # One bad row fails the whole COPY; retry line by line to pin the failure down
+                logger.warning(f"Offering import chunk failed, storing its lines one by one: {str(e)}")
+                for line_no, offering in valid:
+                    try:
+                        await self._store_offerings([offering])
+                    except Exception as row_error:
+                        results.append(
+                            {"line": line_no, "status": "FAILED", "error": f"Could not store offering: {str(row_error)}"}
+                        )
+                    else:
+                        results.append({"line": line_no, "status": "CREATED", "id": str(offering.id)})
+            else:
+                results += [
+                    {"line": line_no, "status": "CREATED", "id": str(offering.id)} for line_no, offering in valid
+                ]
+
+        return sorted(results, key=lambda result: result["line"])
+
+    async def _store_offerings(self, offerings: List[ProductOffering]) -> None:
+        """COPY `offerings` and insert their OfferingCreated outbox rows, in one transaction."""
+        async with self.uow:
+            await self.repository.copy_many(offerings)
+            await self.db.execute(
+                insert(OutboxORM),
+                [
+                    {
+                        "topic": "product.offering.events",
+                        "payload": OfferingCreated(payload=offering.model_dump(mode="json")).model_dump(mode="json"),
+                    }
+                    for offering in offerings
+                ],
+            )
+
+    async def get_offering(self, offering_id: uuid.UUID) -> ProductOfferingORM:
+        offering = await self.repository.get_by_id(offering_id)
         if not offering:
             raise NotFoundError(f"Offering with ID {offering_id} not found")
         return offering
 
-    def list_offerings(self, skip: int = 0, limit: int = 100) -> List[ProductOfferingORM]:
-        return self.repository.list(skip, limit)
+    async def list_offerings(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        skip: int = 0,
+        lifecycle_status: Optional[LifecycleStatus] = None,
+        sales_channel: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Page:
+        return await self.repository.list(
+            limit,
+            after=after,
+            skip=skip,
+            lifecycle_status=lifecycle_status,
+            sales_channel=sales_channel,
+            fields=fields,
+        )
+
+    async def list_changes(self, since: Optional[str] = None, limit: int = 1000) -> Dict[str, Any]:
+        """Changefeed page after `since`: upserts with current state, tombstones for deletions."""
+        batch = await read_changes(self.db, OutboxORM, since, limit)
+        entities = await self.repository.get_many(batch.entity_ids) if batch.entity_ids else []
+        return batch.resolve(entities)
+
+    async def list_offerings_by_reference(
+        self,
+        price_id: Optional[uuid.UUID] = None,
+        spec_id: Optional[uuid.UUID] = None,
+        limit: int = 100,
+        after: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Page:
+        """
+        Offerings referencing `price_id` and/or `spec_id` (both must match when
+        both are given), in keyset order.
+
+        Raises:
+            ValidationError: If neither reference is given.
+        """
+        if price_id is None and spec_id is None:
+            raise ValidationError("At least one of price_id or spec_id is required")
+        return await self.repository.list(limit, after=after, price_id=price_id, spec_id=spec_id, fields=fields)
 
     async def update_offering(self, offering_id: uuid.UUID, offering_in: OfferingUpdate) -> ProductOfferingORM:
-        offering_orm = self.get_offering(offering_id)
+        offering_orm = await self.get_offering(offering_id)
 
         if offering_orm.lifecycle_status != LifecycleStatus.DRAFT.value:
             raise AppException(f"Cannot update offering in {offering_orm.lifecycle_status} state", code="BAD_REQUEST")
@@ -90,36 +309,34 @@ class OfferingService:
         if offering_in.specification_ids or offering_in.pricing_ids:
             await self._validate_external_ids(offering_in.specification_ids, offering_in.pricing_ids)
 
-        offering_orm.name = offering_in.name
-        offering_orm.description = offering_in.description
-        offering_orm.specification_ids = offering_in.specification_ids
-        offering_orm.pricing_ids = offering_in.pricing_ids
-        offering_orm.sales_channels = offering_in.sales_channels
+        async with self.uow:
+            offering_orm.name = offering_in.name
+            offering_orm.description = offering_in.description
+            offering_orm.specification_ids = offering_in.specification_ids
+            offering_orm.pricing_ids = offering_in.pricing_ids
+            offering_orm.sales_channels = offering_in.sales_channels
 
-        self.db.flush()
+            await self.db.flush()
 
-        event = OfferingUpdated(payload=offering_orm.to_domain().model_dump(mode="json"))
-        self._add_to_outbox("product.offering.events", event)
+            event = OfferingUpdated(payload=offering_orm.to_domain().model_dump(mode="json"))
+            self._add_to_outbox("product.offering.events", event)
 
-        self.db.commit()
         return offering_orm
 
-    def delete_offering(self, offering_id: uuid.UUID):
-        offering_orm = self.get_offering(offering_id)
+    async def delete_offering(self, offering_id: uuid.UUID):
+        offering_orm = await self.get_offering(offering_id)
 
         if offering_orm.lifecycle_status != LifecycleStatus.DRAFT.value:
             raise AppException(f"Cannot delete offering in {offering_orm.lifecycle_status} state", code="BAD_REQUEST")
 
-        self.repository.delete(offering_orm)
-        self.db.flush()
-
-        # No specific event for delete in the plan, but good practice
-        # self._add_to_outbox("product.offering.events", OfferingDeleted(...))
+        async with self.uow:
+            await self.repository.delete(offering_orm)
 
-        self.db.commit()
+            # No specific event for delete in the plan, but good practice
+            # self._add_to_outbox("product.offering.events", OfferingDeleted(...))
 
     async def initiate_publication(self, offering_id: uuid.UUID) -> ProductOfferingORM:
-        offering_orm = self.get_offering(offering_id)
+        offering_orm = await self.get_offering(offering_id)
         offering_domain = offering_orm.to_domain()
 
         try:
@@ -127,42 +344,127 @@ class OfferingService:
         except ValueError as e:
             raise AppException(str(e), code="BAD_REQUEST")
 
-        # Sync back to ORM
-        offering_orm.lifecycle_status = offering_domain.lifecycle_status.value
-        offering_orm.updated_at = offering_domain.updated_at
+        async with self.uow:
+            # Sync back to ORM
+            offering_orm.lifecycle_status = offering_domain.lifecycle_status.value
+            offering_orm.updated_at = offering_domain.updated_at
 
-        self.db.flush()
+            await self.db.flush()
 
-        event = OfferingPublicationInitiated(payload=offering_domain.model_dump(mode="json"))
-        self._add_to_outbox("product.offering.events", event)
+            event = OfferingPublicationInitiated(payload=offering_domain.model_dump(mode="json"))
+            self._add_to_outbox("product.offering.events", event)
 
-        # Start Camunda Saga
-        async with httpx.AsyncClient() as client:
-            try:
-                import json
-                # Variables to pass to the saga - use Json type for arrays
-                variables = {
-                    "offeringId": {"value": str(offering_id), "type": "String"},
-                    "specificationIds": {"value": json.dumps([str(sid) for sid in offering_orm.specification_ids]), "type": "Json"},
-                    "pricingIds": {"value": json.dumps([str(pid) for pid in offering_orm.pricing_ids]), "type": "Json"},
-                }
-
-                resp = await client.post(
-                    f"{settings.CAMUNDA_URL}/process-definition/key/offering-publication-saga/start",
-                    json={"variables": variables},
-                    timeout=10.0
+            # Queue the saga start; SagaStartRelay starts it once this transaction commits
+            self._add_saga_command(
+                "offering-publication-saga",
+                business_key=str(offering_id),
+                variables=self._publication_saga_variables(offering_orm),
+            )
+        return offering_orm
+
+    async def publish_batch(self, offering_ids: List[uuid.UUID]) -> Tuple[uuid.UUID, List[Dict[str, Any]]]:
+        """
+        Moves many DRAFT offerings to PUBLISHING in one transaction.
+
+        The transition is a single set-based UPDATE ... RETURNING; outbox events and
+        saga commands for the accepted offerings are then inserted in bulk and
+        dispatched asynchronously by the outbox listener and SagaStartRelay.
+
+        Returns:
+            The batch id and one result per requested offering.
+        """
+        batch_id = uuid.uuid4()
+        offering_ids = list(dict.fromkeys(offering_ids))
+        now = datetime.now(timezone.utc)
+
+        async with self.uow:
+            accepted = await self.repository.start_publication_many(offering_ids, now)
+            if accepted:
+                await self.db.execute(
+                    insert(OutboxORM),
+                    [
+                        {
+                            "topic": "product.offering.events",
+                            "payload": OfferingPublicationInitiated(
+                                payload=offering_orm.to_domain().model_dump(mode="json")
+                            ).model_dump(mode="json"),
+                        }
+                        for offering_orm in accepted
+                    ],
+                )
+                await self.db.execute(
+                    insert(SagaCommandORM),
+                    [
+                        {
+                            "process_key": "offering-publication-saga",
+                            "business_key": str(offering_orm.id),
+                            "batch_id": batch_id,
+                            "variables": self._publication_saga_variables(offering_orm),
+                        }
+                        for offering_orm in accepted
+                    ],
                 )
-                if resp.status_code != 200:
-                    logger.error(f"Failed to start Camunda process: {resp.status_code} - {resp.text}")
-                    # In a real system, we might want to retry or fail the initiation
-            except httpx.RequestError as e:
-                logger.error(f"Could not connect to Camunda: {str(e)}")
 
-        self.db.commit()
-        return offering_orm
+            accepted_ids = {offering_orm.id for offering_orm in accepted}
+            rejected = {
+                offering_orm.id: offering_orm
+                for offering_orm in await self.repository.get_many([i for i in offering_ids if i not in accepted_ids])
+            } if len(accepted_ids) < len(offering_ids) else {}
+
+        results = []
+        for offering_id in offering_ids:
+            if offering_id in accepted_ids:
+                results.append({"id": offering_id, "accepted": True, "lifecycle_status": LifecycleStatus.PUBLISHING})
+                continue
+            offering_orm = rejected.get(offering_id)
+            if offering_orm is None:
+                error = f"Offering with ID {offering_id} not found"
+            elif offering_orm.lifecycle_status != LifecycleStatus.DRAFT.value:
+                error = f"Cannot publish from {offering_orm.lifecycle_status} state"
+            else:
+                error = "Offering must have at least one specification, one price, and one channel to be published"
+            results.append({
+                "id": offering_id,
+                "accepted": False,
+                "lifecycle_status": offering_orm.lifecycle_status if offering_orm else None,
+                "error": error,
+            })
+
+        logger.info(f"Publish batch {batch_id}: {len(accepted_ids)}/{len(offering_ids)} offerings accepted")
+        return batch_id, results
+
+    async def get_publish_batch(self, batch_id: uuid.UUID) -> Dict[str, Any]:
+        """
+        Progress of a publish batch: its saga commands and offerings, counted by status.
+        """
+        sagas = dict(
+            (
+                await self.db.execute(
+                    select(SagaCommandORM.status, func.count())
+                    .where(SagaCommandORM.batch_id == batch_id)
+                    .group_by(SagaCommandORM.status)
+                )
+            ).all()
+        )
+        if not sagas:
+            raise NotFoundError(f"Publish batch with ID {batch_id} not found")
+
+        batch_offerings = select(cast(SagaCommandORM.business_key, PG_UUID(as_uuid=True))).where(
+            SagaCommandORM.batch_id == batch_id
+        )
+        offerings = dict(
+            (
+                await self.db.execute(
+                    select(ProductOfferingORM.lifecycle_status, func.count())
+                    .where(ProductOfferingORM.id.in_(batch_offerings))
+                    .group_by(ProductOfferingORM.lifecycle_status)
+                )
+            ).all()
+        )
+        return {"batch_id": batch_id, "total": sum(sagas.values()), "sagas": sagas, "offerings": offerings}
 
-    def retire_offering(self, offering_id: uuid.UUID) -> ProductOfferingORM:
-        offering_orm = self.get_offering(offering_id)
+    async def retire_offering(self, offering_id: uuid.UUID) -> ProductOfferingORM:
+        offering_orm = await self.get_offering(offering_id)
         offering_domain = offering_orm.to_domain()
 
         try:
@@ -170,20 +472,20 @@ class OfferingService:
         except ValueError as e:
             raise AppException(str(e), code="BAD_REQUEST")
 
-        offering_orm.lifecycle_status = offering_domain.lifecycle_status.value
-        offering_orm.retired_at = offering_domain.retired_at
-        offering_orm.updated_at = offering_domain.updated_at
+        async with self.uow:
+            offering_orm.lifecycle_status = offering_domain.lifecycle_status.value
+            offering_orm.retired_at = offering_domain.retired_at
+            offering_orm.updated_at = offering_domain.updated_at
 
-        self.db.flush()
+            await self.db.flush()
 
-        event = OfferingRetired(payload=offering_domain.model_dump(mode="json"))
-        self._add_to_outbox("product.offering.events", event)
+            event = OfferingRetired(payload=offering_domain.model_dump(mode="json"))
+            self._add_to_outbox("product.offering.events", event)
 
-        self.db.commit()
         return offering_orm
 
-    def confirm_publication(self, offering_id: uuid.UUID) -> ProductOfferingORM:
-        offering_orm = self.get_offering(offering_id)
+    async def confirm_publication(self, offering_id: uuid.UUID) -> ProductOfferingORM:
+        offering_orm = await self.get_offering(offering_id)
         offering_domain = offering_orm.to_domain()
 
         try:
@@ -191,31 +493,32 @@ class OfferingService:
         except ValueError as e:
             raise AppException(str(e), code="BAD_REQUEST")
 
-        offering_orm.lifecycle_status = offering_domain.lifecycle_status.value
-        offering_orm.published_at = offering_domain.published_at
-        offering_orm.updated_at = offering_domain.updated_at
+        async with self.uow:
+            offering_orm.lifecycle_status = offering_domain.lifecycle_status.value
+            offering_orm.published_at = offering_domain.published_at
+            offering_orm.updated_at = offering_domain.updated_at
 
-        self.db.flush()
+            await self.db.flush()
 
-        event = OfferingPublished(payload=offering_domain.model_dump(mode="json"))
-        self._add_to_outbox("product.offering.events", event)
+            event = OfferingPublished(payload=offering_domain.model_dump(mode="json"))
+            self._add_to_outbox("product.offering.events", event)
 
-        self.db.commit()
         return offering_orm
 
-    def fail_publication(self, offering_id: uuid.UUID) -> ProductOfferingORM:
-        offering_orm = self.get_offering(offering_id)
+    async def fail_publication(self, offering_id: uuid.UUID) -> ProductOfferingORM:
+        offering_orm = await self.get_offering(offering_id)
         offering_domain = offering_orm.to_domain()
 
         offering_domain.fail_publication()
-        offering_orm.lifecycle_status = offering_domain.lifecycle_status.value
-        offering_orm.updated_at = offering_domain.updated_at
 
-        self.db.flush()
+        async with self.uow:
+            offering_orm.lifecycle_status = offering_domain.lifecycle_status.value
+            offering_orm.updated_at = offering_domain.updated_at
+
+            await self.db.flush()
 
-        # We can add an OfferingPublicationFailed event if needed
-        # event = OfferingPublicationFailed(payload=offering_domain.model_dump(mode="json"))
-        # self._add_to_outbox("product.offering.events", event)
+            # We can add an OfferingPublicationFailed event if needed
+            # event = OfferingPublicationFailed(payload=offering_domain.model_dump(mode="json"))
+            # self._add_to_outbox("product.offering.events", event)
 
-        self.db.commit()
         return offering_orm
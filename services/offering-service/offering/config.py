@@ -20,8 +20,26 @@ class OfferingSettings(BaseServiceSettings):
     OFFERING_SERVICE_URL: str = "http://localhost:8005"
     STORE_SERVICE_URL: str = "http://localhost:8006"
 
+    # Check references against the event-fed local caches before calling the owning services
+    REFERENCE_CACHE_ENABLED: bool = True
+
+    # Cross-service ID validation (one pooled client, bounded fan-out when batch-get is missing)
+    REFERENCE_VALIDATION_CONCURRENCY: int = 10
+    REFERENCE_VALIDATION_TIMEOUT: float = 5.0
+
     # Camunda Settings
     CAMUNDA_URL: str = "http://localhost:8085/engine-rest"
 
+    # Bulk import (POST /api/v1/offerings/import): lines validated and loaded together
+    IMPORT_CHUNK_SIZE: int = 1000
+
+    # Saga start relay (saga_commands table -> Camunda process instances)
+    SAGA_RELAY_BATCH_SIZE: int = 50
+    SAGA_RELAY_CONCURRENCY: int = 10  # Process starts in flight at once
+    SAGA_RELAY_POLL_INTERVAL: float = 0.5  # Seconds between polls when idle
+    SAGA_RELAY_MAX_ATTEMPTS: int = 5
+    SAGA_RELAY_LEASE: float = 30.0  # Seconds before an unfinished claim is retried (raised to outlast a batch)
+    SAGA_RELAY_REQUEST_TIMEOUT: float = 10.0  # Seconds per Camunda process start
+
 
 settings = OfferingSettings()
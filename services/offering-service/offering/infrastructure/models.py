@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, timezone
 
 from common.database.outbox import OutboxMixin
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 
 from ..domain.models import LifecycleStatus, ProductOffering
@@ -11,6 +11,15 @@ from .database import Base
 
 class ProductOfferingORM(Base):
     __tablename__ = "product_offerings"
+    # Keyset pagination order, alone and behind the status filter, and
+    # containment (@>) lookups for the sales channel and reference filters
+    __table_args__ = (
+        Index("ix_product_offerings_created_at_id", "created_at", "id"),
+        Index("ix_product_offerings_lifecycle_status_created_at_id", "lifecycle_status", "created_at", "id"),
+        Index("ix_product_offerings_sales_channels", "sales_channels", postgresql_using="gin"),
+        Index("ix_product_offerings_specification_ids", "specification_ids", postgresql_using="gin"),
+        Index("ix_product_offerings_pricing_ids", "pricing_ids", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(200), nullable=False, index=True)
@@ -58,5 +67,49 @@ class ProductOfferingORM(Base):
         )
 
 
+class CachedSpecificationORM(Base):
+    """
+    Local read-only cache of valid specification IDs, fed by specification events.
+    """
+    __tablename__ = "cached_specifications"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    name = Column(String(200), nullable=True)
+    last_updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+class CachedPriceORM(Base):
+    """
+    Local read-only cache of valid price IDs, fed by pricing events.
+    """
+    __tablename__ = "cached_prices"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    name = Column(String(200), nullable=True)
+    last_updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+class SagaCommandORM(Base):
+    """
+    Saga start written in the same transaction as the state change that needs it
+    and started asynchronously by `SagaStartRelay`.
+    """
+    __tablename__ = "saga_commands"
+    __table_args__ = (Index("ix_saga_commands_status_next_attempt_at", "status", "next_attempt_at"),)
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    process_key = Column(String(255), nullable=False)
+    business_key = Column(String(255), nullable=True)
+    batch_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+    variables = Column(JSON, nullable=False)
+    status = Column(String(20), nullable=False, default="PENDING")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
+    process_instance_id = Column(String(64), nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    processed_at = Column(DateTime, nullable=True)
+    error_message = Column(String, nullable=True)
+
+
 class OutboxORM(Base, OutboxMixin):
     __tablename__ = "outbox"
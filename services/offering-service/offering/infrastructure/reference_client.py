@@ -0,0 +1,124 @@
+"""
+HTTP client used to check that referenced specifications and prices exist.
+
+One pooled `httpx.AsyncClient` is shared by every validation. Each service is
+asked once through its `POST /api/v1/{resource}/batch-get` endpoint; services
+that do not expose it yet are queried per id, concurrently but bounded by a
+semaphore.
+
+Only a 404 for an id means the reference does not exist. Any other failure
+(5xx, unexpected status, transport error) is a `ServiceUnavailableError`, so
+an overloaded peer fails the write as unavailable rather than as invalid input,
+and is not retried id by id.
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+from common.deadline import propagate_deadline
+from common.exceptions import ServiceUnavailableError
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# Statuses meaning "this service has no batch-get endpoint"
+_BATCH_UNSUPPORTED = {404, 405}
+
+
+def _unavailable(service: str, resp: httpx.Response) -> ServiceUnavailableError:
+    logger.warning(f"{service} Service lookup {resp.request.url} failed with HTTP {resp.status_code}")
+    return ServiceUnavailableError(
+        f"{service} Service could not validate references (HTTP {resp.status_code})",
+        details={"status_code": resp.status_code},
+    )
+
+
+class ReferenceClient:
+    def __init__(
+        self,
+        concurrency: int = 10,
+        timeout: float = 5.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._batch_supported: Dict[str, bool] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.concurrency * 2),
+                event_hooks={"request": [propagate_deadline]},
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def find_missing(
+        self, service: str, base_url: str, resource: str, ids: Sequence[uuid.UUID]
+    ) -> List[uuid.UUID]:
+        """
+        Return the ids that `resource` (e.g. `specifications`) does not know.
+
+        Raises:
+            ServiceUnavailableError: If the owning service cannot be reached.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+
+        url = f"{base_url}/api/v1/{resource}"
+        try:
+            if self._batch_supported.get(url, True):
+                missing = await self._find_missing_batch(service, url, ids)
+                if missing is not None:
+                    return missing
+            return await self._find_missing_each(service, url, ids)
+        except httpx.RequestError as e:
+            raise ServiceUnavailableError(f"Could not connect to {service} Service: {str(e)}")
+
+    async def _find_missing_batch(
+        self, service: str, url: str, ids: List[uuid.UUID]
+    ) -> Optional[List[uuid.UUID]]:
+        """The missing ids, or None when the service has no batch-get endpoint."""
+        resp = await self.client.post(f"{url}/batch-get", json={"ids": [str(i) for i in ids]})
+        if resp.status_code == 200:
+            return [uuid.UUID(i) for i in resp.json()["missing"]]
+        if resp.status_code in _BATCH_UNSUPPORTED:
+            logger.info(f"{url} has no batch-get endpoint, validating ids one by one")
+            self._batch_supported[url] = False
+            return None
+        raise _unavailable(service, resp)
+
+    async def _find_missing_each(self, service: str, url: str, ids: List[uuid.UUID]) -> List[uuid.UUID]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def exists(ref_id: uuid.UUID) -> bool:
+            async with semaphore:
+                resp = await self.client.get(f"{url}/{ref_id}")
+            if resp.status_code == 200:
+                return True
+            if resp.status_code == 404:
+                return False
+            raise _unavailable(service, resp)
+
+        found = await asyncio.gather(*(exists(ref_id) for ref_id in ids))
+        return [ref_id for ref_id, ok in zip(ids, found) if not ok]
+
+
+reference_client = ReferenceClient(
+    concurrency=settings.REFERENCE_VALIDATION_CONCURRENCY,
+    timeout=settings.REFERENCE_VALIDATION_TIMEOUT,
+)
@@ -1,32 +1,111 @@
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Tuple
 
-from sqlalchemy.orm import Session
+from common.database.pagination import Page, keyset_paginate_async
+from sqlalchemy import any_, bindparam, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..domain.models import LifecycleStatus, ProductOffering
 from .models import ProductOfferingORM
 
 
+def _uuid_array(name: str, ids: List[uuid.UUID]):
+    return bindparam(name, ids, type_=ARRAY(UUID(as_uuid=True)))
+
+
+_COPY_COLUMNS = (
+    "id", "name", "description", "specification_ids", "pricing_ids", "sales_channels",
+    "lifecycle_status", "created_at", "updated_at",
+)
+
+
+def _copy_record(offering: ProductOffering) -> Tuple[Any, ...]:
+    """One COPY row in `_COPY_COLUMNS` order; asyncpg encodes the values in binary format."""
+    return (
+        offering.id, offering.name, offering.description, offering.specification_ids,
+        offering.pricing_ids, offering.sales_channels, offering.lifecycle_status.value,
+        offering.created_at, offering.updated_at,
+    )
+
+
 class OfferingRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     def create(self, offering_orm: ProductOfferingORM) -> ProductOfferingORM:
+        # Staged only; the service's unit of work commits it with the outbox row
         self.db.add(offering_orm)
-        self.db.commit()
-        self.db.refresh(offering_orm)
         return offering_orm
 
-    def get_by_id(self, offering_id: uuid.UUID) -> Optional[ProductOfferingORM]:
-        return self.db.query(ProductOfferingORM).filter(ProductOfferingORM.id == offering_id).first()
+    async def get_by_id(self, offering_id: uuid.UUID) -> Optional[ProductOfferingORM]:
+        return await self.db.get(ProductOfferingORM, offering_id)
 
-    def list(self, skip: int = 0, limit: int = 100) -> List[ProductOfferingORM]:
-        return self.db.query(ProductOfferingORM).offset(skip).limit(limit).all()
+    async def get_many(self, offering_ids: List[uuid.UUID]) -> List[ProductOfferingORM]:
+        stmt = select(ProductOfferingORM).where(ProductOfferingORM.id == any_(_uuid_array("ids", offering_ids)))
+        return list(await self.db.scalars(stmt))
 
-    def update(self, offering_orm: ProductOfferingORM) -> ProductOfferingORM:
-        self.db.commit()
-        self.db.refresh(offering_orm)
-        return offering_orm
+    async def start_publication_many(self, offering_ids: List[uuid.UUID], now: datetime) -> List[ProductOfferingORM]:
+        """
+        DRAFT -> PUBLISHING for every publishable offering in one UPDATE ... RETURNING.
+        The WHERE clause mirrors `ProductOffering.publish()`.
+        """
+        stmt = (
+            update(ProductOfferingORM)
+            .where(
+                ProductOfferingORM.id == any_(_uuid_array("ids", offering_ids)),
+                ProductOfferingORM.lifecycle_status == LifecycleStatus.DRAFT.value,
+                func.cardinality(ProductOfferingORM.specification_ids) > 0,
+                func.cardinality(ProductOfferingORM.pricing_ids) > 0,
+                func.cardinality(ProductOfferingORM.sales_channels) > 0,
+            )
+            .values(lifecycle_status=LifecycleStatus.PUBLISHING.value, updated_at=now)
+            .returning(ProductOfferingORM)
+            .execution_options(synchronize_session=False)
+        )
+        return list(await self.db.scalars(stmt))
+
+    async def copy_many(self, offerings: List[ProductOffering]) -> None:
+        """
+        Bulk-load offerings with a single binary COPY on the session's connection
+        (part of the current transaction; the caller commits).
+        """
+        connection = await self.db.connection()
+        raw = (await connection.get_raw_connection()).driver_connection
+        await raw.copy_records_to_table(
+            ProductOfferingORM.__tablename__,
+            records=[_copy_record(offering) for offering in offerings],
+            columns=list(_COPY_COLUMNS),
+        )
+
+    async def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        skip: int = 0,
+        lifecycle_status: Optional[LifecycleStatus] = None,
+        sales_channel: Optional[str] = None,
+        price_id: Optional[uuid.UUID] = None,
+        spec_id: Optional[uuid.UUID] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Page:
+        """Page of `ProductOfferingORM` instances, or of `Row`s holding just the `fields` columns."""
+        if fields is None:
+            stmt = select(ProductOfferingORM)
+        else:
+            stmt = select(*(getattr(ProductOfferingORM, name) for name in fields))
+        if lifecycle_status is not None:
+            stmt = stmt.where(ProductOfferingORM.lifecycle_status == lifecycle_status.value)
+        if sales_channel is not None:
+            # sales_channels @> ARRAY[:channel], served by the GIN index
+            stmt = stmt.where(ProductOfferingORM.sales_channels.contains([sales_channel]))
+        # Reverse references, each served by its own GIN index
+        if price_id is not None:
+            stmt = stmt.where(ProductOfferingORM.pricing_ids.contains([price_id]))
+        if spec_id is not None:
+            stmt = stmt.where(ProductOfferingORM.specification_ids.contains([spec_id]))
+        return await keyset_paginate_async(self.db, stmt, ProductOfferingORM, limit, after=after, skip=skip)
 
-    def delete(self, offering_orm: ProductOfferingORM):
-        self.db.delete(offering_orm)
-        self.db.commit()
+    async def delete(self, offering_orm: ProductOfferingORM):
+        await self.db.delete(offering_orm)
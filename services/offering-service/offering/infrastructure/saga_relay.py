@@ -0,0 +1,235 @@
+"""
+Asynchronous relay for saga start commands.
+
+Request handlers only insert a `SagaCommandORM` row next to their state change.
+`SagaStartRelay` claims due commands in batches (`FOR UPDATE SKIP LOCKED`, so
+several service replicas can run it side by side), starts the Camunda process
+instances concurrently over one pooled client and records the outcome. Failed
+starts are retried with exponential backoff until `max_attempts`. A timed-out
+start may still have created the instance, so a retry first looks for a
+running instance with the command's business key and records that one
+instead of starting a second.
+
+A claimed batch is leased rather than kept locked while Camunda is called: if
+the relay dies mid-batch, its commands become due again once the lease expires.
+Each start is cut off after `request_timeout`, and the lease is never shorter
+than the slowest possible batch (`ceil(batch_size / concurrency)` rounds of
+two `request_timeout`s, plus `LEASE_MARGIN`), so no other replica can reclaim a
+command that is still being sent.
+"""
+
+import asyncio
+import logging
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional, Tuple
+
+import httpx
+
+from .models import SagaCommandORM
+
+logger = logging.getLogger(__name__)
+
+# Headroom of the lease over the worst-case batch duration (recording, scheduling delays)
+LEASE_MARGIN = 1.5
+
+
+class SagaStartRelay:
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        camunda_url: str,
+        batch_size: int = 50,
+        concurrency: int = 10,
+        poll_interval: float = 0.5,
+        max_attempts: int = 5,
+        lease: float = 30.0,
+        request_timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.session_factory = session_factory
+        self.camunda_url = camunda_url
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.request_timeout = request_timeout
+        self.lease = max(lease, self.max_batch_duration * LEASE_MARGIN)
+        if self.lease > lease:
+            logger.warning(
+                f"Saga relay lease raised from {lease}s to {self.lease}s to outlast a batch of "
+                f"{batch_size} starts at concurrency {concurrency} and a {request_timeout}s timeout"
+            )
+        self.transport = transport
+        self.stop_event = asyncio.Event()
+
+    @property
+    def max_batch_duration(self) -> float:
+        """
+        Seconds the slowest batch can take: every round of starts running into the
+        timeout twice (a retry looks up an existing instance before starting one).
+        """
+        return math.ceil(self.batch_size / self.concurrency) * 2 * self.request_timeout
+
+    async def run(self):
+        """Main loop: drain due commands, then sleep until the next poll."""
+        async with httpx.AsyncClient(
+            timeout=self.request_timeout,
+            limits=httpx.Limits(max_connections=self.concurrency),
+            transport=self.transport,
+        ) as client:
+            logger.info("Saga start relay started")
+            while not self.stop_event.is_set():
+                try:
+                    started = await self.process_batch(client)
+                except Exception as e:
+                    logger.error(f"Saga start relay error: {str(e)}")
+                    started = 0
+                if started < self.batch_size:
+                    await asyncio.sleep(self.poll_interval)
+
+    async def process_batch(self, client: httpx.AsyncClient) -> int:
+        """
+        Claim and start one batch of due commands.
+
+        Returns:
+            The number of commands claimed.
+        """
+        loop = asyncio.get_running_loop()
+        claimed = await loop.run_in_executor(None, self._claim_sync)
+        if not claimed:
+            return 0
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def start(command: dict) -> Tuple[Any, Optional[str], Optional[str]]:
+            async with semaphore:
+                return (command["id"], *await self._start_process(client, command))
+
+        results = await asyncio.gather(*(start(command) for command in claimed))
+        await loop.run_in_executor(None, self._record_sync, results)
+        return len(claimed)
+
+    async def _start_process(self, client: httpx.AsyncClient, command: dict) -> Tuple[Optional[str], Optional[str]]:
+        """Returns `(process_instance_id, error)`."""
+        if command["attempts"] > 1:
+            # An earlier attempt may have started the instance before timing out (or
+            # before the relay died); Camunda does not enforce unique business keys
+            existing, error = await self._find_process(client, command)
+            if error is not None or existing is not None:
+                return existing, error
+
+        resp, error = await self._send(
+            client,
+            "POST",
+            f"{self.camunda_url}/process-definition/key/{command['process_key']}/start",
+            json={"variables": command["variables"], "businessKey": command["business_key"]},
+        )
+        if error is not None:
+            return None, error
+        return resp.json().get("id"), None
+
+    async def _find_process(self, client: httpx.AsyncClient, command: dict) -> Tuple[Optional[str], Optional[str]]:
+        """Returns `(id of a running instance for the command's business key, error)`."""
+        resp, error = await self._send(
+            client,
+            "GET",
+            f"{self.camunda_url}/process-instance",
+            params={"businessKey": command["business_key"], "processDefinitionKey": command["process_key"]},
+        )
+        if error is not None:
+            return None, error
+        instances = resp.json()
+        if instances:
+            logger.info(f"Saga command {command['id']} was already started as {instances[0]['id']}")
+            return instances[0]["id"], None
+        return None, None
+
+    async def _send(
+        self, client: httpx.AsyncClient, method: str, url: str, **kwargs: Any
+    ) -> Tuple[Optional[httpx.Response], Optional[str]]:
+        """Returns `(200 response, error)`."""
+        try:
+            # httpx applies its timeout per phase; this bounds the whole request
+            async with asyncio.timeout(self.request_timeout):
+                resp = await client.request(method, url, **kwargs)
+        except TimeoutError:
+            return None, f"Camunda did not answer within {self.request_timeout}s"
+        except httpx.RequestError as e:
+            return None, f"Could not connect to Camunda: {str(e)}"
+        if resp.status_code != 200:
+            return None, f"Camunda returned {resp.status_code}: {resp.text[:500]}"
+        return resp, None
+
+    def _claim_sync(self) -> List[dict]:
+        session = self.session_factory()
+        try:
+            now = datetime.now(timezone.utc)
+            commands = (
+                session.query(SagaCommandORM)
+                .filter(
+                    SagaCommandORM.status.in_(("PENDING", "IN_FLIGHT")),
+                    SagaCommandORM.next_attempt_at <= now,
+                )
+                .order_by(SagaCommandORM.next_attempt_at.asc())
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            claimed = []
+            for command in commands:
+                command.status = "IN_FLIGHT"
+                command.attempts += 1
+                command.next_attempt_at = now + timedelta(seconds=self.lease)
+                claimed.append(
+                    {
+                        "id": command.id,
+                        "process_key": command.process_key,
+                        "business_key": command.business_key,
+                        "variables": command.variables,
+                        "attempts": command.attempts,
+                    }
+                )
+            session.commit()
+            if claimed:
+                logger.info(f"Claimed {len(claimed)} saga start commands")
+            return claimed
+        finally:
+            session.close()
+
+    def _record_sync(self, results: List[Tuple[Any, Optional[str], Optional[str]]]):
+        session = self.session_factory()
+        try:
+            now = datetime.now(timezone.utc)
+            commands = {
+                command.id: command
+                for command in session.query(SagaCommandORM)
+                .filter(SagaCommandORM.id.in_([command_id for command_id, _, _ in results]))
+                .all()
+            }
+            for command_id, instance_id, error in results:
+                command = commands.get(command_id)
+                if command is None:
+                    continue
+                if error is None:
+                    command.status = "STARTED"
+                    command.process_instance_id = instance_id
+                    command.processed_at = now
+                    command.error_message = None
+                    continue
+
+                command.error_message = error
+                if command.attempts >= self.max_attempts:
+                    logger.error(f"Giving up on saga command {command_id}: {error}")
+                    command.status = "FAILED"
+                    command.processed_at = now
+                else:
+                    logger.warning(f"Saga command {command_id} failed (attempt {command.attempts}): {error}")
+                    command.status = "PENDING"
+                    command.next_attempt_at = now + timedelta(seconds=min(2 ** command.attempts, 60))
+            session.commit()
+        finally:
+            session.close()
+
+    def stop(self):
+        self.stop_event.set()
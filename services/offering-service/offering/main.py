@@ -5,27 +5,49 @@ Provides CRUD operations for product offerings with saga orchestration for publi
 """
 
 import asyncio
+import json
 import uuid
 from contextlib import asynccontextmanager
-from typing import List
+from typing import List, Optional
 
 import httpx
+from common.database.engine import listen_dsn
 from common.database.outbox import OutboxListener
+from common.database.pagination import NEXT_CURSOR_HEADER
+from common.deadline import DeadlineMiddleware
 from common.exceptions import AppException
 from common.logging import setup_logging
 from common.messaging import RabbitMQPublisher
-from common.schemas import ErrorDetail, ErrorResponse
-from common.security import RoleChecker, get_current_user, security
+from common.metrics import metrics
+from common.schemas import ChangesResponse, ErrorDetail, ErrorResponse
+from common.security import (
+    INTERNAL_IDENTITY_HEADER,
+    RoleChecker,
+    get_current_user,
+    security,
+)
+from common.serialization import JSONRowsResponse
 from common.tracing import instrument_fastapi, instrument_httpx, setup_tracing
-from fastapi import Depends, FastAPI, Query, status
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-
-from .application.schemas import OfferingCreate, OfferingRead, OfferingUpdate
+from fastapi import Depends, FastAPI, Query, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .application.consumers import price_consumer, specification_consumer
+from .application.schemas import (
+    OfferingCreate,
+    OfferingRead,
+    OfferingUpdate,
+    PublishBatchRequest,
+    PublishBatchResponse,
+    PublishBatchStatus,
+)
 from .application.service import OfferingService
 from .config import settings
-from .infrastructure.database import SessionLocal, get_db
+from .domain.models import LifecycleStatus
+from .infrastructure.database import SessionLocal, get_db, get_read_db
 from .infrastructure.models import OutboxORM
+from .infrastructure.reference_client import reference_client
+from .infrastructure.saga_relay import SagaStartRelay
 
 # Setup logging first
 logger = setup_logging(settings.SERVICE_NAME, settings.LOG_LEVEL)
@@ -42,11 +64,13 @@ instrument_httpx()
 
 # Global background tasks
 outbox_task = None
+consumer_tasks: List[asyncio.Task] = []
+saga_relay_task = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global outbox_task
+    global outbox_task, consumer_tasks, saga_relay_task
     logger.info("Starting up offering-service")
 
     # Fetch JWT public key from Identity Service with retries
@@ -71,11 +95,8 @@ async def lifespan(app: FastAPI):
     publisher = RabbitMQPublisher(settings.RABBITMQ_URL)
 
     # Initialize Outbox Listener
-    dsn = (
-        settings.DATABASE_URL.replace("postgresql://", "postgres://")
-        if settings.DATABASE_URL
-        else None
-    )
+    # Dedicated LISTEN connection (direct to Postgres when DB_LISTEN_URL is set)
+    dsn = listen_dsn(settings.DATABASE_URL, settings.DB_LISTEN_URL) if settings.DATABASE_URL else None
 
     if dsn:
         listener = OutboxListener(
@@ -86,20 +107,49 @@ async def lifespan(app: FastAPI):
         )
         outbox_task = asyncio.create_task(listener.run())
         logger.info("Outbox listener background task started")
+
+        # Reference cache consumers (specification and price IDs used for validation)
+        consumer_tasks = [
+            asyncio.create_task(specification_consumer().run()),
+            asyncio.create_task(price_consumer().run()),
+        ]
+        logger.info("Reference cache consumers background tasks started")
+
+        # Saga start relay (starts queued Camunda process instances)
+        saga_relay = SagaStartRelay(
+            session_factory=SessionLocal,
+            camunda_url=settings.CAMUNDA_URL,
+            batch_size=settings.SAGA_RELAY_BATCH_SIZE,
+            concurrency=settings.SAGA_RELAY_CONCURRENCY,
+            poll_interval=settings.SAGA_RELAY_POLL_INTERVAL,
+            max_attempts=settings.SAGA_RELAY_MAX_ATTEMPTS,
+            lease=settings.SAGA_RELAY_LEASE,
+            request_timeout=settings.SAGA_RELAY_REQUEST_TIMEOUT,
+        )
+        saga_relay_task = asyncio.create_task(saga_relay.run())
+        logger.info("Saga start relay background task started")
     else:
-        logger.warning("DATABASE_URL not set, outbox listener not started")
+        logger.warning("DATABASE_URL not set, background tasks not started")
 
     yield
 
     # Shutdown tasks
     if outbox_task:
         outbox_task.cancel()
+    for task in consumer_tasks:
+        task.cancel()
+    if saga_relay_task:
+        saga_relay_task.cancel()
 
     try:
         if outbox_task:
             await outbox_task
     except asyncio.CancelledError:
         pass
+    await asyncio.gather(
+        *consumer_tasks, *([saga_relay_task] if saga_relay_task else []), return_exceptions=True
+    )
+    await reference_client.aclose()
     logger.info("Shutdown complete")
 
 
@@ -113,6 +163,9 @@ app = FastAPI(
 # Instrument FastAPI for tracing
 instrument_fastapi(app, excluded_urls="health")
 
+# Enforce the request deadline propagated by the API Gateway
+app.add_middleware(DeadlineMiddleware)
+
 
 @app.exception_handler(AppException)
 async def custom_app_exception_handler(request, exc: AppException):
@@ -139,11 +192,18 @@ async def custom_app_exception_handler(request, exc: AppException):
 
 
 # Security dependency override to inject public key
-def get_current_user_with_key(token=Depends(security)):
+def get_current_user_with_key(request: Request, token=Depends(security)):
     public_key = (
         settings.JWT_PUBLIC_KEY.replace("\\n", "\n") if settings.JWT_PUBLIC_KEY else None
     )
-    return get_current_user(token=token, public_key=public_key, algorithm=settings.JWT_ALGORITHM)
+    return get_current_user(
+        token=token,
+        public_key=public_key,
+        algorithm=settings.JWT_ALGORITHM,
+        # Identity already verified by the API Gateway (skips RSA verification)
+        internal_identity=request.headers.get(INTERNAL_IDENTITY_HEADER),
+        identity_secret=settings.INTERNAL_IDENTITY_SECRET,
+    )
 
 
 app.dependency_overrides[get_current_user] = get_current_user_with_key
@@ -158,25 +218,95 @@ async def health_check():
     return {"status": "healthy", "service": settings.SERVICE_NAME}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Expose in-process metrics (database pool checkouts, waits and saturation)."""
+    return metrics.snapshot()
+
+
 @app.post(
     "/api/v1/offerings",
     response_model=OfferingRead,
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(admin_required)],
 )
-async def create_offering(offering_in: OfferingCreate, db: Session = Depends(get_db)):
+async def create_offering(offering_in: OfferingCreate, db: AsyncSession = Depends(get_db)):
     service = OfferingService(db)
     return await service.create_offering(offering_in)
 
 
+@app.post(
+    "/api/v1/offerings/import",
+    dependencies=[Depends(admin_required)],
+    response_class=StreamingResponse,
+)
+async def import_offerings(request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    Bulk import from an NDJSON body; per-line results are streamed back as NDJSON.
+    """
+    service = OfferingService(db)
+
+    async def results():
+        async for result in service.import_offerings(request.stream()):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
+@app.get(
+    "/api/v1/offerings/by-reference",
+    response_model=List[OfferingRead],
+    # No auth required for internal service-to-service calls
+)
+async def list_offerings_by_reference(
+    price_id: Optional[uuid.UUID] = None,
+    spec_id: Optional[uuid.UUID] = None,
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Offerings that use a price and/or a specification, keyset-paginated like
+    the listing. Served from the primary: callers use it to guard deletes of
+    referenced entities, which a lagging replica could let through.
+    """
+    service = OfferingService(db)
+    page = await service.list_offerings_by_reference(
+        price_id=price_id, spec_id=spec_id, limit=limit, after=after, fields=OfferingRead.model_fields
+    )
+    response = JSONRowsResponse(page.items)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
+
+
+@app.get(
+    "/api/v1/offerings/changes",
+    response_model=ChangesResponse[OfferingRead],
+    # No auth required for internal service-to-service calls
+)
+async def list_offering_changes(
+    since: Optional[str] = Query(None, description="next_cursor of the previous page; omit to start from the beginning"),
+    limit: int = Query(1000, ge=1, le=5000),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Changefeed for catching up without replaying every event: ordered upserts
+    (current state) and tombstones. Keep calling with `next_cursor` while
+    `has_more` is true; later calls pick up new changes from there.
+    """
+    service = OfferingService(db)
+    return await service.list_changes(since=since, limit=limit)
+
+
 @app.get(
     "/api/v1/offerings/{offering_id}",
     response_model=OfferingRead,
     # No auth required for internal service-to-service calls
 )
-def get_offering(offering_id: uuid.UUID, db: Session = Depends(get_db)):
+async def get_offering(offering_id: uuid.UUID, db: AsyncSession = Depends(get_read_db)):
     service = OfferingService(db)
-    return service.get_offering(offering_id)
+    return await service.get_offering(offering_id)
 
 
 @app.get(
@@ -184,13 +314,32 @@ def get_offering(offering_id: uuid.UUID, db: Session = Depends(get_db)):
     response_model=List[OfferingRead],
     # No auth required for internal service-to-service calls
 )
-def list_offerings(
-    skip: int = Query(0, ge=0),
+async def list_offerings(
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    skip: int = Query(0, ge=0, description="Offset paging, ignored when `after` is given"),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db),
+    lifecycle_status: Optional[LifecycleStatus] = None,
+    sales_channel: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
 ):
+    """
+    Keyset-paginated listing in creation order. When more rows follow, the
+    cursor of the next page is returned in the `X-Next-Cursor` header.
+    """
     service = OfferingService(db)
-    return service.list_offerings(skip=skip, limit=limit)
+    # Only the response columns, rendered to JSON without per-row model validation
+    page = await service.list_offerings(
+        limit=limit,
+        after=after,
+        skip=skip,
+        lifecycle_status=lifecycle_status,
+        sales_channel=sales_channel,
+        fields=OfferingRead.model_fields,
+    )
+    response = JSONRowsResponse(page.items)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
 
 
 @app.put(
@@ -199,7 +348,7 @@ def list_offerings(
     dependencies=[Depends(admin_required)],
 )
 async def update_offering(
-    offering_id: uuid.UUID, offering_in: OfferingUpdate, db: Session = Depends(get_db)
+    offering_id: uuid.UUID, offering_in: OfferingUpdate, db: AsyncSession = Depends(get_db)
 ):
     service = OfferingService(db)
     return await service.update_offering(offering_id, offering_in)
@@ -210,9 +359,9 @@ async def update_offering(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(admin_required)],
 )
-def delete_offering(offering_id: uuid.UUID, db: Session = Depends(get_db)):
+async def delete_offering(offering_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     service = OfferingService(db)
-    service.delete_offering(offering_id)
+    await service.delete_offering(offering_id)
     return None
 
 
@@ -221,19 +370,47 @@ def delete_offering(offering_id: uuid.UUID, db: Session = Depends(get_db)):
     response_model=OfferingRead,
     dependencies=[Depends(admin_required)],
 )
-async def publish_offering(offering_id: uuid.UUID, db: Session = Depends(get_db)):
+async def publish_offering(offering_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     service = OfferingService(db)
     return await service.initiate_publication(offering_id)
 
 
+@app.post(
+    "/api/v1/offerings/publish-batch",
+    response_model=PublishBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(admin_required)],
+)
+async def publish_offerings_batch(batch_in: PublishBatchRequest, db: AsyncSession = Depends(get_db)):
+    service = OfferingService(db)
+    batch_id, results = await service.publish_batch(batch_in.offering_ids)
+    accepted = sum(1 for result in results if result["accepted"])
+    return {
+        "batch_id": batch_id,
+        "accepted": accepted,
+        "rejected": len(results) - accepted,
+        "results": results,
+    }
+
+
+@app.get(
+    "/api/v1/offerings/publish-batch/{batch_id}",
+    response_model=PublishBatchStatus,
+    dependencies=[Depends(admin_required)],
+)
+async def get_publish_batch(batch_id: uuid.UUID, db: AsyncSession = Depends(get_read_db)):
+    service = OfferingService(db)
+    return await service.get_publish_batch(batch_id)
+
+
 @app.post(
     "/api/v1/offerings/{offering_id}/retire",
     response_model=OfferingRead,
     dependencies=[Depends(admin_required)],
 )
-def retire_offering(offering_id: uuid.UUID, db: Session = Depends(get_db)):
+async def retire_offering(offering_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     service = OfferingService(db)
-    return service.retire_offering(offering_id)
+    return await service.retire_offering(offering_id)
 
 
 @app.post(
@@ -241,9 +418,9 @@ def retire_offering(offering_id: uuid.UUID, db: Session = Depends(get_db)):
     response_model=OfferingRead,
     dependencies=[Depends(admin_required)],
 )
-def confirm_offering(offering_id: uuid.UUID, db: Session = Depends(get_db)):
+async def confirm_offering(offering_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     service = OfferingService(db)
-    return service.confirm_publication(offering_id)
+    return await service.confirm_publication(offering_id)
 
 
 @app.post(
@@ -251,9 +428,9 @@ def confirm_offering(offering_id: uuid.UUID, db: Session = Depends(get_db)):
     response_model=OfferingRead,
     dependencies=[Depends(admin_required)],
 )
-def fail_offering(offering_id: uuid.UUID, db: Session = Depends(get_db)):
+async def fail_offering(offering_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     service = OfferingService(db)
-    return service.fail_publication(offering_id)
+    return await service.fail_publication(offering_id)
 
 
 if __name__ == "__main__":
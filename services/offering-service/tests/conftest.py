@@ -11,7 +11,7 @@ BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../"))
 sys.path.insert(0, BASE_DIR)
 
 import offering.main as main_module  # noqa: E402
-from offering.infrastructure.database import get_db  # noqa: E402
+from offering.infrastructure.database import get_db, get_read_db  # noqa: E402
 from offering.main import admin_required, any_user_required, app  # noqa: E402
 
 
@@ -34,6 +34,7 @@ def client(db_session_mock, mock_admin):
         yield db_session_mock
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[admin_required] = lambda: mock_admin
     app.dependency_overrides[any_user_required] = lambda: mock_admin
 
@@ -48,11 +48,7 @@ def test_publish_offering_flow(client: TestClient):
         "pricing_ids": [str(uuid.uuid4())],
         "sales_channels": ["WEB"],
     }
-    with (
-        patch("offering.application.service.OfferingService._validate_external_ids", new_callable=AsyncMock),
-        patch("offering.application.service.httpx.AsyncClient.post", new_callable=AsyncMock) as mock_camunda_post,
-    ):
-        mock_camunda_post.return_value = AsyncMock(status_code=200)
+    with patch("offering.application.service.OfferingService._validate_external_ids", new_callable=AsyncMock):
         resp = client.post("/api/v1/offerings", json=offering_data)
         offering_id = resp.json()["id"]
 
@@ -68,11 +64,7 @@ def test_publish_offering_flow(client: TestClient):
 
 
 def test_update_restricted_to_draft(client: TestClient):
-    with (
-        patch("offering.application.service.OfferingService._validate_external_ids", new_callable=AsyncMock),
-        patch("offering.application.service.httpx.AsyncClient.post", new_callable=AsyncMock) as mock_camunda_post,
-    ):
-        mock_camunda_post.return_value = AsyncMock(status_code=200)
+    with patch("offering.application.service.OfferingService._validate_external_ids", new_callable=AsyncMock):
         offering_data = {
             "name": "Locked Offering",
             "specification_ids": [str(uuid.uuid4())],
@@ -88,3 +80,30 @@ def test_update_restricted_to_draft(client: TestClient):
         update_resp = client.put(f"/api/v1/offerings/{offering_id}", json=update_data)
         assert update_resp.status_code == 400
 
+
+
+def test_list_offerings_by_reference(client: TestClient):
+    price_id, spec_id, other_spec_id = (str(uuid.uuid4()) for _ in range(3))
+    with patch("offering.application.service.OfferingService._validate_external_ids", new_callable=AsyncMock):
+        for name, specs in [("Ref A", [spec_id]), ("Ref B", [spec_id, other_spec_id]), ("Ref C", [other_spec_id])]:
+            resp = client.post("/api/v1/offerings", json={
+                "name": name,
+                "specification_ids": specs,
+                "pricing_ids": [price_id],
+                "sales_channels": ["WEB"],
+            })
+            assert resp.status_code == 201
+
+    by_price = client.get("/api/v1/offerings/by-reference", params={"price_id": price_id, "limit": 2})
+    assert by_price.status_code == 200
+    rest = client.get(
+        "/api/v1/offerings/by-reference",
+        params={"price_id": price_id, "after": by_price.headers["X-Next-Cursor"]},
+    ).json()
+    assert [o["name"] for o in by_price.json() + rest] == ["Ref A", "Ref B", "Ref C"]
+
+    both = client.get("/api/v1/offerings/by-reference", params={"price_id": price_id, "spec_id": spec_id}).json()
+    assert [o["name"] for o in both] == ["Ref A", "Ref B"]
+
+    assert client.get("/api/v1/offerings/by-reference", params={"spec_id": str(uuid.uuid4())}).json() == []
+    assert client.get("/api/v1/offerings/by-reference").status_code == 400
@@ -0,0 +1,39 @@
+import json
+import uuid
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+from offering.infrastructure.models import OutboxORM, ProductOfferingORM
+
+
+def test_import_loads_rows_with_copy(client: TestClient, db_session):
+    spec_id = uuid.uuid4()
+    rows = [
+        {"name": f"Partner {i}", "description": "Line\twith\ttabs", "specification_ids": [str(spec_id)],
+         "sales_channels": ["WEB", 'Store "North"']}
+        for i in range(5)
+    ]
+    body = "\n".join(json.dumps(row) for row in rows) + "\n{\"name\": 1}\n"
+
+    with patch(
+        "offering.application.service.OfferingService._find_missing_references",
+        new_callable=AsyncMock,
+        return_value=([], []),
+    ):
+        resp = client.post(
+            "/api/v1/offerings/import", content=body, headers={"Content-Type": "application/x-ndjson"}
+        )
+
+    assert resp.status_code == 200
+    results = [json.loads(line) for line in resp.text.splitlines()]
+    assert results[-1] == {"summary": {"created": 5, "failed": 1}}
+
+    created_ids = [uuid.UUID(r["id"]) for r in results if r.get("status") == "CREATED"]
+    stored = db_session.query(ProductOfferingORM).filter(ProductOfferingORM.id.in_(created_ids)).all()
+    assert len(stored) == 5
+    assert stored[0].description == "Line\twith\ttabs"
+    assert stored[0].sales_channels == ["WEB", 'Store "North"']
+    assert stored[0].specification_ids == [spec_id]
+
+    events = [o for o in db_session.query(OutboxORM).all() if o.payload["event_type"] == "OfferingCreated"]
+    assert {e.payload["payload"]["id"] for e in events} >= {str(i) for i in created_ids}
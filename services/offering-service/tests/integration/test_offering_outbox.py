@@ -5,12 +5,13 @@ import pytest
 from offering.application.schemas import OfferingCreate
 from offering.application.service import OfferingService
 from offering.infrastructure.models import OutboxORM
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 @pytest.mark.asyncio
-async def test_offering_outbox_flow(db_session: Session):
-    service = OfferingService(db_session)
+async def test_offering_outbox_flow(async_db_session: AsyncSession):
+    service = OfferingService(async_db_session)
 
     offering_in = OfferingCreate(
         name=f"Integration Test Offering {uuid.uuid4()}",
@@ -26,12 +27,12 @@ async def test_offering_outbox_flow(db_session: Session):
         assert created_offering.id is not None
 
         # 2. Check outbox
-        outbox_entry = (
-            db_session.query(OutboxORM)
-            .filter(OutboxORM.topic == "product.offering.events")
-            .filter(OutboxORM.status == "PENDING")
+        outbox_entry = await async_db_session.scalar(
+            select(OutboxORM)
+            .where(OutboxORM.topic == "product.offering.events")
+            .where(OutboxORM.status == "PENDING")
             .order_by(OutboxORM.created_at.desc())
-            .first()
+            .limit(1)
         )
 
         assert outbox_entry is not None
@@ -0,0 +1,57 @@
+import uuid
+from unittest.mock import AsyncMock, patch
+
+from fastapi.testclient import TestClient
+from offering.infrastructure.models import OutboxORM, SagaCommandORM
+
+
+def _create(client: TestClient, name: str, publishable: bool = True) -> str:
+    with patch("offering.application.service.OfferingService._validate_external_ids", new_callable=AsyncMock):
+        resp = client.post("/api/v1/offerings", json={
+            "name": name,
+            "specification_ids": [str(uuid.uuid4())],
+            "pricing_ids": [str(uuid.uuid4())] if publishable else [],
+            "sales_channels": ["WEB"],
+        })
+    assert resp.status_code == 201
+    return resp.json()["id"]
+
+
+def test_publish_batch_moves_drafts_and_queues_sagas(client: TestClient, db_session):
+    ready = [_create(client, f"Seasonal {i}") for i in range(3)]
+    incomplete = _create(client, "No Price", publishable=False)
+    missing = str(uuid.uuid4())
+
+    resp = client.post("/api/v1/offerings/publish-batch", json={"offering_ids": ready + [incomplete, missing]})
+    assert resp.status_code == 202
+    body = resp.json()
+    assert body["accepted"] == 3
+    assert body["rejected"] == 2
+    results = {r["id"]: r for r in body["results"]}
+    assert all(results[i]["lifecycle_status"] == "PUBLISHING" for i in ready)
+    assert results[incomplete]["lifecycle_status"] == "DRAFT"
+    assert "one price" in results[incomplete]["error"]
+    assert "not found" in results[missing]["error"]
+
+    commands = db_session.query(SagaCommandORM).filter_by(batch_id=uuid.UUID(body["batch_id"])).all()
+    assert sorted(c.business_key for c in commands) == sorted(ready)
+    initiated = [
+        o for o in db_session.query(OutboxORM).all()
+        if o.payload["event_type"] == "OfferingPublicationInitiated"
+    ]
+    assert len(initiated) == 3
+
+    # Publishing the same offerings again is rejected per offering
+    again = client.post("/api/v1/offerings/publish-batch", json={"offering_ids": ready[:1]}).json()
+    assert again["accepted"] == 0
+    assert "PUBLISHING" in again["results"][0]["error"]
+
+    progress = client.get(f"/api/v1/offerings/publish-batch/{body['batch_id']}").json()
+    assert progress["total"] == 3
+    assert progress["sagas"] == {"PENDING": 3}
+    assert progress["offerings"] == {"PUBLISHING": 3}
+
+
+def test_unknown_publish_batch_returns_404(client: TestClient):
+    resp = client.get(f"/api/v1/offerings/publish-batch/{uuid.uuid4()}")
+    assert resp.status_code == 404
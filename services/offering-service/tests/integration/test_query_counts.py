@@ -0,0 +1,125 @@
+"""
+Round-trip regression tests: each write endpoint commits the offering, its
+outbox rows and saga commands once, without refresh SELECTs.
+"""
+
+import json
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import offering.infrastructure.database as db_module
+import pytest
+from common.testing.queries import count_queries
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture(autouse=True)
+def skip_reference_validation():
+    with patch("offering.application.service.OfferingService._find_missing_references",
+               new_callable=AsyncMock, return_value=([], [])):
+        yield
+
+
+def _request_queries():
+    return count_queries(db_module.AsyncSessionLocal.kw["bind"])
+
+
+def _offering(name: str) -> dict:
+    return {
+        "name": name,
+        "specification_ids": [str(uuid.uuid4())],
+        "pricing_ids": [str(uuid.uuid4())],
+        "sales_channels": ["WEB"],
+    }
+
+
+def _create(client: TestClient, name: str) -> str:
+    response = client.post("/api/v1/offerings", json=_offering(name))
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _publish(client: TestClient, name: str) -> str:
+    offering_id = _create(client, name)
+    assert client.post(f"/api/v1/offerings/{offering_id}/publish").status_code == 200
+    return offering_id
+
+
+def test_create_queries(client: TestClient):
+    with _request_queries() as queries:
+        _create(client, "Counted Create")
+
+    # Offering and outbox row, nothing flushed or refreshed on its own
+    assert queries.counts == {"INSERT": 2, "COMMIT": 1}
+
+
+def test_update_queries(client: TestClient):
+    offering_id = _create(client, "Counted Update")
+
+    with _request_queries() as queries:
+        response = client.put(f"/api/v1/offerings/{offering_id}", json=_offering("Counted Rename"))
+    assert response.status_code == 200
+
+    assert queries.counts == {"SELECT": 1, "UPDATE": 1, "INSERT": 1, "COMMIT": 1}
+
+
+def test_delete_queries(client: TestClient):
+    offering_id = _create(client, "Counted Delete")
+
+    with _request_queries() as queries:
+        response = client.delete(f"/api/v1/offerings/{offering_id}")
+    assert response.status_code == 204
+
+    assert queries.counts == {"SELECT": 1, "DELETE": 1, "COMMIT": 1}
+
+
+def test_publish_queries(client: TestClient):
+    offering_id = _create(client, "Counted Publish")
+
+    with _request_queries() as queries:
+        response = client.post(f"/api/v1/offerings/{offering_id}/publish")
+    assert response.status_code == 200
+
+    # Outbox row and saga command
+    assert queries.counts == {"SELECT": 1, "UPDATE": 1, "INSERT": 2, "COMMIT": 1}
+
+
+def test_publish_batch_queries(client: TestClient):
+    offering_ids = [_create(client, f"Counted Batch {i}") for i in range(2)]
+
+    with _request_queries() as queries:
+        response = client.post("/api/v1/offerings/publish-batch", json={"offering_ids": offering_ids})
+    assert response.status_code == 202
+
+    # UPDATE ... RETURNING, then one multi-row INSERT each for outbox rows and saga commands
+    assert queries.counts == {"UPDATE": 1, "INSERT": 2, "COMMIT": 1}
+
+
+def test_confirm_fail_and_retire_queries(client: TestClient):
+    confirmed, failed = _publish(client, "Counted Confirm"), _publish(client, "Counted Fail")
+
+    with _request_queries() as confirm_queries:
+        assert client.post(f"/api/v1/offerings/{confirmed}/confirm").status_code == 200
+    with _request_queries() as fail_queries:
+        assert client.post(f"/api/v1/offerings/{failed}/fail").status_code == 200
+    with _request_queries() as retire_queries:
+        assert client.post(f"/api/v1/offerings/{confirmed}/retire").status_code == 200
+
+    assert confirm_queries.counts == {"SELECT": 1, "UPDATE": 1, "INSERT": 1, "COMMIT": 1}
+    # No event is emitted for a failed publication
+    assert fail_queries.counts == {"SELECT": 1, "UPDATE": 1, "COMMIT": 1}
+    assert retire_queries.counts == {"SELECT": 1, "UPDATE": 1, "INSERT": 1, "COMMIT": 1}
+
+
+def test_import_queries(client: TestClient):
+    body = "\n".join(json.dumps({"name": f"Counted Import {i}"}) for i in range(3))
+
+    with _request_queries() as queries:
+        response = client.post(
+            "/api/v1/offerings/import", content=body, headers={"Content-Type": "application/x-ndjson"}
+        )
+    assert response.status_code == 200
+
+    # Per chunk: the COPY (sent on the raw asyncpg connection, so not counted here)
+    # and one multi-row outbox INSERT
+    assert queries.counts == {"INSERT": 1, "COMMIT": 1}
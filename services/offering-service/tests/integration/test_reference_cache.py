@@ -0,0 +1,50 @@
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from offering.application.consumers import price_consumer, specification_consumer
+from offering.application.service import OfferingService
+from offering.infrastructure.models import CachedPriceORM, CachedSpecificationORM
+
+
+@pytest.mark.asyncio
+async def test_reference_cache_consumers_sync_ids(db_session):
+    """Tests that specification and price events keep the local caches in sync."""
+    spec_id, price_id = uuid.uuid4(), uuid.uuid4()
+
+    await specification_consumer()._handle_event(
+        {"event_type": "SpecificationCreated", "payload": {"id": str(spec_id), "name": "Fiber"}}, {}
+    )
+    await price_consumer()._handle_event(
+        {"event_type": "PriceCreated", "payload": {"id": str(price_id), "name": "Monthly"}}, {}
+    )
+    # Redelivery is harmless
+    await price_consumer()._handle_event(
+        {"event_type": "PriceUpdated", "payload": {"id": str(price_id), "name": "Monthly v2"}}, {}
+    )
+
+    assert db_session.query(CachedSpecificationORM).filter_by(id=spec_id).first().name == "Fiber"
+    assert db_session.query(CachedPriceORM).filter_by(id=price_id).first().name == "Monthly v2"
+
+    await price_consumer()._handle_event(
+        {"event_type": "PriceDeleted", "payload": {"id": str(price_id)}}, {}
+    )
+    db_session.expire_all()
+    assert db_session.query(CachedPriceORM).filter_by(id=price_id).first() is None
+
+
+@pytest.mark.asyncio
+async def test_validation_only_calls_peers_for_uncached_ids(db_session, async_db_session):
+    cached_spec, unknown_price = uuid.uuid4(), uuid.uuid4()
+    db_session.add(CachedSpecificationORM(id=cached_spec, name="Cached"))
+    db_session.commit()
+
+    with patch(
+        "offering.application.service.reference_client.find_missing",
+        new_callable=AsyncMock,
+        return_value=[],
+    ) as find_missing:
+        await OfferingService(async_db_session)._validate_external_ids([cached_spec], [unknown_price])
+
+    looked_up = {call.args[2]: call.args[3] for call in find_missing.await_args_list}
+    assert looked_up == {"specifications": [], "prices": [unknown_price]}
@@ -1,132 +1,119 @@
+import json
 import uuid
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
+import offering.infrastructure.database as db_module
 import pytest
 from fastapi.testclient import TestClient
 from offering.config import settings
+from offering.infrastructure.models import SagaCommandORM
+from offering.infrastructure.saga_relay import SagaStartRelay
 
 
 @pytest.fixture
-def mock_httpx_client():
-    # We mock the constructor of AsyncClient
-    with patch("httpx.AsyncClient") as MockClientClass:
-        # The instance created by the constructor
-        mock_instance = MockClientClass.return_value
+def skip_reference_validation():
+    with patch("offering.application.service.OfferingService._validate_external_ids", new_callable=AsyncMock):
+        yield
 
-        # Async context manager methods
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
 
-        # Mock the post method to be an async function
-        mock_instance.post = AsyncMock()
-        mock_instance.get = AsyncMock()
-
-        yield mock_instance
-
-@pytest.mark.asyncio
-async def test_initiate_publication_triggers_camunda_simple(client: TestClient, db_session, mock_httpx_client):
-    # Setup: Configure the mock response
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {"id": "process-123"}
-
-    # When client.post is awaited, return the mock_response
-    mock_httpx_client.post.return_value = mock_response
-
-    spec_id = str(uuid.uuid4())
-    price_id = str(uuid.uuid4())
-
-    # Mock spec/price validation calls
-    ok_get_resp = MagicMock()
-    ok_get_resp.status_code = 200
-    mock_httpx_client.get.return_value = ok_get_resp
-
-    # 1. Create offering (must be publishable: >=1 spec, >=1 price, >=1 channel)
+def _publish_new_offering(client: TestClient, name: str) -> str:
+    # Must be publishable: >=1 spec, >=1 price, >=1 channel
     create_resp = client.post("/api/v1/offerings", json={
-        "name": "Saga Mock Test",
+        "name": name,
         "description": "Test",
-        "specification_ids": [spec_id],
-        "pricing_ids": [price_id],
+        "specification_ids": [str(uuid.uuid4())],
+        "pricing_ids": [str(uuid.uuid4())],
         "sales_channels": ["WEB"]
     })
     assert create_resp.status_code == 201
     off_id = create_resp.json()["id"]
 
-    # 2. Initiate publication
     pub_resp = client.post(f"/api/v1/offerings/{off_id}/publish")
-
-    # Assertions
     assert pub_resp.status_code == 200
+    assert pub_resp.json()["lifecycle_status"] == "PUBLISHING"
+    return off_id
+
+
+def _relay(handler) -> SagaStartRelay:
+    return SagaStartRelay(
+        session_factory=db_module.SessionLocal,
+        camunda_url=settings.CAMUNDA_URL,
+        max_attempts=2,
+        transport=httpx.MockTransport(handler),
+    )
+
 
-    # Verify Camunda was called
-    mock_httpx_client.post.assert_called_once()
+def test_initiate_publication_queues_saga_start(client: TestClient, db_session, skip_reference_validation):
+    off_id = _publish_new_offering(client, "Saga Queue Test")
 
-    # Check arguments
-    call_args = mock_httpx_client.post.call_args
-    # call_args[0] are positional args (url), call_args[1] are kwargs (json, timeout)
-    url = call_args[0][0]
-    kwargs = call_args[1]
+    command = db_session.query(SagaCommandORM).filter_by(business_key=off_id).one()
+    assert command.process_key == "offering-publication-saga"
+    assert command.status == "PENDING"
+    assert command.variables["offeringId"]["value"] == off_id
 
-    assert f"{settings.CAMUNDA_URL}/process-definition/key/offering-publication-saga/start" in url
-    assert str(off_id) == kwargs["json"]["variables"]["offeringId"]["value"]
 
 @pytest.mark.asyncio
-async def test_confirm_publication_simple(client: TestClient, db_session):
-    spec_id = str(uuid.uuid4())
-    price_id = str(uuid.uuid4())
-
-    with patch("httpx.AsyncClient") as MockClientClass:
-        mock_instance = MockClientClass.return_value
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=MagicMock(status_code=200))
-        mock_instance.post = AsyncMock(return_value=MagicMock(status_code=200, json=MagicMock(return_value={"id": "process-123"})))
-
-        # 1. Create offering (publishable)
-        create_resp = client.post("/api/v1/offerings", json={
-            "name": "Confirm Mock Test",
-            "specification_ids": [spec_id],
-            "pricing_ids": [price_id],
-            "sales_channels": ["WEB"]
-        })
-        off_id = create_resp.json()["id"]
-
-        # 2. Move to PUBLISHING
-        pub_resp = client.post(f"/api/v1/offerings/{off_id}/publish")
-        assert pub_resp.status_code == 200
-
-    # 3. Confirm (simulating Camunda worker)
+async def test_saga_relay_starts_queued_commands(client: TestClient, db_session, skip_reference_validation):
+    off_id = _publish_new_offering(client, "Saga Relay Test")
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"id": "process-123"})
+
+    relay = _relay(handler)
+    async with httpx.AsyncClient(transport=relay.transport) as http:
+        assert await relay.process_batch(http) == 1
+        assert await relay.process_batch(http) == 0
+
+    assert str(requests[0].url) == f"{settings.CAMUNDA_URL}/process-definition/key/offering-publication-saga/start"
+    body = json.loads(requests[0].content)
+    assert body["businessKey"] == off_id
+    assert body["variables"]["offeringId"]["value"] == off_id
+
+    command = db_session.query(SagaCommandORM).filter_by(business_key=off_id).one()
+    db_session.refresh(command)
+    assert command.status == "STARTED"
+    assert command.process_instance_id == "process-123"
+
+
+@pytest.mark.asyncio
+async def test_saga_relay_retries_then_gives_up(client: TestClient, db_session, skip_reference_validation):
+    off_id = _publish_new_offering(client, "Saga Retry Test")
+    relay = _relay(lambda request: httpx.Response(500, text="engine down"))
+
+    async with httpx.AsyncClient(transport=relay.transport) as http:
+        await relay.process_batch(http)
+        command = db_session.query(SagaCommandORM).filter_by(business_key=off_id).one()
+        db_session.refresh(command)
+        assert command.status == "PENDING"
+        assert command.attempts == 1
+        assert "engine down" in command.error_message
+
+        # Make the retry due now
+        command.next_attempt_at = command.created_at
+        db_session.commit()
+        await relay.process_batch(http)
+
+    db_session.refresh(command)
+    assert command.status == "FAILED"
+
+
+def test_confirm_publication_simple(client: TestClient, db_session, skip_reference_validation):
+    off_id = _publish_new_offering(client, "Confirm Mock Test")
+
+    # Confirm (simulating Camunda worker)
     conf_resp = client.post(f"/api/v1/offerings/{off_id}/confirm")
 
     assert conf_resp.status_code == 200
     assert conf_resp.json()["lifecycle_status"] == "PUBLISHED"
 
-@pytest.mark.asyncio
-async def test_fail_publication_simple(client: TestClient, db_session):
-    spec_id = str(uuid.uuid4())
-    price_id = str(uuid.uuid4())
-
-    with patch("httpx.AsyncClient") as MockClientClass:
-        mock_instance = MockClientClass.return_value
-        mock_instance.__aenter__.return_value = mock_instance
-        mock_instance.__aexit__.return_value = None
-        mock_instance.get = AsyncMock(return_value=MagicMock(status_code=200))
-        mock_instance.post = AsyncMock(return_value=MagicMock(status_code=200, json=MagicMock(return_value={"id": "process-123"})))
-
-        # 1. Create offering (publishable)
-        create_resp = client.post("/api/v1/offerings", json={
-            "name": "Fail Mock Test",
-            "specification_ids": [spec_id],
-            "pricing_ids": [price_id],
-            "sales_channels": ["WEB"]
-        })
-        off_id = create_resp.json()["id"]
-
-        # 2. Move to PUBLISHING
-        pub_resp = client.post(f"/api/v1/offerings/{off_id}/publish")
-        assert pub_resp.status_code == 200
-
-    # 3. Fail (simulating Camunda worker)
+
+def test_fail_publication_simple(client: TestClient, db_session, skip_reference_validation):
+    off_id = _publish_new_offering(client, "Fail Mock Test")
+
+    # Fail (simulating Camunda worker)
     fail_resp = client.post(f"/api/v1/offerings/{off_id}/fail")
 
     assert fail_resp.status_code == 200
@@ -0,0 +1,110 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from common.exceptions import ServiceUnavailableError
+from offering.application.service import OfferingService
+from offering.domain.models import LifecycleStatus, ProductOffering
+from offering.infrastructure.repository import _COPY_COLUMNS, _copy_record
+
+
+def test_copy_record_keeps_native_values_in_column_order():
+    created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    spec_id = uuid.uuid4()
+    offering = ProductOffering(
+        name="Tab\there", specification_ids=[spec_id], sales_channels=['say "hi"'], created_at=created
+    )
+
+    record = dict(zip(_COPY_COLUMNS, _copy_record(offering)))
+
+    # Binary COPY: no text escaping, arrays and timestamps stay Python values
+    assert record["name"] == "Tab\there"
+    assert record["description"] is None
+    assert record["specification_ids"] == [spec_id]
+    assert record["sales_channels"] == ['say "hi"']
+    assert record["lifecycle_status"] == LifecycleStatus.DRAFT.value
+    assert record["created_at"] == created
+
+
+@pytest.mark.asyncio
+async def test_import_streams_per_line_results(monkeypatch):
+    known, unknown = uuid.uuid4(), uuid.uuid4()
+    lines = [
+        {"name": "Valid", "specification_ids": [str(known)], "sales_channels": ["WEB"]},
+        {"name": "Bad Ref", "specification_ids": [str(unknown)]},
+        "not json",
+        {"description": "no name"},
+        {"name": "Also Valid"},
+    ]
+    body = "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines).encode()
+
+    async def stream():
+        # Split mid-line to exercise buffering across chunks
+        for i in range(0, len(body), 17):
+            yield body[i:i + 17]
+
+    db = AsyncMock()
+    service = OfferingService(db)
+    service.repository = AsyncMock()
+    service._find_missing_references = AsyncMock(return_value=([unknown], []))
+    monkeypatch.setattr("offering.application.service.settings.IMPORT_CHUNK_SIZE", 3)
+
+    results = [result async for result in service.import_offerings(stream())]
+
+    assert [(r.get("line"), r.get("status")) for r in results[:-1]] == [
+        (1, "CREATED"), (2, "FAILED"), (3, "FAILED"), (4, "FAILED"), (5, "CREATED"),
+    ]
+    assert str(unknown) in results[1]["error"]
+    assert results[3]["error"].startswith("name:")
+    assert results[-1] == {"summary": {"created": 2, "failed": 3}}
+    # One COPY and one commit per chunk with valid rows
+    assert [len(call.args[0]) for call in service.repository.copy_many.await_args_list] == [1, 1]
+    assert db.commit.await_count == 2
+
+
+def _lines(*names):
+    return "\n".join(json.dumps({"name": name}) for name in names).encode()
+
+
+async def _body(data: bytes):
+    yield data
+
+
+@pytest.mark.asyncio
+async def test_import_retries_a_rejected_chunk_line_by_line():
+    db = AsyncMock()
+    service = OfferingService(db)
+    service.repository = AsyncMock()
+    service._find_missing_references = AsyncMock(return_value=([], []))
+
+    async def copy_many(offerings):
+        if any(offering.name == "Rejected" for offering in offerings):
+            raise RuntimeError("invalid byte sequence")
+
+    service.repository.copy_many.side_effect = copy_many
+
+    results = [result async for result in service.import_offerings(_body(_lines("A", "Rejected", "B")))]
+
+    assert [(r.get("line"), r.get("status")) for r in results[:-1]] == [
+        (1, "CREATED"), (2, "FAILED"), (3, "CREATED"),
+    ]
+    assert "invalid byte sequence" in results[1]["error"]
+    assert results[-1] == {"summary": {"created": 2, "failed": 1}}
+
+
+@pytest.mark.asyncio
+async def test_import_reports_lines_failed_when_references_cannot_be_checked():
+    service = OfferingService(AsyncMock())
+    service.repository = AsyncMock()
+    service._find_missing_references = AsyncMock(side_effect=ServiceUnavailableError("Pricing Service is unavailable"))
+
+    results = [result async for result in service.import_offerings(_body(_lines("A", "x" * 201)))]
+
+    assert results[0]["status"] == "FAILED"
+    assert "Could not check references" in results[0]["error"]
+    # Oversized names fail validation up front
+    assert results[1]["status"] == "FAILED" and results[1]["error"].startswith("name:")
+    assert results[-1] == {"summary": {"created": 0, "failed": 2}}
+    service.repository.copy_many.assert_not_awaited()
@@ -0,0 +1,85 @@
+import json
+import uuid
+
+import httpx
+import pytest
+from common.exceptions import ServiceUnavailableError
+from offering.infrastructure.reference_client import ReferenceClient
+
+KNOWN = uuid.uuid4()
+UNKNOWN = uuid.uuid4()
+
+
+@pytest.mark.asyncio
+async def test_batch_get_is_used_when_available():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, request.url.path))
+        ids = json.loads(request.content)["ids"]
+        return httpx.Response(200, json={"items": [], "missing": [i for i in ids if i != str(KNOWN)]})
+
+    client = ReferenceClient(transport=httpx.MockTransport(handler))
+    missing = await client.find_missing("Pricing", "http://pricing", "prices", [KNOWN, UNKNOWN, KNOWN])
+
+    assert missing == [UNKNOWN]
+    assert calls == [("POST", "/api/v1/prices/batch-get")]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_concurrent_lookups_without_batch_get():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "POST":
+            return httpx.Response(405)
+        return httpx.Response(200 if request.url.path.endswith(str(KNOWN)) else 404)
+
+    client = ReferenceClient(concurrency=2, transport=httpx.MockTransport(handler))
+    assert await client.find_missing("Pricing", "http://pricing", "prices", [KNOWN, UNKNOWN]) == [UNKNOWN]
+    # The missing endpoint is remembered
+    assert await client.find_missing("Pricing", "http://pricing", "prices", [KNOWN]) == []
+    assert calls == ["POST", "GET", "GET", "GET"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_surface_as_service_unavailable():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    client = ReferenceClient(transport=httpx.MockTransport(handler))
+    with pytest.raises(ServiceUnavailableError):
+        await client.find_missing("Pricing", "http://pricing", "prices", [KNOWN])
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batch_get_server_error_is_unavailable_without_per_id_fallback():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        return httpx.Response(503)
+
+    client = ReferenceClient(transport=httpx.MockTransport(handler))
+    with pytest.raises(ServiceUnavailableError):
+        await client.find_missing("Pricing", "http://pricing", "prices", [KNOWN, UNKNOWN])
+    assert calls == ["POST"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_per_id_lookup_reports_only_404_as_missing():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(404)
+        return httpx.Response(404 if request.url.path.endswith(str(UNKNOWN)) else 500)
+
+    client = ReferenceClient(transport=httpx.MockTransport(handler))
+    assert await client.find_missing("Pricing", "http://pricing", "prices", [UNKNOWN]) == [UNKNOWN]
+    with pytest.raises(ServiceUnavailableError):
+        await client.find_missing("Pricing", "http://pricing", "prices", [KNOWN, UNKNOWN])
+    await client.aclose()
@@ -0,0 +1,65 @@
+import asyncio
+
+import httpx
+import pytest
+from offering.infrastructure.saga_relay import SagaStartRelay
+
+
+def test_lease_outlasts_the_slowest_batch():
+    relay = SagaStartRelay(
+        session_factory=None,
+        camunda_url="http://camunda",
+        batch_size=50,
+        concurrency=10,
+        lease=30.0,
+        request_timeout=10.0,
+    )
+
+    # Five rounds of ten starts, each allowed 10s for the lookup and 10s for the start
+    assert relay.max_batch_duration == 100.0
+    assert relay.lease > relay.max_batch_duration
+
+    short_batches = SagaStartRelay(session_factory=None, camunda_url="http://camunda", batch_size=5, lease=30.0)
+    assert short_batches.lease == 30.0
+
+
+@pytest.mark.asyncio
+async def test_start_is_cut_off_after_the_request_timeout():
+    async def hang(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200, json={"id": "late"})
+
+    relay = SagaStartRelay(session_factory=None, camunda_url="http://camunda", request_timeout=0.05)
+    command = {"id": 1, "process_key": "p", "variables": {}, "business_key": "b", "attempts": 1}
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(hang)) as client:
+        instance_id, error = await relay._start_process(client, command)
+
+    assert instance_id is None
+    assert "within 0.05s" in error
+
+
+@pytest.mark.asyncio
+async def test_retry_after_timeout_records_the_instance_already_started():
+    requests = []
+
+    async def camunda(request):
+        requests.append((request.method, request.url.path, dict(request.url.params)))
+        if request.method == "POST":
+            # Creates the instance, but answers too late
+            await asyncio.sleep(5)
+            return httpx.Response(200, json={"id": "proc-1"})
+        return httpx.Response(200, json=[{"id": "proc-1", "businessKey": "offering-1"}])
+
+    relay = SagaStartRelay(session_factory=None, camunda_url="http://camunda", request_timeout=0.05)
+    command = {"id": 1, "process_key": "saga", "variables": {}, "business_key": "offering-1", "attempts": 1}
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(camunda)) as client:
+        assert (await relay._start_process(client, command))[0] is None
+        retried = await relay._start_process(client, {**command, "attempts": 2})
+
+    assert retried == ("proc-1", None)
+    assert requests == [
+        ("POST", "/process-definition/key/saga/start", {}),
+        ("GET", "/process-instance", {"businessKey": "offering-1", "processDefinitionKey": "saga"}),
+    ]
@@ -0,0 +1,64 @@
+"""add_list_pagination_indexes
+
+Revision ID: 9c2d6f41e8a7
+Revises: ed954695f270
+Create Date: 2026-10-19 14:05:32.118407
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2d6f41e8a7'
+down_revision: Union[str, Sequence[str], None] = 'ed954695f270'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside the migration transaction, and keeps the
+    # table writable while existing rows are indexed
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_prices_created_at_id',
+            'prices',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_prices_currency_created_at_id',
+            'prices',
+            ['currency', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_prices_locked_created_at_id',
+            'prices',
+            ['locked', 'created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_prices_locked_created_at_id',
+            table_name='prices',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_prices_currency_created_at_id',
+            table_name='prices',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_prices_created_at_id',
+            table_name='prices',
+            postgresql_concurrently=True,
+        )
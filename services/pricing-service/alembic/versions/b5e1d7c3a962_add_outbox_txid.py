@@ -0,0 +1,47 @@
+"""add_outbox_txid
+
+Revision ID: b5e1d7c3a962
+Revises: 9c2d6f41e8a7
+Create Date: 2026-10-19 17:08:03.559217
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1d7c3a962'
+down_revision: Union[str, Sequence[str], None] = '9c2d6f41e8a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows all get this migration's transaction id, which sorts them
+    # before any later write
+    op.add_column(
+        'outbox',
+        sa.Column(
+            'txid',
+            sa.BigInteger(),
+            server_default=sa.text('(pg_current_xact_id()::text)::bigint'),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_outbox_txid_id',
+            'outbox',
+            ['txid', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_outbox_txid_id', table_name='outbox', postgresql_concurrently=True)
+    op.drop_column('outbox', 'txid')
@@ -1,11 +1,20 @@
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
-from ..domain.models import CurrencyEnum
+from ..domain.models import MAX_PRICE_VALUE, CurrencyEnum
+
+
+def _positive_cents(v: Decimal) -> Decimal:
+    if v <= 0:
+        raise ValueError("Price value must be positive")
+    v = v.quantize(Decimal("0.01"))
+    if v > MAX_PRICE_VALUE:
+        raise ValueError(f"Price value must not exceed {MAX_PRICE_VALUE}")
+    return v
 
 
 class PriceBase(BaseModel):
@@ -17,9 +26,7 @@ class PriceBase(BaseModel):
     @field_validator("value")
     @classmethod
     def value_must_be_positive(cls, v: Decimal) -> Decimal:
-        if v <= 0:
-            raise ValueError("Price value must be positive")
-        return v.quantize(Decimal("0.01"))
+        return _positive_cents(v)
 
 
 class PriceCreate(PriceBase):
@@ -42,3 +49,66 @@ class PriceRead(PriceBase):
 
 class PriceLock(BaseModel):
     saga_id: uuid.UUID
+
+
+class PriceFilter(BaseModel):
+    """Prices a bulk adjustment applies to; at least one criterion is required."""
+
+    currency: Optional[CurrencyEnum] = None
+    unit: Optional[str] = None
+
+    @model_validator(mode="after")
+    def not_empty(self) -> "PriceFilter":
+        if self.currency is None and self.unit is None:
+            raise ValueError("Give at least one of currency or unit")
+        return self
+
+
+class PriceAdjustment(BaseModel):
+    """Relative (`percent`, e.g. 5 for +5%) or absolute (`amount`) change; exactly one."""
+
+    percent: Optional[Decimal] = Field(None, gt=-100)
+    amount: Optional[Decimal] = None
+
+    @model_validator(mode="after")
+    def exactly_one_kind(self) -> "PriceAdjustment":
+        if (self.percent is None) == (self.amount is None):
+            raise ValueError("Give exactly one of percent or amount")
+        return self
+
+
+class PriceValue(BaseModel):
+    id: uuid.UUID
+    value: Decimal
+
+    @field_validator("value")
+    @classmethod
+    def value_must_be_positive(cls, v: Decimal) -> Decimal:
+        return _positive_cents(v)
+
+
+class PriceBulkUpdate(BaseModel):
+    """Either `filter` plus `adjustment`, or explicit new `values` per price."""
+
+    filter: Optional[PriceFilter] = None
+    adjustment: Optional[PriceAdjustment] = None
+    values: Optional[List[PriceValue]] = Field(None, min_length=1, max_length=5000)
+
+    @model_validator(mode="after")
+    def one_mode(self) -> "PriceBulkUpdate":
+        if self.values is not None:
+            if self.filter is not None or self.adjustment is not None:
+                raise ValueError("values cannot be combined with filter or adjustment")
+            if len({item.id for item in self.values}) != len(self.values):
+                raise ValueError("values must not repeat a price id")
+        elif self.filter is None or self.adjustment is None:
+            raise ValueError("Give filter and adjustment, or values")
+        return self
+
+
+class PriceBulkUpdateResult(BaseModel):
+    updated: int
+    updated_ids: List[uuid.UUID]
+    skipped_locked: List[uuid.UUID]  # Locked by a saga, left unchanged
+    skipped_out_of_range: List[uuid.UUID]  # Adjusted value would not be positive or would overflow
+    missing: List[uuid.UUID]  # Explicit values for prices that do not exist
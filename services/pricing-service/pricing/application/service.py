@@ -1,19 +1,26 @@
 import uuid
-from typing import List
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from common.database.changefeed import read_changes
+from common.database.pagination import Page
+from common.database.unit_of_work import UnitOfWork
 from common.exceptions import AppException, ConflictError, NotFoundError
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..domain.models import CurrencyEnum
 from ..infrastructure.models import OutboxORM, PriceORM
 from ..infrastructure.repository import PriceRepository
 from .events import PriceCreated, PriceDeleted, PriceLocked, PriceUnlocked, PriceUpdated
-from .schemas import PriceCreate, PriceUpdate
+from .schemas import PriceBulkUpdate, PriceCreate, PriceUpdate
 
 
 class PricingService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.repository = PriceRepository(db)
+        self.uow = UnitOfWork(db)
 
     def _add_to_outbox(
         self, topic: str, event: PriceCreated | PriceUpdated | PriceDeleted | PriceLocked | PriceUnlocked
@@ -21,8 +28,8 @@ class PricingService:
         outbox_entry = OutboxORM(topic=topic, payload=event.model_dump(mode="json"))
         self.db.add(outbox_entry)
 
-    def create_price(self, price_in: PriceCreate) -> PriceORM:
-        if self.repository.get_by_name(price_in.name):
+    async def create_price(self, price_in: PriceCreate) -> PriceORM:
+        if await self.repository.get_by_name(price_in.name):
             raise ConflictError(f"Price with name '{price_in.name}' already exists")
 
         price_orm = PriceORM(
@@ -32,26 +39,54 @@ class PricingService:
             currency=price_in.currency.value,
         )
 
-        self.repository.create(price_orm)
-        self.db.flush()
+        async with self.uow:
+            self.repository.create(price_orm)
+            await self.db.flush()
 
-        event = PriceCreated(payload=price_orm.to_domain().model_dump(mode="json"))
-        self._add_to_outbox("commercial.pricing.events", event)
+            event = PriceCreated(payload=price_orm.to_domain().model_dump(mode="json"))
+            self._add_to_outbox("commercial.pricing.events", event)
 
-        self.db.commit()
         return price_orm
 
-    def get_price(self, price_id: uuid.UUID) -> PriceORM:
-        price = self.repository.get_by_id(price_id)
+    async def get_price(self, price_id: uuid.UUID) -> PriceORM:
+        price = await self.repository.get_by_id(price_id)
         if not price:
             raise NotFoundError(f"Price with ID {price_id} not found")
         return price
 
-    def list_prices(self, skip: int = 0, limit: int = 100) -> List[PriceORM]:
-        return self.repository.list(skip, limit)
+    async def batch_get_prices(self, ids: List[uuid.UUID]) -> Tuple[List[PriceORM], List[uuid.UUID]]:
+        """
+        Fetch many prices with a single query.
+
+        Returns:
+            The prices found and the requested ids that do not exist.
+        """
+        ids = list(dict.fromkeys(ids))
+        found = await self.repository.get_many(ids) if ids else []
+        found_ids = {item.id for item in found}
+        return found, [item_id for item_id in ids if item_id not in found_ids]
+
+    async def list_prices(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        skip: int = 0,
+        currency: Optional[CurrencyEnum] = None,
+        locked: Optional[bool] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Page:
+        return await self.repository.list(
+            limit, after=after, skip=skip, currency=currency, locked=locked, fields=fields
+        )
+
+    async def list_changes(self, since: Optional[str] = None, limit: int = 1000) -> Dict[str, Any]:
+        """Changefeed page after `since`: upserts with current state, tombstones for deletions."""
+        batch = await read_changes(self.db, OutboxORM, since, limit)
+        entities = await self.repository.get_many(batch.entity_ids) if batch.entity_ids else []
+        return batch.resolve(entities)
 
-    def update_price(self, price_id: uuid.UUID, price_in: PriceUpdate) -> PriceORM:
-        price_orm = self.get_price(price_id)
+    async def update_price(self, price_id: uuid.UUID, price_in: PriceUpdate) -> PriceORM:
+        price_orm = await self.get_price(price_id)
 
         if price_orm.locked:
             raise AppException(
@@ -60,24 +95,77 @@ class PricingService:
             )
 
         if price_in.name != price_orm.name:
-            if self.repository.get_by_name(price_in.name):
+            if await self.repository.get_by_name(price_in.name):
                 raise ConflictError(f"Price with name '{price_in.name}' already exists")
 
-        price_orm.name = price_in.name
-        price_orm.value = price_in.value
-        price_orm.unit = price_in.unit
-        price_orm.currency = price_in.currency.value
+        async with self.uow:
+            price_orm.name = price_in.name
+            price_orm.value = price_in.value
+            price_orm.unit = price_in.unit
+            price_orm.currency = price_in.currency.value
 
-        self.db.flush()
+            await self.db.flush()
 
-        event = PriceUpdated(payload=price_orm.to_domain().model_dump(mode="json"))
-        self._add_to_outbox("commercial.pricing.events", event)
+            event = PriceUpdated(payload=price_orm.to_domain().model_dump(mode="json"))
+            self._add_to_outbox("commercial.pricing.events", event)
 
-        self.db.commit()
         return price_orm
 
-    def delete_price(self, price_id: uuid.UUID):
-        price_orm = self.get_price(price_id)
+    async def bulk_update_prices(self, bulk_in: PriceBulkUpdate) -> Dict[str, Any]:
+        """
+        Reprice by filter and adjustment, or by explicit values, in one
+        transaction: a single set-based UPDATE that leaves locked prices alone,
+        then the PriceUpdated events in one outbox insert.
+        """
+        now = datetime.now(timezone.utc)
+        ids: Optional[List[uuid.UUID]] = None
+
+        async with self.uow:
+            if bulk_in.values is not None:
+                ids = [item.id for item in bulk_in.values]
+                updated = await self.repository.set_values_many(
+                    [(item.id, item.value) for item in bulk_in.values], now
+                )
+                skipped = await self.repository.get_skipped([p.id for p in updated], ids=ids)
+            else:
+                price_filter, adjustment = bulk_in.filter, bulk_in.adjustment
+                updated = await self.repository.adjust_many(
+                    now,
+                    currency=price_filter.currency,
+                    unit=price_filter.unit,
+                    percent=adjustment.percent,
+                    amount=adjustment.amount,
+                )
+                skipped = await self.repository.get_skipped(
+                    [p.id for p in updated], currency=price_filter.currency, unit=price_filter.unit
+                )
+
+            if updated:
+                await self.db.execute(
+                    insert(OutboxORM),
+                    [
+                        {
+                            "topic": "commercial.pricing.events",
+                            "payload": PriceUpdated(
+                                payload=price_orm.to_domain().model_dump(mode="json")
+                            ).model_dump(mode="json"),
+                        }
+                        for price_orm in updated
+                    ],
+                )
+
+        updated_ids = [price_orm.id for price_orm in updated]
+        found = set(updated_ids) | {price_id for price_id, _ in skipped}
+        return {
+            "updated": len(updated_ids),
+            "updated_ids": updated_ids,
+            "skipped_locked": [price_id for price_id, locked in skipped if locked],
+            "skipped_out_of_range": [price_id for price_id, locked in skipped if not locked],
+            "missing": [price_id for price_id in ids if price_id not in found] if ids is not None else [],
+        }
+
+    async def delete_price(self, price_id: uuid.UUID):
+        price_orm = await self.get_price(price_id)
 
         if price_orm.locked:
             raise AppException(
@@ -85,15 +173,14 @@ class PricingService:
                 message=f"Price {price_id} is locked by saga {price_orm.locked_by_saga_id} and cannot be deleted",
             )
 
-        self.repository.delete(price_orm)
-
-        event = PriceDeleted(payload={"id": str(price_id)})
-        self._add_to_outbox("commercial.pricing.events", event)
+        async with self.uow:
+            await self.repository.delete(price_orm)
 
-        self.db.commit()
+            event = PriceDeleted(payload={"id": str(price_id)})
+            self._add_to_outbox("commercial.pricing.events", event)
 
-    def lock_price(self, price_id: uuid.UUID, saga_id: uuid.UUID) -> PriceORM:
-        price_orm = self.get_price(price_id)
+    async def lock_price(self, price_id: uuid.UUID, saga_id: uuid.UUID) -> PriceORM:
+        price_orm = await self.get_price(price_id)
 
         # If already locked by the same saga, just return
         if price_orm.locked and price_orm.locked_by_saga_id == saga_id:
@@ -105,31 +192,31 @@ class PricingService:
                 message=f"Price {price_id} is already locked by another saga: {price_orm.locked_by_saga_id}",
             )
 
-        price_orm.locked = True
-        price_orm.locked_by_saga_id = saga_id
+        async with self.uow:
+            price_orm.locked = True
+            price_orm.locked_by_saga_id = saga_id
 
-        self.db.flush()
+            await self.db.flush()
 
-        event = PriceLocked(payload={"id": str(price_id), "locked_by_saga_id": str(saga_id)})
-        self._add_to_outbox("commercial.pricing.events", event)
+            event = PriceLocked(payload={"id": str(price_id), "locked_by_saga_id": str(saga_id)})
+            self._add_to_outbox("commercial.pricing.events", event)
 
-        self.db.commit()
         return price_orm
 
-    def unlock_price(self, price_id: uuid.UUID) -> PriceORM:
-        price_orm = self.get_price(price_id)
+    async def unlock_price(self, price_id: uuid.UUID) -> PriceORM:
+        price_orm = await self.get_price(price_id)
 
         if not price_orm.locked:
             return price_orm
 
-        saga_id = price_orm.locked_by_saga_id
-        price_orm.locked = False
-        price_orm.locked_by_saga_id = None
+        async with self.uow:
+            saga_id = price_orm.locked_by_saga_id
+            price_orm.locked = False
+            price_orm.locked_by_saga_id = None
 
-        self.db.flush()
+            await self.db.flush()
 
-        event = PriceUnlocked(payload={"id": str(price_id), "previously_locked_by": str(saga_id)})
-        self._add_to_outbox("commercial.pricing.events", event)
+            event = PriceUnlocked(payload={"id": str(price_id), "previously_locked_by": str(saga_id)})
+            self._add_to_outbox("commercial.pricing.events", event)
 
-        self.db.commit()
         return price_orm
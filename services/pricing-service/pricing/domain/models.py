@@ -6,6 +6,9 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Largest value `prices.value` (NUMERIC(10, 2)) holds
+MAX_PRICE_VALUE = Decimal("99999999.99")
+
 
 class CurrencyEnum(str, Enum):
     USD = "USD"
@@ -1,4 +1,8 @@
-from sqlalchemy import create_engine
+from common.database.engine import PoolConfig, create_db_engine
+from common.database.replicas import ReplicaRouter
+from common.database.session import create_async_session_factory
+from common.database.unit_of_work import ReturningDefaults
+from fastapi import Request, Response
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from ..config import settings
@@ -6,20 +10,36 @@ from ..config import settings
 DATABASE_URL = settings.DATABASE_URL
 
 if DATABASE_URL:
-    engine = create_engine(DATABASE_URL)
+    # Sync sessions for background work (outbox listener)
+    engine = create_db_engine(DATABASE_URL, PoolConfig.from_settings(settings))
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # Async sessions for request handlers
+    AsyncSessionLocal = create_async_session_factory(
+        DATABASE_URL, settings.DB_PREPARED_STATEMENT_CACHE_SIZE, pool=PoolConfig.from_settings(settings)
+    )
+    # Async sessions for read-only request handlers (DATABASE_REPLICA_URLS)
+    replicas = ReplicaRouter.from_settings(settings)
 else:
     engine = None
     SessionLocal = None
+    AsyncSessionLocal = None
+    replicas = ReplicaRouter()
 
-Base = declarative_base()
+Base = declarative_base(cls=ReturningDefaults)
 
 
-def get_db():
-    if SessionLocal is None:
-        raise RuntimeError("SessionLocal is not initialized. Check DATABASE_URL.")
-    db = SessionLocal()
-    try:
+async def get_db(response: Response):
+    if AsyncSessionLocal is None:
+        raise RuntimeError("AsyncSessionLocal is not initialized. Check DATABASE_URL.")
+    async with AsyncSessionLocal() as db:
+        # Commits set the read-your-writes cookie checked by get_read_db
+        replicas.track_commits(db, response)
+        yield db
+
+
+async def get_read_db(request: Request):
+    """Session for read-only handlers: a replica unless it lags the client's last write."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("AsyncSessionLocal is not initialized. Check DATABASE_URL.")
+    async with replicas.read_session(AsyncSessionLocal, request.cookies) as db:
         yield db
-    finally:
-        db.close()
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, timezone
 
 from common.database.outbox import OutboxMixin
-from sqlalchemy import Boolean, Column, DateTime, Numeric, String
+from sqlalchemy import Boolean, Column, DateTime, Index, Numeric, String
 from sqlalchemy.dialects.postgresql import UUID
 
 from ..domain.models import CurrencyEnum, Price
@@ -11,6 +11,12 @@ from .database import Base
 
 class PriceORM(Base):
     __tablename__ = "prices"
+    # Keyset pagination order, alone and behind each list filter
+    __table_args__ = (
+        Index("ix_prices_created_at_id", "created_at", "id"),
+        Index("ix_prices_currency_created_at_id", "currency", "created_at", "id"),
+        Index("ix_prices_locked_created_at_id", "locked", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(200), unique=True, nullable=False, index=True)
@@ -1,35 +1,138 @@
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable, List, Optional, Tuple
 
-from sqlalchemy.orm import Session
+from common.database.pagination import Page, keyset_paginate_async
+from sqlalchemy import Numeric, all_, any_, bindparam, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..domain.models import MAX_PRICE_VALUE, CurrencyEnum
 from .models import PriceORM
 
 
+def _uuid_array(name: str, ids: List[uuid.UUID]):
+    return bindparam(name, ids, type_=ARRAY(UUID(as_uuid=True)))
+
+
 class PriceRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     def create(self, price_orm: PriceORM) -> PriceORM:
+        # Staged only; the service's unit of work commits it with the outbox row
         self.db.add(price_orm)
-        self.db.commit()
-        self.db.refresh(price_orm)
         return price_orm
 
-    def get_by_id(self, price_id: uuid.UUID) -> Optional[PriceORM]:
-        return self.db.query(PriceORM).filter(PriceORM.id == price_id).first()
+    async def get_by_id(self, price_id: uuid.UUID) -> Optional[PriceORM]:
+        return await self.db.get(PriceORM, price_id)
 
-    def get_by_name(self, name: str) -> Optional[PriceORM]:
-        return self.db.query(PriceORM).filter(PriceORM.name == name).first()
+    async def get_many(self, ids: List[uuid.UUID]) -> List[PriceORM]:
+        # One query for any number of ids: WHERE id = ANY(:ids::uuid[])
+        return list(await self.db.scalars(select(PriceORM).where(PriceORM.id == any_(_uuid_array("ids", ids)))))
 
-    def list(self, skip: int = 0, limit: int = 100) -> List[PriceORM]:
-        return self.db.query(PriceORM).offset(skip).limit(limit).all()
+    async def get_by_name(self, name: str) -> Optional[PriceORM]:
+        return await self.db.scalar(select(PriceORM).where(PriceORM.name == name).limit(1))
 
-    def update(self, price_orm: PriceORM) -> PriceORM:
-        self.db.commit()
-        self.db.refresh(price_orm)
-        return price_orm
+    async def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        skip: int = 0,
+        currency: Optional[CurrencyEnum] = None,
+        locked: Optional[bool] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Page:
+        """Page of `PriceORM` instances, or of `Row`s holding just the `fields` columns."""
+        if fields is None:
+            stmt = select(PriceORM)
+        else:
+            stmt = select(*(getattr(PriceORM, name) for name in fields))
+        if currency is not None:
+            stmt = stmt.where(PriceORM.currency == currency.value)
+        if locked is not None:
+            stmt = stmt.where(PriceORM.locked == locked)
+        return await keyset_paginate_async(self.db, stmt, PriceORM, limit, after=after, skip=skip)
+
+    async def delete(self, price_orm: PriceORM):
+        await self.db.delete(price_orm)
+
+    async def adjust_many(
+        self,
+        now: datetime,
+        currency: Optional[CurrencyEnum] = None,
+        unit: Optional[str] = None,
+        percent: Optional[Decimal] = None,
+        amount: Optional[Decimal] = None,
+    ) -> List[PriceORM]:
+        """
+        Apply a relative (`percent`) or absolute (`amount`) change to every
+        matching price in one UPDATE ... RETURNING, rounded to cents. Locked
+        prices, and prices the change would take out of range, are left as-is.
+        """
+        # Unscaled NUMERIC, so a factor like 1.025 is not rounded to the column's scale
+        if percent is not None:
+            new_value = func.round(PriceORM.value * literal(1 + percent / 100, Numeric()), 2)
+        else:
+            new_value = func.round(PriceORM.value + literal(amount, Numeric()), 2)
+        stmt = (
+            update(PriceORM)
+            .where(
+                *self._filter(currency, unit),
+                PriceORM.locked.isnot(True),
+                new_value > 0,
+                new_value <= MAX_PRICE_VALUE,
+            )
+            .values(value=new_value, updated_at=now)
+            .returning(PriceORM)
+            .execution_options(synchronize_session=False)
+        )
+        return list(await self.db.scalars(stmt))
+
+    async def set_values_many(self, values: List[Tuple[uuid.UUID, Decimal]], now: datetime) -> List[PriceORM]:
+        """
+        Set explicit `(id, value)` pairs on unlocked prices in one UPDATE ...
+        FROM unnest(:ids, :values) ... RETURNING.
+        """
+        new_values = select(
+            func.unnest(_uuid_array("ids", [price_id for price_id, _ in values])).label("id"),
+            func.unnest(
+                bindparam("values", [value for _, value in values], type_=ARRAY(Numeric(10, 2)))
+            ).label("value"),
+        ).subquery("new_values")
+        stmt = (
+            update(PriceORM)
+            .where(PriceORM.id == new_values.c.id, PriceORM.locked.isnot(True))
+            .values(value=new_values.c.value, updated_at=now)
+            .returning(PriceORM)
+            .execution_options(synchronize_session=False)
+        )
+        return list(await self.db.scalars(stmt))
+
+    async def get_skipped(
+        self,
+        updated_ids: List[uuid.UUID],
+        ids: Optional[List[uuid.UUID]] = None,
+        currency: Optional[CurrencyEnum] = None,
+        unit: Optional[str] = None,
+    ) -> List[Tuple[uuid.UUID, bool]]:
+        """
+        `(id, locked)` of the prices a bulk update matched (by `ids`, or by the
+        filter) but did not change.
+        """
+        stmt = select(PriceORM.id, PriceORM.locked).where(PriceORM.id != all_(_uuid_array("updated_ids", updated_ids)))
+        if ids is not None:
+            stmt = stmt.where(PriceORM.id == any_(_uuid_array("ids", ids)))
+        else:
+            stmt = stmt.where(*self._filter(currency, unit))
+        return [(price_id, bool(locked)) for price_id, locked in await self.db.execute(stmt)]
 
-    def delete(self, price_orm: PriceORM):
-        self.db.delete(price_orm)
-        self.db.commit()
+    @staticmethod
+    def _filter(currency: Optional[CurrencyEnum], unit: Optional[str]) -> list:
+        criteria = []
+        if currency is not None:
+            criteria.append(PriceORM.currency == currency.value)
+        if unit is not None:
+            criteria.append(PriceORM.unit == unit)
+        return criteria
@@ -7,24 +7,48 @@ Provides CRUD operations for prices with locking support for saga transactions.
 import asyncio
 import uuid
 from contextlib import asynccontextmanager
-from typing import List
+from typing import List, Optional
 
 import httpx
+from common.database.engine import listen_dsn
 from common.database.outbox import OutboxListener
+from common.database.pagination import NEXT_CURSOR_HEADER
+from common.deadline import DeadlineMiddleware
 from common.exceptions import AppException
 from common.logging import setup_logging
 from common.messaging import RabbitMQPublisher
-from common.schemas import ErrorDetail, ErrorResponse
-from common.security import RoleChecker, get_current_user, security
+from common.metrics import metrics
+from common.schemas import (
+    BatchGetRequest,
+    BatchGetResponse,
+    ChangesResponse,
+    ErrorDetail,
+    ErrorResponse,
+)
+from common.security import (
+    INTERNAL_IDENTITY_HEADER,
+    RoleChecker,
+    get_current_user,
+    security,
+)
+from common.serialization import JSONRowsResponse
 from common.tracing import instrument_fastapi, setup_tracing
-from fastapi import Depends, FastAPI, Query, status
+from fastapi import Depends, FastAPI, Query, Request, status
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-
-from .application.schemas import PriceCreate, PriceLock, PriceRead, PriceUpdate
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .application.schemas import (
+    PriceBulkUpdate,
+    PriceBulkUpdateResult,
+    PriceCreate,
+    PriceLock,
+    PriceRead,
+    PriceUpdate,
+)
 from .application.service import PricingService
 from .config import settings
-from .infrastructure.database import SessionLocal, get_db
+from .domain.models import CurrencyEnum
+from .infrastructure.database import SessionLocal, get_db, get_read_db
 from .infrastructure.models import OutboxORM
 
 # Setup logging first
@@ -68,11 +92,8 @@ async def lifespan(app: FastAPI):
     publisher = RabbitMQPublisher(settings.RABBITMQ_URL)
 
     # Initialize Outbox Listener
-    dsn = (
-        settings.DATABASE_URL.replace("postgresql://", "postgres://")
-        if settings.DATABASE_URL
-        else None
-    )
+    # Dedicated LISTEN connection (direct to Postgres when DB_LISTEN_URL is set)
+    dsn = listen_dsn(settings.DATABASE_URL, settings.DB_LISTEN_URL) if settings.DATABASE_URL else None
 
     if dsn:
         listener = OutboxListener(
@@ -108,6 +129,9 @@ app = FastAPI(
 # Instrument FastAPI for tracing
 instrument_fastapi(app, excluded_urls="health")
 
+# Enforce the request deadline propagated by the API Gateway
+app.add_middleware(DeadlineMiddleware)
+
 
 @app.exception_handler(AppException)
 async def custom_app_exception_handler(request, exc: AppException):
@@ -136,11 +160,18 @@ async def custom_app_exception_handler(request, exc: AppException):
 
 
 # Security dependency override to inject public key
-def get_current_user_with_key(token=Depends(security)):
+def get_current_user_with_key(request: Request, token=Depends(security)):
     public_key = (
         settings.JWT_PUBLIC_KEY.replace("\\n", "\n") if settings.JWT_PUBLIC_KEY else None
     )
-    return get_current_user(token=token, public_key=public_key, algorithm=settings.JWT_ALGORITHM)
+    return get_current_user(
+        token=token,
+        public_key=public_key,
+        algorithm=settings.JWT_ALGORITHM,
+        # Identity already verified by the API Gateway (skips RSA verification)
+        internal_identity=request.headers.get(INTERNAL_IDENTITY_HEADER),
+        identity_secret=settings.INTERNAL_IDENTITY_SECRET,
+    )
 
 
 app.dependency_overrides[get_current_user] = get_current_user_with_key
@@ -155,15 +186,67 @@ async def health_check():
     return {"status": "healthy", "service": settings.SERVICE_NAME}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Expose in-process metrics (database pool checkouts, waits and saturation)."""
+    return metrics.snapshot()
+
+
 @app.post(
     "/api/v1/prices",
     response_model=PriceRead,
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(admin_required)],
 )
-def create_price(price_in: PriceCreate, db: Session = Depends(get_db)):
+async def create_price(price_in: PriceCreate, db: AsyncSession = Depends(get_db)):
+    service = PricingService(db)
+    return await service.create_price(price_in)
+
+
+@app.post(
+    "/api/v1/prices/batch-get",
+    response_model=BatchGetResponse[PriceRead],
+    # No auth required for internal service-to-service calls
+)
+async def batch_get_prices(batch: BatchGetRequest, db: AsyncSession = Depends(get_db)):
     service = PricingService(db)
-    return service.create_price(price_in)
+    items, missing = await service.batch_get_prices(batch.ids)
+    return {"items": items, "missing": missing}
+
+
+@app.post(
+    "/api/v1/prices/bulk-update",
+    response_model=PriceBulkUpdateResult,
+    dependencies=[Depends(admin_required)],
+)
+async def bulk_update_prices(bulk_in: PriceBulkUpdate, db: AsyncSession = Depends(get_db)):
+    """
+    Reprice many prices in one request: `filter` plus `adjustment` (e.g.
+    `{"filter": {"currency": "EUR", "unit": "per month"}, "adjustment": {"percent": 5}}`),
+    or explicit `values` (`[{"id": ..., "value": ...}]`). Locked prices are
+    skipped and reported, like any price the adjustment would take out of range.
+    """
+    service = PricingService(db)
+    return await service.bulk_update_prices(bulk_in)
+
+
+@app.get(
+    "/api/v1/prices/changes",
+    response_model=ChangesResponse[PriceRead],
+    # No auth required for internal service-to-service calls
+)
+async def list_price_changes(
+    since: Optional[str] = Query(None, description="next_cursor of the previous page; omit to start from the beginning"),
+    limit: int = Query(1000, ge=1, le=5000),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Changefeed for catching up without replaying every event: ordered upserts
+    (current state) and tombstones. Keep calling with `next_cursor` while
+    `has_more` is true; later calls pick up new changes from there.
+    """
+    service = PricingService(db)
+    return await service.list_changes(since=since, limit=limit)
 
 
 @app.get(
@@ -171,9 +254,9 @@ def create_price(price_in: PriceCreate, db: Session = Depends(get_db)):
     response_model=PriceRead,
     # No auth required for internal service-to-service calls
 )
-def get_price(price_id: uuid.UUID, db: Session = Depends(get_db)):
+async def get_price(price_id: uuid.UUID, db: AsyncSession = Depends(get_read_db)):
     service = PricingService(db)
-    return service.get_price(price_id)
+    return await service.get_price(price_id)
 
 
 @app.get(
@@ -181,13 +264,27 @@ def get_price(price_id: uuid.UUID, db: Session = Depends(get_db)):
     response_model=List[PriceRead],
     # No auth required for internal service-to-service calls
 )
-def list_prices(
-    skip: int = Query(0, ge=0),
+async def list_prices(
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    skip: int = Query(0, ge=0, description="Offset paging, ignored when `after` is given"),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db),
+    currency: Optional[CurrencyEnum] = None,
+    locked: Optional[bool] = None,
+    db: AsyncSession = Depends(get_read_db),
 ):
+    """
+    Keyset-paginated listing in creation order. When more rows follow, the
+    cursor of the next page is returned in the `X-Next-Cursor` header.
+    """
     service = PricingService(db)
-    return service.list_prices(skip=skip, limit=limit)
+    # Only the response columns, rendered to JSON without per-row model validation
+    page = await service.list_prices(
+        limit=limit, after=after, skip=skip, currency=currency, locked=locked, fields=PriceRead.model_fields
+    )
+    response = JSONRowsResponse(page.items)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
 
 
 @app.put(
@@ -195,9 +292,9 @@ def list_prices(
     response_model=PriceRead,
     dependencies=[Depends(admin_required)],
 )
-def update_price(price_id: uuid.UUID, price_in: PriceUpdate, db: Session = Depends(get_db)):
+async def update_price(price_id: uuid.UUID, price_in: PriceUpdate, db: AsyncSession = Depends(get_db)):
     service = PricingService(db)
-    return service.update_price(price_id, price_in)
+    return await service.update_price(price_id, price_in)
 
 
 @app.delete(
@@ -205,9 +302,9 @@ def update_price(price_id: uuid.UUID, price_in: PriceUpdate, db: Session = Depen
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(admin_required)],
 )
-def delete_price(price_id: uuid.UUID, db: Session = Depends(get_db)):
+async def delete_price(price_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     service = PricingService(db)
-    service.delete_price(price_id)
+    await service.delete_price(price_id)
     return None
 
 
@@ -216,9 +313,9 @@ def delete_price(price_id: uuid.UUID, db: Session = Depends(get_db)):
     response_model=PriceRead,
     dependencies=[Depends(admin_required)],
 )
-def lock_price(price_id: uuid.UUID, lock_in: PriceLock, db: Session = Depends(get_db)):
+async def lock_price(price_id: uuid.UUID, lock_in: PriceLock, db: AsyncSession = Depends(get_db)):
     service = PricingService(db)
-    return service.lock_price(price_id, lock_in.saga_id)
+    return await service.lock_price(price_id, lock_in.saga_id)
 
 
 @app.post(
@@ -226,9 +323,9 @@ def lock_price(price_id: uuid.UUID, lock_in: PriceLock, db: Session = Depends(ge
     response_model=PriceRead,
     dependencies=[Depends(admin_required)],
 )
-def unlock_price(price_id: uuid.UUID, db: Session = Depends(get_db)):
+async def unlock_price(price_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     service = PricingService(db)
-    return service.unlock_price(price_id)
+    return await service.unlock_price(price_id)
 
 
 if __name__ == "__main__":
@@ -12,7 +12,7 @@ if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
 
 import pricing.main as main_module  # noqa: E402
-from pricing.infrastructure.database import get_db  # noqa: E402
+from pricing.infrastructure.database import get_db, get_read_db  # noqa: E402
 from pricing.main import admin_required, any_user_required, app  # noqa: E402
 
 
@@ -35,6 +35,7 @@ def client(db_session_mock, mock_admin):
         yield db_session_mock
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[admin_required] = lambda: mock_admin
     app.dependency_overrides[any_user_required] = lambda: mock_admin
 
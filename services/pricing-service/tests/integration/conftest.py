@@ -2,11 +2,14 @@ import os
 import sys
 
 import pytest
+import pytest_asyncio
+from common.database.session import create_async_session_factory
 from common.security import UserContext
 from common.testing.containers import start_postgres
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 # Add src to path so we can import it, and ensure we get the right 'src'
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
@@ -18,7 +21,7 @@ sys.path.insert(0, COMMON_DIR)
 import pricing.infrastructure.database as db_module  # noqa: E402
 import pricing.main as main_module  # noqa: E402
 from pricing.config import settings  # noqa: E402
-from pricing.infrastructure.database import Base, get_db  # noqa: E402
+from pricing.infrastructure.database import Base  # noqa: E402
 from pricing.main import admin_required, any_user_required, app  # noqa: E402
 
 
@@ -39,6 +42,9 @@ def configure_db(infra):
     db_module.engine = create_engine(infra["pg"].url)
     db_module.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_module.engine)
     db_module.DATABASE_URL = infra["pg"].url
+    # Request handlers use async sessions; NullPool keeps connections off the
+    # event loops of finished tests and TestClient portals
+    db_module.AsyncSessionLocal = create_async_session_factory(infra["pg"].url, poolclass=NullPool)
 
     Base.metadata.create_all(bind=db_module.engine)
     yield
@@ -46,23 +52,24 @@ def configure_db(infra):
 
 @pytest.fixture
 def db_session():
-    connection = db_module.engine.connect()
-    transaction = connection.begin()
-    session = db_module.SessionLocal(bind=connection)
+    # Requests commit on their own async connections, so a rolled-back outer
+    # transaction cannot isolate tests; tables are emptied instead
+    session = db_module.SessionLocal()
     try:
         yield session
     finally:
         session.close()
-        transaction.rollback()
-        connection.close()
+        with db_module.engine.connect() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+            conn.commit()
 
 
-@pytest.fixture
-def override_get_db(db_session):
-    def _override_get_db():
-        yield db_session
-
-    return _override_get_db
+@pytest_asyncio.fixture
+async def async_db_session(db_session):
+    # Cleanup is left to db_session
+    async with db_module.AsyncSessionLocal() as session:
+        yield session
 
 
 @pytest.fixture
@@ -71,8 +78,8 @@ def mock_admin():
 
 
 @pytest.fixture
-def client(override_get_db, mock_admin):
-    app.dependency_overrides[get_db] = override_get_db
+def client(db_session, mock_admin):
+    # get_db serves committed data, so API calls and db_session see each other's writes
     app.dependency_overrides[admin_required] = lambda: mock_admin
     app.dependency_overrides[any_user_required] = lambda: mock_admin
     with TestClient(app) as test_client:
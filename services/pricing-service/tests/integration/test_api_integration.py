@@ -39,3 +39,127 @@ def test_lock_and_update_price(client: TestClient):
     assert update_response.status_code == 200
     assert update_response.json()["name"] == "Updated Name"
 
+
+def test_list_prices_cursor_and_filters(client: TestClient):
+    for i, currency in enumerate(["USD", "EUR", "USD"]):
+        price_data = {"name": f"Paged Price {i}", "value": "1.00", "unit": "once", "currency": currency}
+        assert client.post("/api/v1/prices", json=price_data).status_code == 201
+
+    first = client.get("/api/v1/prices", params={"limit": 2})
+    assert first.status_code == 200
+    assert len(first.json()) == 2
+    cursor = first.headers["X-Next-Cursor"]
+
+    rest = client.get("/api/v1/prices", params={"limit": 100, "after": cursor})
+    names = {p["name"] for p in first.json() + rest.json()}
+    assert {f"Paged Price {i}" for i in range(3)} <= names
+    assert "X-Next-Cursor" not in rest.headers
+
+    usd = client.get("/api/v1/prices", params={"currency": "USD", "locked": False}).json()
+    assert {p["name"] for p in usd if p["name"].startswith("Paged")} == {"Paged Price 0", "Paged Price 2"}
+
+    assert client.get("/api/v1/prices", params={"after": "garbage"}).status_code == 400
+
+
+def test_list_renders_prices_like_get(client: TestClient):
+    price_data = {"name": "Rendered Price", "value": "12.50", "unit": "per month", "currency": "TRY"}
+    price_id = client.post("/api/v1/prices", json=price_data).json()["id"]
+
+    listed = client.get("/api/v1/prices", params={"currency": "TRY"})
+    assert listed.headers["content-type"] == "application/json"
+    listed_price = next(p for p in listed.json() if p["id"] == price_id)
+
+    assert listed_price == client.get(f"/api/v1/prices/{price_id}").json()
+
+
+def test_changes_feed_catches_up_with_upserts_and_tombstones(client: TestClient):
+    start = client.get("/api/v1/prices/changes").json()
+    while start["has_more"]:
+        start = client.get("/api/v1/prices/changes", params={"since": start["next_cursor"]}).json()
+    since = start["next_cursor"]
+
+    def create(name: str) -> str:
+        data = {"name": name, "value": "5.00", "unit": "once", "currency": "EUR"}
+        return client.post("/api/v1/prices", json=data).json()["id"]
+
+    kept, removed = create("Feed Kept"), create("Feed Removed")
+    client.put(f"/api/v1/prices/{kept}", json={"name": "Feed Kept", "value": "6.00", "unit": "once", "currency": "EUR"})
+    assert client.delete(f"/api/v1/prices/{removed}").status_code == 204
+
+    params = {"since": since} if since else {}
+    page = client.get("/api/v1/prices/changes", params={**params, "limit": 2})
+    assert page.status_code == 200
+    first = page.json()
+    assert first["has_more"] is True
+    rest = client.get("/api/v1/prices/changes", params={"since": first["next_cursor"]}).json()
+    assert rest["has_more"] is False
+
+    # Compacted per page; the latest entry per id wins across pages
+    latest = {}
+    for change in first["changes"] + rest["changes"]:
+        latest[change["id"]] = change
+    assert latest[kept]["op"] == "upsert"
+    assert latest[kept]["data"]["value"] == "6.00"
+    assert latest[removed] == {"op": "delete", "id": removed, "data": None}
+
+    assert client.get("/api/v1/prices/changes", params={"since": "garbage"}).status_code == 400
+
+
+def test_bulk_update_adjusts_matching_prices_and_skips_locked(client: TestClient):
+    ids = {}
+    for name, value, unit, currency in [
+        ("Bulk EUR Monthly A", "10.00", "per bulk month", "EUR"),
+        ("Bulk EUR Monthly B", "19.99", "per bulk month", "EUR"),
+        ("Bulk EUR Monthly Locked", "30.00", "per bulk month", "EUR"),
+        ("Bulk EUR Once", "10.00", "once", "EUR"),
+        ("Bulk USD Monthly", "10.00", "per bulk month", "USD"),
+    ]:
+        response = client.post(
+            "/api/v1/prices", json={"name": name, "value": value, "unit": unit, "currency": currency}
+        )
+        ids[name] = response.json()["id"]
+    client.post(f"/api/v1/prices/{ids['Bulk EUR Monthly Locked']}/lock", json={"saga_id": str(uuid.uuid4())})
+
+    response = client.post(
+        "/api/v1/prices/bulk-update",
+        json={"filter": {"currency": "EUR", "unit": "per bulk month"}, "adjustment": {"percent": "5"}},
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["updated"] == 2
+    assert set(result["updated_ids"]) == {ids["Bulk EUR Monthly A"], ids["Bulk EUR Monthly B"]}
+    assert result["skipped_locked"] == [ids["Bulk EUR Monthly Locked"]]
+
+    values = {name: client.get(f"/api/v1/prices/{price_id}").json()["value"] for name, price_id in ids.items()}
+    assert values == {
+        "Bulk EUR Monthly A": "10.50",
+        "Bulk EUR Monthly B": "20.99",
+        "Bulk EUR Monthly Locked": "30.00",
+        "Bulk EUR Once": "10.00",
+        "Bulk USD Monthly": "10.00",
+    }
+
+    missing_id = str(uuid.uuid4())
+    response = client.post(
+        "/api/v1/prices/bulk-update",
+        json={
+            "values": [
+                {"id": ids["Bulk EUR Once"], "value": "12.00"},
+                {"id": ids["Bulk EUR Monthly Locked"], "value": "1.00"},
+                {"id": missing_id, "value": "1.00"},
+            ]
+        },
+    )
+    result = response.json()
+    assert result["updated_ids"] == [ids["Bulk EUR Once"]]
+    assert result["skipped_locked"] == [ids["Bulk EUR Monthly Locked"]]
+    assert result["missing"] == [missing_id]
+    assert client.get(f"/api/v1/prices/{ids['Bulk EUR Once']}").json()["value"] == "12.00"
+
+    response = client.post(
+        "/api/v1/prices/bulk-update",
+        json={"filter": {"currency": "USD", "unit": "per bulk month"}, "adjustment": {"amount": "-10.00"}},
+    )
+    result = response.json()
+    assert result["updated"] == 0
+    assert result["skipped_out_of_range"] == [ids["Bulk USD Monthly"]]
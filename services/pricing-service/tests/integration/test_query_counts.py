@@ -0,0 +1,82 @@
+"""
+Round-trip regression tests: each write endpoint commits the entity and its
+outbox row once, without refresh SELECTs.
+"""
+
+import uuid
+
+import pricing.infrastructure.database as db_module
+from common.testing.queries import count_queries
+from fastapi.testclient import TestClient
+
+
+def _request_queries():
+    return count_queries(db_module.AsyncSessionLocal.kw["bind"])
+
+
+def _create(client: TestClient, name: str) -> str:
+    response = client.post("/api/v1/prices", json={"name": name, "value": "10.00", "unit": "once", "currency": "USD"})
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_create_queries(client: TestClient):
+    with _request_queries() as queries:
+        _create(client, "Counted Create")
+
+    # Name check, price, outbox row
+    assert queries.counts == {"SELECT": 1, "INSERT": 2, "COMMIT": 1}
+
+
+def test_update_queries(client: TestClient):
+    price_id = _create(client, "Counted Update")
+
+    with _request_queries() as queries:
+        response = client.put(
+            f"/api/v1/prices/{price_id}",
+            json={"name": "Counted Update", "value": "20.00", "unit": "once", "currency": "USD"},
+        )
+    assert response.status_code == 200
+
+    assert queries.counts == {"SELECT": 1, "UPDATE": 1, "INSERT": 1, "COMMIT": 1}
+
+
+def test_delete_queries(client: TestClient):
+    price_id = _create(client, "Counted Delete")
+
+    with _request_queries() as queries:
+        response = client.delete(f"/api/v1/prices/{price_id}")
+    assert response.status_code == 204
+
+    assert queries.counts == {"SELECT": 1, "DELETE": 1, "INSERT": 1, "COMMIT": 1}
+
+
+def test_lock_and_unlock_queries(client: TestClient):
+    price_id = _create(client, "Counted Lock")
+
+    with _request_queries() as lock_queries:
+        response = client.post(f"/api/v1/prices/{price_id}/lock", json={"saga_id": str(uuid.uuid4())})
+    assert response.status_code == 200
+
+    with _request_queries() as unlock_queries:
+        response = client.post(f"/api/v1/prices/{price_id}/unlock")
+    assert response.status_code == 200
+
+    assert lock_queries.counts == {"SELECT": 1, "UPDATE": 1, "INSERT": 1, "COMMIT": 1}
+    assert unlock_queries.counts == {"SELECT": 1, "UPDATE": 1, "INSERT": 1, "COMMIT": 1}
+
+
+def test_bulk_update_queries(client: TestClient):
+    for i in range(3):
+        _create(client, f"Counted Bulk {i}")
+
+    with _request_queries() as queries:
+        response = client.post(
+            "/api/v1/prices/bulk-update",
+            json={"filter": {"currency": "USD"}, "adjustment": {"amount": "1.00"}},
+        )
+    assert response.status_code == 200
+    assert response.json()["updated"] >= 3
+
+    # One UPDATE for every price, the skipped-price check, one outbox insert for all events
+    assert queries.counts == {"UPDATE": 1, "SELECT": 1, "INSERT": 1, "COMMIT": 1}
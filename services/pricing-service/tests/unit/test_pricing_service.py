@@ -1,19 +1,23 @@
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from common.exceptions import AppException, ConflictError
-from pricing.application.schemas import PriceCreate, PriceUpdate
+from pricing.application.schemas import PriceBulkUpdate, PriceCreate, PriceUpdate
 from pricing.application.service import PricingService
 from pricing.domain.models import CurrencyEnum
 from pricing.infrastructure.models import PriceORM
+from pydantic import ValidationError as PydanticValidationError
 
 
 @pytest.fixture
 def mock_db_session():
     session = MagicMock()
+    session.flush = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
     # Mock repository methods through the session if needed,
     # but service uses self.repository which is initialized with db
     return session
@@ -22,11 +26,12 @@ def mock_db_session():
 @pytest.fixture
 def service(mock_db_session):
     svc = PricingService(mock_db_session)
-    svc.repository = MagicMock()
+    svc.repository = AsyncMock()
     return svc
 
 
-def test_create_price_success(service, mock_db_session):
+@pytest.mark.asyncio
+async def test_create_price_success(service, mock_db_session):
     price_in = PriceCreate(name="Test Price", value=Decimal("19.99"), unit="per month", currency=CurrencyEnum.USD)
 
     # Mock repo to return None (no duplicate)
@@ -40,27 +45,30 @@ def test_create_price_success(service, mock_db_session):
         orm.updated_at = datetime.now(timezone.utc)
         return orm
 
-    service.repository.create.side_effect = mock_create
+    service.repository.create = MagicMock(side_effect=mock_create)
 
-    created_price = service.create_price(price_in)
+    created_price = await service.create_price(price_in)
 
     assert created_price.name == "Test Price"
     assert created_price.value == Decimal("19.99")
-    service.repository.create.assert_called()
-    mock_db_session.commit.assert_called()
+    service.repository.create.assert_called_once()
+    # Entity and outbox row in one transaction
+    mock_db_session.commit.assert_awaited_once()
 
 
-def test_create_price_duplicate_name(service, mock_db_session):
+@pytest.mark.asyncio
+async def test_create_price_duplicate_name(service, mock_db_session):
     price_in = PriceCreate(name="Duplicate", value=Decimal("10.00"), unit="once", currency=CurrencyEnum.EUR)
 
     # Mock existing price
     service.repository.get_by_name.return_value = MagicMock()
 
     with pytest.raises(ConflictError):
-        service.create_price(price_in)
+        await service.create_price(price_in)
 
 
-def test_update_locked_price_fails(service, mock_db_session):
+@pytest.mark.asyncio
+async def test_update_locked_price_fails(service, mock_db_session):
     price_id = uuid.uuid4()
     existing_price = PriceORM(id=price_id, name="Locked", value=10, unit="once", currency="USD", locked=True, locked_by_saga_id=uuid.uuid4())
     service.repository.get_by_id.return_value = existing_price
@@ -68,24 +76,26 @@ def test_update_locked_price_fails(service, mock_db_session):
     price_update = PriceUpdate(name="New Name", value=Decimal("20.00"), unit="once", currency=CurrencyEnum.USD)
 
     with pytest.raises(AppException) as exc:
-        service.update_price(price_id, price_update)
+        await service.update_price(price_id, price_update)
     assert exc.value.code == "LOCKED"
 
 
-def test_lock_price_success(service, mock_db_session):
+@pytest.mark.asyncio
+async def test_lock_price_success(service, mock_db_session):
     price_id = uuid.uuid4()
     saga_id = uuid.uuid4()
     existing_price = PriceORM(id=price_id, name="To Lock", value=10, unit="once", currency="USD", locked=False)
     service.repository.get_by_id.return_value = existing_price
 
-    locked_price = service.lock_price(price_id, saga_id)
+    locked_price = await service.lock_price(price_id, saga_id)
 
     assert locked_price.locked is True
     assert locked_price.locked_by_saga_id == saga_id
-    mock_db_session.commit.assert_called()
+    mock_db_session.commit.assert_awaited_once()
 
 
-def test_lock_already_locked_price_fails(service, mock_db_session):
+@pytest.mark.asyncio
+async def test_lock_already_locked_price_fails(service, mock_db_session):
     price_id = uuid.uuid4()
     saga_id_1 = uuid.uuid4()
     saga_id_2 = uuid.uuid4()
@@ -93,5 +103,63 @@ def test_lock_already_locked_price_fails(service, mock_db_session):
     service.repository.get_by_id.return_value = existing_price
 
     with pytest.raises(AppException) as exc:
-        service.lock_price(price_id, saga_id_2)
+        await service.lock_price(price_id, saga_id_2)
     assert exc.value.code == "LOCKED"
+
+
+@pytest.mark.asyncio
+async def test_batch_get_prices_reports_missing_ids(service):
+    found_id, missing_id = uuid.uuid4(), uuid.uuid4()
+    found = PriceORM(id=found_id, name="Found", value=10, unit="once", currency="USD", locked=False)
+    service.repository.get_many.return_value = [found]
+
+    items, missing = await service.batch_get_prices([found_id, missing_id, found_id])
+
+    assert items == [found]
+    assert missing == [missing_id]
+    service.repository.get_many.assert_awaited_once_with([found_id, missing_id])
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_reports_updated_locked_and_missing(service, mock_db_session):
+    updated_id, locked_id, missing_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    mock_db_session.execute = AsyncMock()
+    service.repository.set_values_many.return_value = [
+        PriceORM(id=updated_id, name="Updated", value=Decimal("12.00"), unit="once", currency="USD", locked=False)
+    ]
+    service.repository.get_skipped.return_value = [(locked_id, True)]
+    bulk_in = PriceBulkUpdate(
+        values=[{"id": updated_id, "value": "12"}, {"id": locked_id, "value": "1"}, {"id": missing_id, "value": "1"}]
+    )
+
+    result = await service.bulk_update_prices(bulk_in)
+
+    assert result == {
+        "updated": 1,
+        "updated_ids": [updated_id],
+        "skipped_locked": [locked_id],
+        "skipped_out_of_range": [],
+        "missing": [missing_id],
+    }
+    # Every event in one multi-row outbox insert, committed once
+    mock_db_session.execute.assert_awaited_once()
+    assert len(mock_db_session.execute.await_args.args[1]) == 1
+    mock_db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        {"filter": {"currency": "EUR"}},
+        {"filter": {}, "adjustment": {"percent": "5", "amount": "1"}},
+        {"filter": {}, "adjustment": {"percent": "5"}, "values": [{"id": str(uuid.uuid4()), "value": "1"}]},
+        {"values": [{"id": "00000000-0000-0000-0000-000000000001", "value": "1"}] * 2},
+        {"values": [{"id": str(uuid.uuid4()), "value": "0"}]},
+        {"values": [{"id": str(uuid.uuid4()), "value": "100000000"}]},
+        {"filter": {}, "adjustment": {"percent": "5"}},
+    ],
+)
+def test_bulk_update_request_must_pick_one_mode(body):
+    with pytest.raises(PydanticValidationError):
+        PriceBulkUpdate(**body)
@@ -0,0 +1,53 @@
+"""add_list_pagination_indexes
+
+Revision ID: 5a8e1c3f7b92
+Revises: 83e4be9dc43b
+Create Date: 2026-10-19 14:05:32.118407
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5a8e1c3f7b92'
+down_revision: Union[str, Sequence[str], None] = '83e4be9dc43b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY cannot run inside the migration transaction, and keeps the
+    # table writable while existing rows are indexed
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_specifications_created_at_id',
+            'specifications',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_specifications_characteristic_ids',
+            'specifications',
+            ['characteristic_ids'],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_using='gin',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_specifications_characteristic_ids',
+            table_name='specifications',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_specifications_created_at_id',
+            table_name='specifications',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,47 @@
+"""add_outbox_txid
+
+Revision ID: 8d2f4b6a0e15
+Revises: 5a8e1c3f7b92
+Create Date: 2026-10-19 17:06:47.102844
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f4b6a0e15'
+down_revision: Union[str, Sequence[str], None] = '5a8e1c3f7b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows all get this migration's transaction id, which sorts them
+    # before any later write
+    op.add_column(
+        'outbox',
+        sa.Column(
+            'txid',
+            sa.BigInteger(),
+            server_default=sa.text('(pg_current_xact_id()::text)::bigint'),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_outbox_txid_id',
+            'outbox',
+            ['txid', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_outbox_txid_id', table_name='outbox', postgresql_concurrently=True)
+    op.drop_column('outbox', 'txid')
@@ -1,8 +1,12 @@
 import uuid
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from common.database.changefeed import read_changes
+from common.database.pagination import Page
+from common.database.unit_of_work import UnitOfWork
 from common.exceptions import AppException
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..infrastructure.models import CachedCharacteristicORM, OutboxORM, SpecificationORM
 from ..infrastructure.repository import SpecificationRepository
@@ -11,11 +15,12 @@ from .schemas import SpecificationCreate, SpecificationUpdate
 
 
 class SpecificationService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.repository = SpecificationRepository(db)
+        self.uow = UnitOfWork(db)
 
-    def _validate_characteristics(self, characteristic_ids: List[uuid.UUID]):
+    async def _validate_characteristics(self, characteristic_ids: List[uuid.UUID]):
         """
         Validates that all characteristic IDs exist in the local cache.
         """
@@ -23,11 +28,9 @@ class SpecificationService:
             raise AppException("A specification must have at least one characteristic", "VALIDATION_ERROR")
 
         # Query local cache
-        existing = self.db.query(CachedCharacteristicORM.id).filter(
-            CachedCharacteristicORM.id.in_(characteristic_ids)
-        ).all()
-
-        existing_ids = {row.id for row in existing}
+        existing_ids = set(await self.db.scalars(
+            select(CachedCharacteristicORM.id).where(CachedCharacteristicORM.id.in_(characteristic_ids))
+        ))
         missing_ids = [str(cid) for cid in characteristic_ids if cid not in existing_ids]
 
         if missing_ids:
@@ -44,80 +47,110 @@ class SpecificationService:
         )
         self.db.add(outbox_entry)
 
-    def create_specification(self, spec_in: SpecificationCreate) -> SpecificationORM:
+    async def create_specification(self, spec_in: SpecificationCreate) -> SpecificationORM:
         # Check uniqueness
-        if self.repository.get_by_name(spec_in.name):
+        if await self.repository.get_by_name(spec_in.name):
             raise AppException(f"Specification with name '{spec_in.name}' already exists", "CONFLICT")
 
         # Validate characteristics from local cache
-        self._validate_characteristics(spec_in.characteristic_ids)
+        await self._validate_characteristics(spec_in.characteristic_ids)
 
         spec_orm = SpecificationORM(
             name=spec_in.name,
             characteristic_ids=spec_in.characteristic_ids
         )
 
-        self.repository.create(spec_orm)
-        self.db.flush() # Get ID
+        async with self.uow:
+            self.repository.create(spec_orm)
+            await self.db.flush() # Get ID
 
-        # Write to outbox
-        event = SpecificationCreated(payload=spec_orm.to_domain().model_dump(mode='json'))
-        self._add_to_outbox("resource.specifications.events", event)
+            # Write to outbox
+            event = SpecificationCreated(payload=spec_orm.to_domain().model_dump(mode='json'))
+            self._add_to_outbox("resource.specifications.events", event)
 
-        self.db.commit()
         return spec_orm
 
-    def get_specification(self, spec_id: uuid.UUID) -> SpecificationORM:
-        spec = self.repository.get_by_id(spec_id)
+    async def get_specification(self, spec_id: uuid.UUID) -> SpecificationORM:
+        spec = await self.repository.get_by_id(spec_id)
         if not spec:
             raise AppException(f"Specification with ID {spec_id} not found", "NOT_FOUND")
         return spec
 
-    def list_specifications(self, skip: int = 0, limit: int = 100) -> List[SpecificationORM]:
-        return self.repository.list(skip, limit)
+    async def batch_get_specifications(self, ids: List[uuid.UUID]) -> Tuple[List[SpecificationORM], List[uuid.UUID]]:
+        """
+        Fetch many specifications with a single query.
+
+        Returns:
+            The specifications found and the requested ids that do not exist.
+        """
+        ids = list(dict.fromkeys(ids))
+        found = await self.repository.get_many(ids) if ids else []
+        found_ids = {item.id for item in found}
+        return found, [item_id for item_id in ids if item_id not in found_ids]
+
+    async def list_specifications(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        skip: int = 0,
+        characteristic_id: Optional[uuid.UUID] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Page:
+        return await self.repository.list(
+            limit, after=after, skip=skip, characteristic_id=characteristic_id, fields=fields
+        )
 
-    def update_specification(self, spec_id: uuid.UUID, spec_in: SpecificationUpdate) -> SpecificationORM:
-        spec_orm = self.get_specification(spec_id)
+    async def list_changes(self, since: Optional[str] = None, limit: int = 1000) -> Dict[str, Any]:
+        """Changefeed page after `since`: upserts with current state, tombstones for deletions."""
+        batch = await read_changes(self.db, OutboxORM, since, limit)
+        entities = await self.repository.get_many(batch.entity_ids) if batch.entity_ids else []
+        return batch.resolve(entities)
+
+    async def update_specification(self, spec_id: uuid.UUID, spec_in: SpecificationUpdate) -> SpecificationORM:
+        spec_orm = await self.get_specification(spec_id)
 
         # Check name uniqueness if changed
         if spec_in.name != spec_orm.name:
-            if self.repository.get_by_name(spec_in.name):
+            if await self.repository.get_by_name(spec_in.name):
                 raise AppException("CONFLICT", f"Specification with name '{spec_in.name}' already exists")
 
         # Validate characteristics from local cache
-        self._validate_characteristics(spec_in.characteristic_ids)
+        await self._validate_characteristics(spec_in.characteristic_ids)
 
-        spec_orm.name = spec_in.name
-        spec_orm.characteristic_ids = spec_in.characteristic_ids
+        async with self.uow:
+            spec_orm.name = spec_in.name
+            spec_orm.characteristic_ids = spec_in.characteristic_ids
 
-        self.db.flush()
+            await self.db.flush()
 
-        # Write to outbox
-        event = SpecificationUpdated(payload=spec_orm.to_domain().model_dump(mode='json'))
-        self._add_to_outbox("resource.specifications.events", event)
+            # Write to outbox
+            event = SpecificationUpdated(payload=spec_orm.to_domain().model_dump(mode='json'))
+            self._add_to_outbox("resource.specifications.events", event)
 
-        self.db.commit()
         return spec_orm
 
-    def delete_specification(self, spec_id: uuid.UUID):
-        spec_orm = self.get_specification(spec_id)
+    async def delete_specification(self, spec_id: uuid.UUID):
+        spec_orm = await self.get_specification(spec_id)
 
         # In a real system, we'd check if any Offerings use this Spec here.
         # For now, we just delete.
 
-        self.repository.delete(spec_orm)
-
-        # Write to outbox
-        event = SpecificationDeleted(payload={"id": str(spec_id)})
-        self._add_to_outbox("resource.specifications.events", event)
+        async with self.uow:
+            await self.repository.delete(spec_orm)
 
-        self.db.commit()
+            # Write to outbox
+            event = SpecificationDeleted(payload={"id": str(spec_id)})
+            self._add_to_outbox("resource.specifications.events", event)
 
-    def validate_specifications(self, spec_ids: List[uuid.UUID]):
+    async def validate_specifications(self, spec_ids: List[uuid.UUID]):
         """
-        Validates a list of specification IDs.
-        Raises AppException if any ID is missing.
+        Validates a list of specification IDs with a single query.
+        Raises AppException listing every missing ID.
         """
-        for spec_id in spec_ids:
-            # get_specification already raises AppException if not found
-            self.get_specification(spec_id)
+        _, missing = await self.batch_get_specifications(spec_ids)
+        if missing:
+            raise AppException(
+                f"Specifications not found: {', '.join(str(spec_id) for spec_id in missing)}",
+                "NOT_FOUND",
+                details={"missing_ids": [str(spec_id) for spec_id in missing]},
+            )
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime, timezone
 
 from common.database.outbox import OutboxMixin
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, Index, String
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 
 from .database import Base
@@ -10,6 +10,11 @@ from .database import Base
 
 class SpecificationORM(Base):
     __tablename__ = "specifications"
+    # Keyset pagination order, and containment (@>) lookups for the list filter
+    __table_args__ = (
+        Index("ix_specifications_created_at_id", "created_at", "id"),
+        Index("ix_specifications_characteristic_ids", "characteristic_ids", postgresql_using="gin"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(200), unique=True, nullable=False, index=True)
@@ -1,28 +1,52 @@
 import uuid
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-from sqlalchemy.orm import Session
+from common.database.pagination import Page, keyset_paginate_async
+from sqlalchemy import any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..infrastructure.models import SpecificationORM
 
 
 class SpecificationRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     def create(self, spec_orm: SpecificationORM) -> SpecificationORM:
         self.db.add(spec_orm)
-        # We don't commit here to allow service layer to manage transaction with outbox
+        # Staged only; the service's unit of work commits it with the outbox row
         return spec_orm
 
-    def get_by_id(self, spec_id: uuid.UUID) -> Optional[SpecificationORM]:
-        return self.db.query(SpecificationORM).filter(SpecificationORM.id == spec_id).first()
-
-    def get_by_name(self, name: str) -> Optional[SpecificationORM]:
-        return self.db.query(SpecificationORM).filter(SpecificationORM.name == name).first()
-
-    def list(self, skip: int = 0, limit: int = 100) -> List[SpecificationORM]:
-        return self.db.query(SpecificationORM).offset(skip).limit(limit).all()
-
-    def delete(self, spec_orm: SpecificationORM):
-        self.db.delete(spec_orm)
+    async def get_by_id(self, spec_id: uuid.UUID) -> Optional[SpecificationORM]:
+        return await self.db.get(SpecificationORM, spec_id)
+
+    async def get_many(self, ids: List[uuid.UUID]) -> List[SpecificationORM]:
+        # One query for any number of ids: WHERE id = ANY(:ids::uuid[])
+        ids_param = bindparam("ids", ids, type_=ARRAY(UUID(as_uuid=True)))
+        result = await self.db.scalars(select(SpecificationORM).where(SpecificationORM.id == any_(ids_param)))
+        return list(result)
+
+    async def get_by_name(self, name: str) -> Optional[SpecificationORM]:
+        return await self.db.scalar(select(SpecificationORM).where(SpecificationORM.name == name).limit(1))
+
+    async def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        skip: int = 0,
+        characteristic_id: Optional[uuid.UUID] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Page:
+        """Page of `SpecificationORM` instances, or of `Row`s holding just the `fields` columns."""
+        if fields is None:
+            stmt = select(SpecificationORM)
+        else:
+            stmt = select(*(getattr(SpecificationORM, name) for name in fields))
+        if characteristic_id is not None:
+            # characteristic_ids @> ARRAY[:id], served by the GIN index
+            stmt = stmt.where(SpecificationORM.characteristic_ids.contains([characteristic_id]))
+        return await keyset_paginate_async(self.db, stmt, SpecificationORM, limit, after=after, skip=skip)
+
+    async def delete(self, spec_orm: SpecificationORM):
+        await self.db.delete(spec_orm)
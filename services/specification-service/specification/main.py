@@ -7,25 +7,41 @@ Provides CRUD operations for specifications with event consumption and publishin
 import asyncio
 import uuid
 from contextlib import asynccontextmanager
-from typing import List
+from typing import List, Optional
 
 import httpx
+from common.database.engine import listen_dsn
 from common.database.outbox import OutboxListener
+from common.database.pagination import NEXT_CURSOR_HEADER
+from common.deadline import DeadlineMiddleware
 from common.exceptions import AppException
 from common.logging import setup_logging
 from common.messaging import RabbitMQPublisher
-from common.schemas import ErrorDetail, ErrorResponse
-from common.security import RoleChecker, get_current_user, security
+from common.metrics import metrics
+from common.schemas import (
+    BatchGetRequest,
+    BatchGetResponse,
+    ChangesResponse,
+    ErrorDetail,
+    ErrorResponse,
+)
+from common.security import (
+    INTERNAL_IDENTITY_HEADER,
+    RoleChecker,
+    get_current_user,
+    security,
+)
+from common.serialization import JSONRowsResponse
 from common.tracing import instrument_fastapi, setup_tracing
-from fastapi import Depends, FastAPI, Query, status
+from fastapi import Depends, FastAPI, Query, Request, status
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .application.consumers import CharacteristicConsumer
 from .application.schemas import SpecificationCreate, SpecificationRead, SpecificationUpdate
 from .application.service import SpecificationService
 from .config import settings
-from .infrastructure.database import SessionLocal, get_db
+from .infrastructure.database import SessionLocal, get_db, get_read_db
 from .infrastructure.models import OutboxORM
 
 # Setup logging first
@@ -70,11 +86,8 @@ async def lifespan(app: FastAPI):
     publisher = RabbitMQPublisher(settings.RABBITMQ_URL)
 
     # Initialize Outbox Listener
-    dsn = (
-        settings.DATABASE_URL.replace("postgresql://", "postgres://")
-        if settings.DATABASE_URL
-        else None
-    )
+    # Dedicated LISTEN connection (direct to Postgres when DB_LISTEN_URL is set)
+    dsn = listen_dsn(settings.DATABASE_URL, settings.DB_LISTEN_URL) if settings.DATABASE_URL else None
 
     if dsn:
         # 1. Start Outbox Listener
@@ -123,6 +136,9 @@ app = FastAPI(
 # Instrument FastAPI for tracing
 instrument_fastapi(app, excluded_urls="health")
 
+# Enforce the request deadline propagated by the API Gateway
+app.add_middleware(DeadlineMiddleware)
+
 
 # Exception handler
 @app.exception_handler(AppException)
@@ -150,11 +166,18 @@ async def custom_app_exception_handler(request, exc: AppException):
 
 
 # Security
-def get_current_user_with_key(token=Depends(security)):
+def get_current_user_with_key(request: Request, token=Depends(security)):
     public_key = (
         settings.JWT_PUBLIC_KEY.replace("\\n", "\n") if settings.JWT_PUBLIC_KEY else None
     )
-    return get_current_user(token=token, public_key=public_key, algorithm=settings.JWT_ALGORITHM)
+    return get_current_user(
+        token=token,
+        public_key=public_key,
+        algorithm=settings.JWT_ALGORITHM,
+        # Identity already verified by the API Gateway (skips RSA verification)
+        internal_identity=request.headers.get(INTERNAL_IDENTITY_HEADER),
+        identity_secret=settings.INTERNAL_IDENTITY_SECRET,
+    )
 
 
 app.dependency_overrides[get_current_user] = get_current_user_with_key
@@ -169,15 +192,51 @@ async def health_check():
     return {"status": "healthy", "service": settings.SERVICE_NAME}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Expose in-process metrics (database pool checkouts, waits and saturation)."""
+    return metrics.snapshot()
+
+
 @app.post(
     "/api/v1/specifications",
     response_model=SpecificationRead,
     status_code=status.HTTP_201_CREATED,
     dependencies=[Depends(admin_required)],
 )
-def create_specification(spec_in: SpecificationCreate, db: Session = Depends(get_db)):
+async def create_specification(spec_in: SpecificationCreate, db: AsyncSession = Depends(get_db)):
     service = SpecificationService(db)
-    return service.create_specification(spec_in)
+    return await service.create_specification(spec_in)
+
+
+@app.post(
+    "/api/v1/specifications/batch-get",
+    response_model=BatchGetResponse[SpecificationRead],
+    # No auth required for internal service-to-service calls
+)
+async def batch_get_specifications(batch: BatchGetRequest, db: AsyncSession = Depends(get_db)):
+    service = SpecificationService(db)
+    items, missing = await service.batch_get_specifications(batch.ids)
+    return {"items": items, "missing": missing}
+
+
+@app.get(
+    "/api/v1/specifications/changes",
+    response_model=ChangesResponse[SpecificationRead],
+    # No auth required for internal service-to-service calls
+)
+async def list_specification_changes(
+    since: Optional[str] = Query(None, description="next_cursor of the previous page; omit to start from the beginning"),
+    limit: int = Query(1000, ge=1, le=5000),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Changefeed for catching up without replaying every event: ordered upserts
+    (current state) and tombstones. Keep calling with `next_cursor` while
+    `has_more` is true; later calls pick up new changes from there.
+    """
+    service = SpecificationService(db)
+    return await service.list_changes(since=since, limit=limit)
 
 
 @app.get(
@@ -185,9 +244,9 @@ def create_specification(spec_in: SpecificationCreate, db: Session = Depends(get
     response_model=SpecificationRead,
     # No auth required for internal service-to-service calls
 )
-def get_specification(spec_id: uuid.UUID, db: Session = Depends(get_db)):
+async def get_specification(spec_id: uuid.UUID, db: AsyncSession = Depends(get_read_db)):
     service = SpecificationService(db)
-    return service.get_specification(spec_id)
+    return await service.get_specification(spec_id)
 
 
 @app.get(
@@ -195,13 +254,30 @@ def get_specification(spec_id: uuid.UUID, db: Session = Depends(get_db)):
     response_model=List[SpecificationRead],
     # No auth required for internal service-to-service calls
 )
-def list_specifications(
-    skip: int = Query(0, ge=0),
+async def list_specifications(
+    after: Optional[str] = Query(None, description="Cursor from the previous page's X-Next-Cursor header"),
+    skip: int = Query(0, ge=0, description="Offset paging, ignored when `after` is given"),
     limit: int = Query(100, ge=1, le=1000),
-    db: Session = Depends(get_db),
+    characteristic_id: Optional[uuid.UUID] = None,
+    db: AsyncSession = Depends(get_read_db),
 ):
+    """
+    Keyset-paginated listing in creation order. When more rows follow, the
+    cursor of the next page is returned in the `X-Next-Cursor` header.
+    """
     service = SpecificationService(db)
-    return service.list_specifications(skip=skip, limit=limit)
+    # Only the response columns, rendered to JSON without per-row model validation
+    page = await service.list_specifications(
+        limit=limit,
+        after=after,
+        skip=skip,
+        characteristic_id=characteristic_id,
+        fields=SpecificationRead.model_fields,
+    )
+    response = JSONRowsResponse(page.items)
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
 
 
 @app.put(
@@ -209,11 +285,11 @@ def list_specifications(
     response_model=SpecificationRead,
     dependencies=[Depends(admin_required)],
 )
-def update_specification(
-    spec_id: uuid.UUID, spec_in: SpecificationUpdate, db: Session = Depends(get_db)
+async def update_specification(
+    spec_id: uuid.UUID, spec_in: SpecificationUpdate, db: AsyncSession = Depends(get_db)
 ):
     service = SpecificationService(db)
-    return service.update_specification(spec_id, spec_in)
+    return await service.update_specification(spec_id, spec_in)
 
 
 @app.delete(
@@ -221,9 +297,9 @@ def update_specification(
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(admin_required)],
 )
-def delete_specification(spec_id: uuid.UUID, db: Session = Depends(get_db)):
+async def delete_specification(spec_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
     service = SpecificationService(db)
-    service.delete_specification(spec_id)
+    await service.delete_specification(spec_id)
     return None
 
 
@@ -232,9 +308,9 @@ def delete_specification(spec_id: uuid.UUID, db: Session = Depends(get_db)):
     status_code=status.HTTP_204_NO_CONTENT,
     dependencies=[Depends(admin_required)],
 )
-def validate_specifications(spec_ids: List[uuid.UUID], db: Session = Depends(get_db)):
+async def validate_specifications(spec_ids: List[uuid.UUID], db: AsyncSession = Depends(get_db)):
     service = SpecificationService(db)
-    service.validate_specifications(spec_ids)
+    await service.validate_specifications(spec_ids)
     return None
 
 
@@ -10,7 +10,7 @@ from fastapi.testclient import TestClient
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
 
 import specification.main as main_module  # noqa: E402
-from specification.infrastructure.database import get_db  # noqa: E402
+from specification.infrastructure.database import get_db, get_read_db  # noqa: E402
 from specification.main import admin_required, any_user_required, app  # noqa: E402
 
 
@@ -33,6 +33,7 @@ def client(db_session_mock, mock_admin):
         yield db_session_mock
 
     app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_read_db] = _override_get_db
     app.dependency_overrides[admin_required] = lambda: mock_admin
     app.dependency_overrides[any_user_required] = lambda: mock_admin
 
@@ -2,11 +2,14 @@ import os
 import sys
 
 import pytest
+import pytest_asyncio
+from common.database.session import create_async_session_factory
 from common.security import UserContext
 from common.testing.containers import start_postgres
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 # Add src to path
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
@@ -15,7 +18,7 @@ sys.path.insert(0, BASE_DIR)
 import specification.infrastructure.database as db_module  # noqa: E402
 import specification.main as main_module  # noqa: E402
 from specification.config import settings  # noqa: E402
-from specification.infrastructure.database import Base, get_db  # noqa: E402
+from specification.infrastructure.database import Base  # noqa: E402
 from specification.main import admin_required, any_user_required, app  # noqa: E402
 
 
@@ -39,6 +42,9 @@ def configure_db(infra):
     db_module.engine = engine
     db_module.SessionLocal = SessionLocal
     main_module.SessionLocal = SessionLocal
+    # Request handlers use async sessions; NullPool keeps connections off the
+    # event loops of finished tests and TestClient portals
+    db_module.AsyncSessionLocal = create_async_session_factory(infra["pg"].url, poolclass=NullPool)
 
     Base.metadata.create_all(bind=engine)
     yield
@@ -59,12 +65,11 @@ def db_session(infra):
             conn.commit()
 
 
-@pytest.fixture
-def override_get_db(db_session):
-    def _override_get_db():
-        yield db_session
-
-    return _override_get_db
+@pytest_asyncio.fixture
+async def async_db_session(db_session):
+    # Cleanup is left to db_session
+    async with db_module.AsyncSessionLocal() as session:
+        yield session
 
 
 @pytest.fixture
@@ -73,8 +78,8 @@ def mock_admin():
 
 
 @pytest.fixture
-def client(override_get_db, mock_admin):
-    app.dependency_overrides[get_db] = override_get_db
+def client(db_session, mock_admin):
+    # get_db serves committed data, so API calls and db_session see each other's writes
     app.dependency_overrides[admin_required] = lambda: mock_admin
     app.dependency_overrides[any_user_required] = lambda: mock_admin
     with TestClient(app) as test_client:
@@ -0,0 +1,62 @@
+"""
+Round-trip regression tests: each write endpoint commits the entity and its
+outbox row once, without refresh SELECTs.
+"""
+
+import uuid
+
+import specification.infrastructure.database as db_module
+from common.testing.queries import count_queries
+from specification.infrastructure.models import CachedCharacteristicORM
+
+
+def _request_queries():
+    return count_queries(db_module.AsyncSessionLocal.kw["bind"])
+
+
+def _cached_characteristic(db_session) -> str:
+    char_id = uuid.uuid4()
+    db_session.add(CachedCharacteristicORM(id=char_id, name="Counted Char"))
+    db_session.commit()
+    return str(char_id)
+
+
+def _create(client, name: str, char_id: str) -> str:
+    response = client.post("/api/v1/specifications", json={"name": name, "characteristic_ids": [char_id]})
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_create_queries(client, db_session):
+    char_id = _cached_characteristic(db_session)
+
+    with _request_queries() as queries:
+        _create(client, "Counted Create", char_id)
+
+    # Name check and characteristic cache lookup, then specification and outbox row
+    assert queries.counts == {"SELECT": 2, "INSERT": 2, "COMMIT": 1}
+
+
+def test_update_queries(client, db_session):
+    char_id = _cached_characteristic(db_session)
+    spec_id = _create(client, "Counted Update", char_id)
+
+    with _request_queries() as queries:
+        response = client.put(
+            f"/api/v1/specifications/{spec_id}", json={"name": "Counted Rename", "characteristic_ids": [char_id]}
+        )
+    assert response.status_code == 200
+
+    # Load, name check, cache lookup
+    assert queries.counts == {"SELECT": 3, "UPDATE": 1, "INSERT": 1, "COMMIT": 1}
+
+
+def test_delete_queries(client, db_session):
+    char_id = _cached_characteristic(db_session)
+    spec_id = _create(client, "Counted Delete", char_id)
+
+    with _request_queries() as queries:
+        response = client.delete(f"/api/v1/specifications/{spec_id}")
+    assert response.status_code == 204
+
+    assert queries.counts == {"SELECT": 1, "DELETE": 1, "INSERT": 1, "COMMIT": 1}
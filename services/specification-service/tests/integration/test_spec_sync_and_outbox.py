@@ -40,17 +40,17 @@ async def test_characteristic_sync_consumer(db_session):
     assert cached is None
 
 @pytest.mark.asyncio
-async def test_specification_outbox_flow(db_session):
+async def test_specification_outbox_flow(db_session, async_db_session):
     """Tests that creating a spec writes to the outbox."""
     # Setup cache
     char_id = uuid.uuid4()
     db_session.add(CachedCharacteristicORM(id=char_id, name="Test Char"))
     db_session.commit()
 
-    service = SpecificationService(db_session)
+    service = SpecificationService(async_db_session)
     spec_in = SpecificationCreate(name="Outbox Spec", characteristic_ids=[char_id])
 
-    spec = service.create_specification(spec_in)
+    spec = await service.create_specification(spec_in)
 
     # Verify outbox
     outbox_entry = db_session.query(OutboxORM).first()
@@ -1,5 +1,5 @@
 import uuid
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from common.exceptions import AppException
@@ -9,47 +9,49 @@ from specification.application.service import SpecificationService
 
 def _db_with_cached_ids(existing_ids: list[uuid.UUID]) -> MagicMock:
     """
-    Builds a MagicMock Session whose query(CachedCharacteristicORM.id).filter(...).all()
-    returns rows with .id for the provided IDs.
+    Builds a MagicMock AsyncSession whose scalars(select(CachedCharacteristicORM.id)...)
+    returns the provided IDs.
     """
     db = MagicMock()
-    query = db.query.return_value
-    filt = query.filter.return_value
-    filt.all.return_value = [MagicMock(id=i) for i in existing_ids]
+    db.scalars = AsyncMock(return_value=list(existing_ids))
+    db.flush = AsyncMock()
+    db.commit = AsyncMock()
+    db.rollback = AsyncMock()
     return db
 
 
-def test_create_specification_no_characteristics():
+@pytest.mark.asyncio
+async def test_create_specification_no_characteristics():
     db = _db_with_cached_ids([])
     service = SpecificationService(db)
     service.repository = MagicMock()
-    service.repository.get_by_name.return_value = None
+    service.repository.get_by_name = AsyncMock(return_value=None)
 
     spec_in = SpecificationCreate(name="Test Spec", characteristic_ids=[])
     with pytest.raises(AppException) as exc:
-        service.create_specification(spec_in)
+        await service.create_specification(spec_in)
     assert exc.value.code == "VALIDATION_ERROR"
 
 
-def test_create_specification_missing_characteristics():
+@pytest.mark.asyncio
+async def test_create_specification_missing_characteristics():
     missing_id = uuid.uuid4()
     db = _db_with_cached_ids([])
     service = SpecificationService(db)
     service.repository = MagicMock()
-    service.repository.get_by_name.return_value = None
+    service.repository.get_by_name = AsyncMock(return_value=None)
 
     spec_in = SpecificationCreate(name="Test Spec", characteristic_ids=[missing_id])
     with pytest.raises(AppException) as exc:
-        service.create_specification(spec_in)
+        await service.create_specification(spec_in)
     assert exc.value.code == "VALIDATION_ERROR"
     assert str(missing_id) in exc.value.message
 
 
-def test_create_specification_success():
+@pytest.mark.asyncio
+async def test_create_specification_success():
     char_id = uuid.uuid4()
     db = _db_with_cached_ids([char_id])
-    db.flush = MagicMock()
-    db.commit = MagicMock()
     db.add = MagicMock()
 
     def set_orm_defaults(orm_obj):
@@ -60,11 +62,26 @@ def test_create_specification_success():
 
     service = SpecificationService(db)
     service.repository = MagicMock()
-    service.repository.get_by_name.return_value = None
+    service.repository.get_by_name = AsyncMock(return_value=None)
     service.repository.create = MagicMock(side_effect=set_orm_defaults)
 
     spec_in = SpecificationCreate(name="Valid Spec", characteristic_ids=[char_id])
-    spec = service.create_specification(spec_in)
+    spec = await service.create_specification(spec_in)
     assert spec.name == "Valid Spec"
     assert spec.characteristic_ids == [char_id]
-    db.commit.assert_called()
+    # Entity and outbox row in one transaction
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_validate_specifications_reports_every_missing_id():
+    known_id, missing_a, missing_b = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    service = SpecificationService(MagicMock())
+    service.repository = MagicMock()
+    service.repository.get_many = AsyncMock(return_value=[MagicMock(id=known_id)])
+
+    with pytest.raises(AppException) as exc:
+        await service.validate_specifications([known_id, missing_a, missing_b])
+    assert exc.value.code == "NOT_FOUND"
+    assert exc.value.details == {"missing_ids": [str(missing_a), str(missing_b)]}
+    service.repository.get_many.assert_awaited_once()
@@ -2,6 +2,7 @@ import logging
 from typing import Any, Dict, List
 
 import httpx
+from common.deadline import propagate_deadline
 
 from ..config import settings
 from ..infrastructure.elasticsearch import ElasticsearchClient
@@ -25,7 +26,7 @@ class StoreService:
         """
         Data Composition: Fetch full details from Specification, Pricing, and Characteristic services.
         """
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(event_hooks={"request": [propagate_deadline]}) as client:
             # 1. Fetch Offering from Offering Service
             offering_resp = await client.get(f"{settings.OFFERING_SERVICE_URL}/api/v1/offerings/{offering_id}")
             if offering_resp.status_code != 200:
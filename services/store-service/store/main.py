@@ -7,6 +7,7 @@ Provides search and query operations over denormalized product data in MongoDB/E
 from contextlib import asynccontextmanager
 from typing import List, Optional
 
+from common.deadline import DeadlineMiddleware
 from common.exceptions import AppException
 from common.logging import setup_logging
 from common.schemas import ErrorDetail, ErrorResponse
@@ -72,6 +73,9 @@ app = FastAPI(
 # Instrument FastAPI for tracing
 instrument_fastapi(app, excluded_urls="health")
 
+# Enforce the request deadline propagated by the API Gateway
+app.add_middleware(DeadlineMiddleware)
+
 
 @app.exception_handler(AppException)
 async def custom_app_exception_handler(request, exc: AppException):